@@ -0,0 +1,66 @@
+"""Bulk create against one create per membership.
+
+    python -m benchmarks.bench_bulk --batch 100
+
+Times one POST /bulk worth of work (one transaction, a single conflict
+check and one multi-row INSERT) against the same memberships created one
+request at a time, each in its own session and transaction as separate
+POSTs would be. Statements per batch are counted too.
+"""
+import itertools
+
+from sqlalchemy import event
+
+from benchmarks.common import argument_parser, bench_database, fill_gym, measure, report, run, synthetic_input
+from features.membership.application.dtos.membership_dtos import MembershipBulkCreateDTO, MembershipCreateDTO
+from features.membership.application.membership_context import TenantContext
+from features.membership.presentation.membership_container import MembershipContextFactory, membership_container
+
+
+async def main() -> None:
+    parser = argument_parser(__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=100, help="memberships per batch")
+    parser.set_defaults(rows=1_000, repeat=50)
+    arguments = parser.parse_args()
+
+    async with bench_database() as (engine, session_factory, gym_id):
+        await fill_gym(session_factory, gym_id, arguments.rows)
+        service = membership_container.membership_service()
+        factory = MembershipContextFactory(None, None, None)
+        tenant = TenantContext(user_id="11111111-1111-1111-1111-111111111111", gym_id=gym_id)
+        # Every batch needs names nobody has used yet
+        numbers = itertools.count(arguments.rows)
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(1))
+
+        def next_batch():
+            items = []
+            for number in itertools.islice(numbers, arguments.batch):
+                source = synthetic_input(gym_id, number)
+                items.append(MembershipCreateDTO(
+                    name=source.name, description=source.description, price=source.price, duration_days=source.duration
+                ))
+            return items
+
+        async def bulk():
+            async with session_factory() as session:
+                result = await service.bulk_create_memberships(
+                    factory.create(session, tenant), MembershipBulkCreateDTO(items=next_batch())
+                )
+            assert result.failed == 0
+
+        async def one_at_a_time():
+            for item in next_batch():
+                async with session_factory() as session:
+                    await service.create_membership(factory.create(session, tenant), item)
+
+        print(f"{engine.dialect.name}, batches of {arguments.batch} into a gym of {arguments.rows}")
+        for label, case in (("bulk create", bulk), ("one create per membership", one_at_a_time)):
+            statements.clear()
+            await case()
+            per_batch = len(statements)
+            report(f"{label} ({per_batch} statements)", await measure(case, arguments.repeat, warmup=2))
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,126 @@
+"""p50/p99 of 100-item list pages: row serialization against the entity/DTO path.
+
+    python -m benchmarks.bench_list_pages --rows 10000
+
+Three ways to answer GET /api/memberships/?size=100:
+
+- entities: ORM models -> to_domain() -> validated MembershipResponseDTO per
+  item -> response_model validation and serialization, as FastAPI does with
+  a DTO returned from the route (the path before rows were serialized
+  directly);
+- rows: the current path, result rows -> model_construct -> the DTO's
+  compiled pydantic-core serializer (what dto_response sends);
+- snapshot: the gym's prebuilt page bytes, when snapshots are enabled.
+
+Each is timed with the query ("query + serialize") and from the query's
+results already fetched ("serialize only": ORM models or rows).
+"""
+import json
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from benchmarks.common import argument_parser, bench_database, fill_gym, measure, report, run
+from features.membership.application.dtos.membership_dtos import MembershipListResponseDTO, MembershipResponseDTO
+from features.membership.application.membership_context import TenantContext
+from features.membership.application.use_cases.get_memberships import GetMembershipsUseCase
+from features.membership.infrastructure.entities.membership_model import MembershipModel
+from features.membership.infrastructure.snapshots.membership_snapshots import GymCatalogSnapshot
+from features.membership.presentation.encoding.response_encoders import JsonEncoder
+from features.membership.presentation.membership_container import MembershipContextFactory, membership_container
+
+PAGE_SIZE = 100
+# How FastAPI checks and dumps a returned model against response_model
+RESPONSE_ADAPTER = TypeAdapter(MembershipListResponseDTO)
+ENCODER = JsonEncoder()
+
+
+def entity_body(memberships, total: int, page: int) -> bytes:
+    dto = MembershipListResponseDTO(
+        items=[
+            MembershipResponseDTO(
+                id=membership.id.value,
+                name=membership.name,
+                description=membership.description,
+                price=membership.price.to_float(),
+                duration_days=membership.duration.to_int(),
+                status=membership.status,
+                type=membership.type,
+                created_at=membership.created_at,
+                updated_at=membership.updated_at,
+                gym_id=membership.gym_id,
+                version=membership.version
+            )
+            for membership in memberships
+        ],
+        total=total,
+        page=page,
+        size=PAGE_SIZE,
+        total_pages=(total + PAGE_SIZE - 1) // PAGE_SIZE
+    )
+    validated = RESPONSE_ADAPTER.validate_python(dto, from_attributes=True)
+    return json.dumps(RESPONSE_ADAPTER.dump_python(validated, mode="json")).encode()
+
+
+def row_body(rows, total: int, page: int) -> bytes:
+    return ENCODER.encode_model(MembershipListResponseDTO.model_construct(
+        items=GetMembershipsUseCase._to_response_dtos(rows),
+        total=total,
+        page=page,
+        size=PAGE_SIZE,
+        total_pages=(total + PAGE_SIZE - 1) // PAGE_SIZE
+    ))
+
+
+async def main() -> None:
+    arguments = argument_parser(__doc__.splitlines()[0]).parse_args()
+    async with bench_database() as (engine, session_factory, gym_id):
+        await fill_gym(session_factory, gym_id, arguments.rows)
+        service = membership_container.membership_service()
+        tenant = TenantContext(user_id="11111111-1111-1111-1111-111111111111", gym_id=gym_id)
+        print(f"{engine.dialect.name}, {arguments.rows} memberships, pages of {PAGE_SIZE}")
+
+        async with session_factory() as session:
+            context = MembershipContextFactory(None, None, None).create(session, tenant)
+            aggregate = context.aggregate
+            snapshot = GymCatalogSnapshot.build(await service.get_membership_catalog(context))
+
+            async def entities():
+                memberships, total = await aggregate.list_memberships(gym_id, 1, PAGE_SIZE)
+                return entity_body(memberships, total, 1)
+
+            async def rows():
+                page_rows, total = await aggregate.list_membership_rows(gym_id, 1, PAGE_SIZE)
+                return row_body(page_rows, total, 1)
+
+            async def from_snapshot():
+                return snapshot.page(1, PAGE_SIZE)
+
+            models = (await session.execute(
+                select(MembershipModel)
+                .where(MembershipModel.gym_id == gym_id)
+                .order_by(MembershipModel.created_at.desc(), MembershipModel.id.desc())
+                .limit(PAGE_SIZE)
+            )).scalars().all()
+            page_rows, total = await aggregate.list_membership_rows(gym_id, 1, PAGE_SIZE)
+            # Same document either way
+            assert json.loads(entity_body([model.to_domain() for model in models], total, 1)) \
+                == json.loads(row_body(page_rows, total, 1))
+
+            async def serialize_entities():
+                return entity_body([model.to_domain() for model in models], total, 1)
+
+            async def serialize_rows():
+                return row_body(page_rows, total, 1)
+
+            print("\nquery + serialize")
+            report("  entities -> validated DTOs -> response_model", await measure(entities, arguments.repeat))
+            report("  rows -> compiled serializer", await measure(rows, arguments.repeat))
+            report("  snapshot page", await measure(from_snapshot, arguments.repeat))
+            print("\nserialize only")
+            report("  models -> entities -> validated DTOs -> ...", await measure(serialize_entities, arguments.repeat))
+            report("  rows -> compiled serializer", await measure(serialize_rows, arguments.repeat))
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,79 @@
+"""Per-request cost of the rate limit middleware, without the database or the network.
+
+    python -m benchmarks.bench_rate_limit --repeat 50000
+
+- bare app: a no-op ASGI app called directly;
+- in-process buckets: the same app behind RateLimitMiddleware with the
+  memory backend and a principal already verified (the token cache hit
+  every request after the first one gets);
+- Lua script twin: the redis backend against FakeRedisTokenBuckets, i.e.
+  the script's bookkeeping without the Redis round trip, which dominates
+  in production.
+
+Limits are high enough that every request is let through, so the timings
+are those of the common path.
+"""
+from benchmarks.common import argument_parser, measure, report, run
+from dev_utils.dev_security import Scopes, User
+from features.membership.infrastructure.rate_limiting.memory_rate_limit_backend import TokenBucketRateLimitBackend
+from features.membership.infrastructure.rate_limiting.rate_limit_backend import RateLimit, RateLimitBackend
+from features.membership.infrastructure.rate_limiting.rate_limiter import RateLimiter
+from features.membership.infrastructure.rate_limiting.redis_rate_limit_backend import (
+    FakeRedisTokenBuckets,
+    RedisRateLimitBackend
+)
+from features.membership.presentation.rate_limiting.rate_limit_middleware import RateLimitMiddleware
+
+SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "path": "/api/memberships/",
+    "headers": [(b"host", b"bench"), (b"authorization", b"Bearer bench-token")],
+}
+USER = User(
+    username="bench", email="", full_name="", id="11111111-1111-1111-1111-111111111111",
+    id_gym="a0000000-0000-0000-0000-00000000000a", scopes=[Scopes.GymWorker.value]
+)
+
+
+async def app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message):
+    pass
+
+
+async def resolve(token):
+    return USER
+
+
+def limited_app(backend: RateLimitBackend) -> RateLimitMiddleware:
+    limit = RateLimit(1e9, 1e9)
+    limiter = RateLimiter(backend, {Scopes.GymWorker.value: limit}, limit, gym_limit=limit)
+    return RateLimitMiddleware(app, limiter, resolve)
+
+
+async def main() -> None:
+    parser = argument_parser(__doc__.splitlines()[0], rows=False)
+    parser.set_defaults(repeat=50_000)
+    arguments = parser.parse_args()
+
+    cases = [
+        ("bare app", app),
+        ("in-process buckets", limited_app(TokenBucketRateLimitBackend())),
+        ("Lua script twin (no round trip)", limited_app(RedisRateLimitBackend(FakeRedisTokenBuckets()))),
+    ]
+    for label, asgi_app in cases:
+        async def call():
+            await asgi_app(SCOPE, receive, send)
+
+        report(label, await measure(call, arguments.repeat), unit="us")
+
+
+if __name__ == "__main__":
+    run(main)
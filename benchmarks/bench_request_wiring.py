@@ -0,0 +1,88 @@
+"""Per-request wiring cost: shared singletons plus a context against building the graph per request.
+
+    python -m benchmarks.bench_request_wiring --repeat 20000
+
+What a route pays before running its use case, without the database:
+
+- context only: the per-request part, MembershipContextFactory.create
+  (unit of work, repository chain, aggregate);
+- current routes: get_membership_service() from the container's singletons
+  plus membership_context() (cached TenantContext, then the above);
+- graph per request: every use case and the service constructed for each
+  request, as the routes did before the container, plus the context.
+"""
+from benchmarks.common import argument_parser, bench_database, measure, report, run
+from dev_utils.dev_security import User
+from features.membership.application.membership_context import TenantContext
+from features.membership.application.service import MembershipService
+from features.membership.application.use_cases.bulk_create_memberships import BulkCreateMembershipsUseCase
+from features.membership.application.use_cases.bulk_delete_memberships import BulkDeleteMembershipsUseCase
+from features.membership.application.use_cases.bulk_update_memberships import BulkUpdateMembershipsUseCase
+from features.membership.application.use_cases.create_membership import CreateMembershipUseCase
+from features.membership.application.use_cases.delete_membership import DeleteMembershipUseCase
+from features.membership.application.use_cases.export_memberships import ExportMembershipsUseCase
+from features.membership.application.use_cases.get_daily_membership import GetDailyMembershipUseCase
+from features.membership.application.use_cases.get_membership import GetMembershipUseCase
+from features.membership.application.use_cases.get_membership_catalog import GetMembershipCatalogUseCase
+from features.membership.application.use_cases.get_membership_stamps import (
+    GetDailyMembershipStampUseCase,
+    GetMembershipCatalogStampUseCase,
+    GetMembershipStampUseCase
+)
+from features.membership.application.use_cases.get_memberships import GetMembershipsUseCase
+from features.membership.application.use_cases.import_memberships import ImportMembershipsUseCase
+from features.membership.application.use_cases.update_membership import UpdateMembershipUseCase
+from features.membership.presentation.membership_container import membership_container
+from features.membership.presentation.routes.membership_routes import get_membership_service, membership_context
+
+
+def service_per_request() -> MembershipService:
+    update_membership = UpdateMembershipUseCase()
+    return MembershipService(
+        create_membership=CreateMembershipUseCase(),
+        get_membership=GetMembershipUseCase(),
+        get_daily_membership=GetDailyMembershipUseCase(),
+        list_memberships=GetMembershipsUseCase(),
+        get_membership_stamp=GetMembershipStampUseCase(),
+        get_daily_membership_stamp=GetDailyMembershipStampUseCase(),
+        get_membership_catalog_stamp=GetMembershipCatalogStampUseCase(),
+        get_membership_catalog=GetMembershipCatalogUseCase(),
+        export_memberships=ExportMembershipsUseCase(),
+        update_membership=update_membership,
+        delete_membership=DeleteMembershipUseCase(),
+        bulk_create_memberships=BulkCreateMembershipsUseCase(),
+        bulk_update_memberships=BulkUpdateMembershipsUseCase(update_membership=update_membership),
+        bulk_delete_memberships=BulkDeleteMembershipsUseCase(),
+        import_memberships=ImportMembershipsUseCase()
+    )
+
+
+async def main() -> None:
+    parser = argument_parser(__doc__.splitlines()[0], rows=False)
+    parser.set_defaults(repeat=20_000)
+    arguments = parser.parse_args()
+    async with bench_database() as (engine, session_factory, gym_id):
+        user = User(username="bench", email="", full_name="", id="11111111-1111-1111-1111-111111111111", id_gym=str(gym_id))
+        factory = membership_container.membership_context_factory()
+        # The session comes from its own dependency; only wiring is timed
+        async with session_factory() as session:
+
+            async def context_only():
+                return factory.create(session, TenantContext(user_id=user.id, gym_id=gym_id))
+
+            async def current_routes():
+                return get_membership_service(), membership_context(session, user)
+
+            async def graph_per_request():
+                return service_per_request(), factory.create(session, TenantContext(user_id=user.id, gym_id=gym_id))
+
+            print(f"stores: cache={factory.membership_cache is not None}, "
+                  f"snapshots={factory.membership_snapshots is not None}, "
+                  f"shared catalog={factory.shared_catalog_store is not None}")
+            report("context only", await measure(context_only, arguments.repeat), unit="us")
+            report("current routes (singletons + context)", await measure(current_routes, arguments.repeat), unit="us")
+            report("graph per request", await measure(graph_per_request, arguments.repeat), unit="us")
+
+
+if __name__ == "__main__":
+    run(main)
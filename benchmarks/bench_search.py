@@ -0,0 +1,55 @@
+"""Membership search: the folded, indexed filter against the old ILIKE on name/description.
+
+    python -m benchmarks.bench_search --rows 200000
+
+Both cases fetch the first page of 20 plus the total count, as the list
+route does. On PostgreSQL the indexed search is served by the pg_trgm GIN
+indexes and ranked; on SQLite both cases scan the gym, so only the
+PostgreSQL numbers say anything about the indexes.
+"""
+from sqlalchemy import func, or_, select
+
+from benchmarks.common import argument_parser, bench_database, fill_gym, measure, report, run
+from features.membership.infrastructure.entities.membership_model import MembershipModel
+from features.membership.infrastructure.repositories.membership_repository_postgres import MembershipRepositoryPostgres
+
+PAGE_SIZE = 20
+# A common word, an accent-insensitive match, a rare substring and a miss
+TERMS = ["yoga", "natacion", "0012345", "kitesurf"]
+
+
+async def ilike_page(session, gym_id, term: str):
+    # The query the repository ran before the folded column existed
+    matches = or_(MembershipModel.name.ilike(f"%{term}%"), MembershipModel.description.ilike(f"%{term}%"))
+    total = await session.scalar(
+        select(func.count()).select_from(MembershipModel).where(MembershipModel.gym_id == gym_id, matches)
+    )
+    result = await session.execute(
+        select(MembershipModel)
+        .where(MembershipModel.gym_id == gym_id, matches)
+        .order_by(MembershipModel.created_at.desc(), MembershipModel.id.desc())
+        .limit(PAGE_SIZE)
+    )
+    return result.scalars().all(), total
+
+
+async def main() -> None:
+    arguments = argument_parser(__doc__.splitlines()[0]).parse_args()
+    async with bench_database() as (engine, session_factory, gym_id):
+        await fill_gym(session_factory, gym_id, arguments.rows)
+        print(f"{engine.dialect.name}, {arguments.rows} memberships, page size {PAGE_SIZE}")
+        async with session_factory() as session:
+            repository = MembershipRepositoryPostgres(session)
+            for term in TERMS:
+                _, total = await repository.get_rows_by_gym_id(gym_id, 1, PAGE_SIZE, search=term)
+                _, ilike_total = await ilike_page(session, gym_id, term)
+                print(f"\n{term!r}: {total} matches (ILIKE: {ilike_total})")
+                report(
+                    "  folded search (indexed on PostgreSQL)",
+                    await measure(lambda: repository.get_rows_by_gym_id(gym_id, 1, PAGE_SIZE, search=term), arguments.repeat)
+                )
+                report("  ILIKE on name/description", await measure(lambda: ilike_page(session, gym_id, term), arguments.repeat))
+
+
+if __name__ == "__main__":
+    run(main)
@@ -0,0 +1,124 @@
+"""Shared setup for the benchmarks: a throwaway gym in a real database.
+
+By default each run gets a temporary SQLite file. Set BENCH_DATABASE_URL
+(e.g. postgresql+asyncpg://...) to measure against PostgreSQL; the tables
+are created if missing and only the benchmark's own gym is written and
+removed afterwards.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, List, Tuple
+
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from dev_utils.dev_database import Base
+from dev_utils.dev_gym_model import GymModel
+from features.membership.domain.enums.membership_enums import MembershipType
+from features.membership.domain.membership_aggregate import MembershipAggregate
+from features.membership.domain.object_values.create_membership_input import CreateMembershipInput
+from features.membership.infrastructure.entities.membership_model import MembershipModel
+from features.membership.infrastructure.repositories.membership_repository_postgres import MembershipRepositoryPostgres
+
+# Mixed-case, accented words so searches exercise the folding
+PLAN_WORDS = ["Natación", "Yoga", "Pilates", "Crossfit", "Spinning", "Musculación", "Boxeo", "Zumba"]
+TIMES = ["mañana", "tarde", "noche", "fin de semana"]
+
+
+def argument_parser(description: str, rows: bool = True) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    if rows:
+        parser.add_argument("--rows", type=int, default=10_000, help="memberships in the benchmark gym")
+    parser.add_argument("--repeat", type=int, default=200, help="measured iterations per case")
+    return parser
+
+
+@asynccontextmanager
+async def bench_database() -> AsyncIterator[Tuple[AsyncEngine, async_sessionmaker, uuid.UUID]]:
+    """(engine, session factory, id of an empty gym created for this run)"""
+    url = os.getenv("BENCH_DATABASE_URL")
+    directory = None
+    if not url:
+        directory = tempfile.TemporaryDirectory()
+        url = f"sqlite+aiosqlite:///{os.path.join(directory.name, 'bench.db')}"
+    engine = create_async_engine(url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    gym_id = uuid.uuid4()
+    try:
+        async with engine.begin() as connection:
+            if connection.dialect.name == "postgresql":
+                await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await connection.run_sync(Base.metadata.create_all)
+        async with session_factory() as session:
+            session.add(GymModel(id=gym_id, name="Benchmark gym"))
+            await session.commit()
+        yield engine, session_factory, gym_id
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(delete(MembershipModel).where(MembershipModel.gym_id == gym_id))
+            await connection.execute(delete(GymModel).where(GymModel.id == gym_id))
+        await engine.dispose()
+        if directory is not None:
+            directory.cleanup()
+
+
+def synthetic_input(gym_id: uuid.UUID, index: int) -> CreateMembershipInput:
+    word = PLAN_WORDS[index % len(PLAN_WORDS)]
+    when = TIMES[index // len(PLAN_WORDS) % len(TIMES)]
+    return CreateMembershipInput(
+        name=f"{word} {when} {index:07d}",
+        description=f"Plan de {word.lower()} por la {when}, sesión número {index}",
+        price=10 + index % 90,
+        duration=30,
+        type=MembershipType.REGULAR,
+        gym_id=gym_id
+    )
+
+
+async def fill_gym(session_factory: async_sessionmaker, gym_id: uuid.UUID, rows: int, chunk: int = 2000) -> None:
+    """Insert rows synthetic memberships, through the import path (COPY on asyncpg)"""
+    aggregate = MembershipAggregate(None)
+    for start in range(0, rows, chunk):
+        async with session_factory() as session:
+            memberships = [
+                aggregate.new_membership(synthetic_input(gym_id, index))
+                for index in range(start, min(start + chunk, rows))
+            ]
+            await MembershipRepositoryPostgres(session).import_many(memberships)
+            await session.commit()
+    async with session_factory() as session:
+        if session.bind.dialect.name == "postgresql":
+            await session.execute(text("ANALYZE memberships"))
+            await session.commit()
+
+
+async def measure(case: Callable[[], Awaitable[object]], repeat: int, warmup: int = 5) -> List[float]:
+    """Wall-clock seconds of each of repeat calls, after a few unmeasured ones"""
+    for _ in range(warmup):
+        await case()
+    samples = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await case()
+        samples.append(time.perf_counter() - started_at)
+    return samples
+
+
+def report(label: str, samples: List[float], unit: str = "ms") -> None:
+    scale = {"ms": 1e3, "us": 1e6}[unit]
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<48} p50 {statistics.median(ordered) * scale:9.3f} {unit}"
+        f"   p99 {p99 * scale:9.3f} {unit}   n={len(ordered)}"
+    )
+
+
+def run(main: Callable[[], Awaitable[None]]) -> None:
+    asyncio.run(main())
@@ -0,0 +1,201 @@
+"""Admission control in front of database session acquisition"""
+import asyncio
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Sequence
+
+# Upper bounds (seconds) of the queue wait histogram; the last bucket is unbounded
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class AdmissionLane(IntEnum):
+    """Lower values are served first"""
+    PRIORITY = 0
+    DEFAULT = 1
+
+
+class AdmissionRejected(Exception):
+    """The request was shed: its lane's queue was full or it waited too long"""
+
+    def __init__(self, lane: AdmissionLane, reason: str):
+        self.lane = AdmissionLane(lane)
+        self.reason = reason
+        super().__init__(f"{self.lane.name.lower()} lane: {reason}")
+
+
+class AdaptiveConcurrencyLimit:
+    """Concurrency limit steered by statement latency.
+
+    Compares a short and a long moving average of statement latency. When
+    the short one goes over latency_tolerance times the long one (Postgres
+    is slowing down) or the pool times out, the limit is cut by
+    backoff_ratio, at most once per limit's worth of samples. While latency
+    is not rising and the limit is in use, it grows back by about one per
+    limit's worth of samples.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.9,
+        short_smoothing: float = 0.1,
+        long_smoothing: float = 0.01
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.short_smoothing = short_smoothing
+        self.long_smoothing = long_smoothing
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self.value = int(self._limit)
+        self.short_latency = 0.0
+        self.long_latency = 0.0
+        self._samples_since_backoff = 0
+
+    def observe(self, latency: float, in_flight: int) -> None:
+        if not self.long_latency:
+            self.short_latency = self.long_latency = latency
+            return
+        self.short_latency += (latency - self.short_latency) * self.short_smoothing
+        self.long_latency += (latency - self.long_latency) * self.long_smoothing
+        self._samples_since_backoff += 1
+        if self.short_latency > self.long_latency * self.latency_tolerance:
+            self.back_off()
+        elif self.short_latency <= self.long_latency and in_flight >= self.value:
+            self._set(self._limit + 1 / self._limit)
+
+    def back_off(self) -> None:
+        if self._samples_since_backoff < self.value:
+            return
+        self._samples_since_backoff = 0
+        self._set(self._limit * self.backoff_ratio)
+
+    def _set(self, limit: float) -> None:
+        self._limit = min(max(limit, self.min_limit), self.max_limit)
+        self.value = int(self._limit)
+
+
+@dataclass
+class LaneStats:
+    admitted: int = 0
+    queued: int = 0
+    rejected_queue_full: int = 0
+    rejected_timeout: int = 0
+    wait_seconds_sum: float = 0.0
+    wait_seconds_max: float = 0.0
+    # Admissions by WAIT_BUCKETS bucket, non-cumulative; requests admitted without queueing count in the first
+    wait_buckets: List[int] = field(default_factory=lambda: [0] * (len(WAIT_BUCKETS) + 1))
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_seconds_sum += seconds
+        if seconds > self.wait_seconds_max:
+            self.wait_seconds_max = seconds
+        self.wait_buckets[bisect_left(WAIT_BUCKETS, seconds)] += 1
+
+
+class AdmissionController:
+    """Bounds the requests holding a database session to an adaptive limit.
+
+    Requests over the limit wait in their lane's queue; the priority lane is
+    always served first. A request is rejected at once when its lane's queue
+    is full, and after max_wait_seconds in the queue, so under load clients
+    get a fast 503 instead of waiting for the pool timeout. Must be used
+    from a single event loop.
+    """
+
+    def __init__(
+        self,
+        limit: AdaptiveConcurrencyLimit,
+        max_queue: Sequence[int],
+        max_wait_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.limit = limit
+        self.max_queue = tuple(max_queue)
+        self.max_wait_seconds = max_wait_seconds
+        self.clock = clock
+        self.in_flight = 0
+        self._queues: List[Deque[asyncio.Future]] = [deque() for _ in AdmissionLane]
+        self.stats = [LaneStats() for _ in AdmissionLane]
+
+    async def acquire(self, lane: AdmissionLane) -> None:
+        """Waits for a slot; raises AdmissionRejected when the request is shed"""
+        stats = self.stats[lane]
+        if self.in_flight < self.limit.value and not any(self._queues):
+            self.in_flight += 1
+            stats.admitted += 1
+            stats.wait_buckets[0] += 1
+            return
+
+        queue = self._queues[lane]
+        if len(queue) >= self.max_queue[lane]:
+            stats.rejected_queue_full += 1
+            raise AdmissionRejected(lane, "queue is full")
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        stats.queued += 1
+        started_at = self.clock()
+        try:
+            await asyncio.wait_for(waiter, self.max_wait_seconds)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as we gave up: pass the slot on
+                self.release()
+            else:
+                waiter.cancel()
+                try:
+                    queue.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.TimeoutError):
+                stats.rejected_timeout += 1
+                raise AdmissionRejected(lane, "timed out in the queue") from None
+            raise
+        stats.admitted += 1
+        stats.record_wait(self.clock() - started_at)
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._grant()
+
+    def observe(self, latency_seconds: float) -> None:
+        """Feeds a statement's latency to the limit"""
+        self.limit.observe(latency_seconds, self.in_flight)
+        self._grant()
+
+    def overloaded(self) -> None:
+        """The pool timed out despite admission; cut the limit"""
+        self.limit.back_off()
+
+    def _grant(self) -> None:
+        for queue in self._queues:
+            while queue and self.in_flight < self.limit.value:
+                waiter = queue.popleft()
+                # Skip waiters that timed out but have not left the queue yet
+                if not waiter.done():
+                    waiter.set_result(None)
+                    self.in_flight += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit.value,
+            "in_flight": self.in_flight,
+            "short_latency_seconds": self.limit.short_latency,
+            "long_latency_seconds": self.limit.long_latency,
+            # Upper bounds of wait_buckets; None for the unbounded last one
+            "wait_buckets_le": [*WAIT_BUCKETS, None],
+            "lanes": {
+                lane.name.lower(): {
+                    "waiting": len(self._queues[lane]),
+                    **vars(self.stats[lane]),
+                }
+                for lane in AdmissionLane
+            },
+        }
@@ -1,8 +1,16 @@
+import logging
+import os
+import uuid
 from enum import Enum
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+
+from dev_utils.jwt_security import AuthenticationError, JwksKeySet, JwtAuthenticator, VerifiedTokenCache, jwks_url_fetcher
+
+logger = logging.getLogger(__name__)
 
 # Define the scopes from the original implementation
 class Scopes(str, Enum):
@@ -58,7 +66,6 @@ bearer_schema = HTTPBearer()
 
 def fake_decode_token(token):
     # This doesn't provide any security at all
-    print(token, "Hola mundo ")
     user = {
         "username": "worker",
         "email": "worker@example.com",
@@ -71,7 +78,66 @@ def fake_decode_token(token):
     }
     return User(**user)
 
-async def get_current_user(token: str = Depends(bearer_schema)):
+def user_from_claims(claims: Dict[str, Any]) -> User:
+    """The principal of a verified token; the gym comes from the AUTH_GYM_CLAIM claim"""
+    gym_claim = os.getenv("AUTH_GYM_CLAIM", "id_gym")
+    id_gym = claims.get(gym_claim)
+    # Every route is scoped to a gym: a token without one cannot be served
+    try:
+        id_gym = str(uuid.UUID(str(id_gym)))
+    except ValueError:
+        raise AuthenticationError(f"missing or invalid {gym_claim!r} claim") from None
+    scopes = claims.get("scopes")
+    if scopes is None:
+        # OAuth 2 style: a space-separated string
+        scopes = claims.get("scope", "").split()
+    return User(
+        username=claims.get("preferred_username", claims["sub"]),
+        email=claims.get("email", ""),
+        full_name=claims.get("name", ""),
+        scopes=scopes,
+        id_gym=id_gym,
+        id=claims["sub"]
+    )
+
+
+@lru_cache(maxsize=None)
+def get_jwt_authenticator() -> Optional[JwtAuthenticator[User]]:
+    """Verifier configured by AUTH_JWKS_URL; None keeps the development fake"""
+    jwks_url = os.getenv("AUTH_JWKS_URL")
+    if not jwks_url:
+        return None
+    try:
+        keys = JwksKeySet(
+            jwks_url_fetcher(jwks_url),
+            min_refresh_seconds=float(os.getenv("AUTH_JWKS_MIN_REFRESH", "30")),
+            max_age_seconds=float(os.getenv("AUTH_JWKS_MAX_AGE", "3600"))
+        )
+    except ImportError as e:
+        raise RuntimeError("AUTH_JWKS_URL requires the 'PyJWT[crypto]' package") from e
+    return JwtAuthenticator(
+        keys,
+        user_from_claims,
+        algorithms=os.getenv("AUTH_ALGORITHMS", "RS256,ES256").split(","),
+        issuer=os.getenv("AUTH_ISSUER"),
+        audience=os.getenv("AUTH_AUDIENCE"),
+        leeway_seconds=float(os.getenv("AUTH_LEEWAY", "30")),
+        cache=VerifiedTokenCache(max_entries=int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000")))
+    )
+
+
+async def get_current_user(token: HTTPAuthorizationCredentials = Depends(bearer_schema)):
+    authenticator = get_jwt_authenticator()
+    if authenticator is not None:
+        try:
+            return await authenticator.authenticate(token.credentials)
+        except AuthenticationError as e:
+            logger.info("Rejected bearer token: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            ) from e
     user = fake_decode_token(token)
     if not user:
         raise HTTPException(
@@ -81,6 +147,16 @@ async def get_current_user(token: str = Depends(bearer_schema)):
         )
     return user
 
+async def principal_from_token(token: str) -> Optional[User]:
+    """The user a bearer token authenticates, or None when it is rejected; never raises"""
+    authenticator = get_jwt_authenticator()
+    if authenticator is None:
+        return fake_decode_token(token)
+    try:
+        return await authenticator.authenticate(token)
+    except AuthenticationError:
+        return None
+
 async def get_current_active_user(current_user: User = Depends(get_current_user)):
     if current_user.disabled:
         raise HTTPException(status_code=400, detail="Inactive user")
@@ -0,0 +1,201 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import urllib.request
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+P = TypeVar("P")
+
+JwksFetcher = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class AuthenticationError(Exception):
+    """The token was rejected; the reason is for logs, not for the client"""
+
+
+def jwks_url_fetcher(url: str, timeout_seconds: float = 5.0) -> JwksFetcher:
+    """Fetches the issuer's JWKS document over HTTP without blocking the event loop"""
+
+    def fetch() -> Dict[str, Any]:
+        with urllib.request.urlopen(url, timeout=timeout_seconds) as response:
+            return json.load(response)
+
+    async def fetch_async() -> Dict[str, Any]:
+        return await asyncio.to_thread(fetch)
+
+    return fetch_async
+
+
+class JwksKeySet:
+    """Signing keys of the issuer by kid.
+
+    Keys are refetched when a token names an unknown kid (the issuer rotated
+    its keys) and once they are older than max_age_seconds. Refetches happen
+    at most once per min_refresh_seconds, so tokens with made-up kids cannot
+    hammer the issuer, and concurrent misses share a single fetch. When a
+    refetch fails the keys already known keep being used.
+
+    Requires the optional 'PyJWT[crypto]' package; raises ImportError without it.
+    """
+
+    def __init__(
+        self,
+        fetch: JwksFetcher,
+        min_refresh_seconds: float = 30.0,
+        max_age_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        import jwt
+        self._jwt = jwt
+        self._fetch = fetch
+        self.min_refresh_seconds = min_refresh_seconds
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._keys: Dict[Optional[str], Any] = {}
+        self._fetched_at: Optional[float] = None
+        # Earliest time of the next fetch, successful or not
+        self._next_attempt_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def get(self, kid: Optional[str]) -> Any:
+        """The PyJWK for kid; raises AuthenticationError when the issuer does not have it"""
+        key = self._keys.get(kid)
+        if key is None or self._age() >= self.max_age_seconds:
+            await self._refresh()
+            key = self._keys.get(kid)
+        if key is None:
+            raise AuthenticationError(f"unknown signing key {kid!r}")
+        return key
+
+    def _age(self) -> float:
+        return float("inf") if self._fetched_at is None else self._clock() - self._fetched_at
+
+    async def _refresh(self) -> None:
+        async with self._lock:
+            # Whoever held the lock may just have tried
+            if self._clock() < self._next_attempt_at:
+                return
+            self._next_attempt_at = self._clock() + self.min_refresh_seconds
+            try:
+                document = await self._fetch()
+            except Exception:
+                # Retried after min_refresh_seconds rather than on every request
+                logger.warning("Could not fetch the JWKS; keeping %s known keys", len(self._keys), exc_info=True)
+                return
+            keys = {}
+            for jwk in document.get("keys", []):
+                if jwk.get("use", "sig") != "sig":
+                    continue
+                try:
+                    key = self._jwt.PyJWK(jwk)
+                except self._jwt.PyJWTError:
+                    # Malformed keys, and key types or curves this deployment cannot verify
+                    continue
+                keys[key.key_id] = key
+            self._keys = keys
+            self._fetched_at = self._clock()
+
+
+class VerifiedTokenCache(Generic[P]):
+    """Bounded LRU of principals by token hash, each kept until its token expires.
+
+    Keys are SHA-256 digests, so raw tokens are never held in memory.
+    """
+
+    def __init__(self, max_entries: int = 10000, clock: Callable[[], float] = time.time):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[bytes, Tuple[P, float]]" = OrderedDict()
+
+    def get(self, token_hash: bytes) -> Optional[P]:
+        entry = self._entries.get(token_hash)
+        if entry is None:
+            return None
+        principal, expires_at = entry
+        if self._clock() >= expires_at:
+            del self._entries[token_hash]
+            return None
+        self._entries.move_to_end(token_hash)
+        return principal
+
+    def put(self, token_hash: bytes, principal: P, expires_at: float) -> None:
+        self._entries[token_hash] = (principal, expires_at)
+        self._entries.move_to_end(token_hash)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class JwtAuthenticator(Generic[P]):
+    """Verifies bearer JWTs against the issuer's JWKS and turns their claims into a principal.
+
+    A token is verified (signature, exp/nbf, issuer, audience) and its
+    principal built once; later requests with the same token get the
+    cached principal until the token expires.
+
+    Requires the optional 'PyJWT[crypto]' package; raises ImportError without it.
+    """
+
+    def __init__(
+        self,
+        keys: JwksKeySet,
+        principal: Callable[[Dict[str, Any]], P],
+        algorithms: Sequence[str] = ("RS256", "ES256"),
+        issuer: Optional[str] = None,
+        audience: Optional[str] = None,
+        leeway_seconds: float = 30.0,
+        cache: Optional[VerifiedTokenCache[P]] = None
+    ):
+        import jwt
+        self._jwt = jwt
+        self.keys = keys
+        self.principal = principal
+        self.algorithms = tuple(algorithms)
+        self.issuer = issuer
+        self.audience = audience
+        self.leeway_seconds = leeway_seconds
+        self.cache = cache if cache is not None else VerifiedTokenCache()
+
+    async def authenticate(self, token: str) -> P:
+        token_hash = hashlib.sha256(token.encode()).digest()
+        principal = self.cache.get(token_hash)
+        if principal is not None:
+            return principal
+
+        try:
+            header = self._jwt.get_unverified_header(token)
+        except self._jwt.InvalidTokenError as e:
+            raise AuthenticationError("malformed token") from e
+        algorithm = header.get("alg")
+        if algorithm not in self.algorithms:
+            raise AuthenticationError(f"signing algorithm {algorithm!r} is not accepted")
+        key = await self.keys.get(header.get("kid"))
+        # The header is attacker-controlled: a key is only ever used with the
+        # algorithm its JWK declares (or implies by kty/crv), so an RSA kid
+        # cannot be paired with ES256, HS256 or the like
+        if algorithm != key.algorithm_name:
+            raise AuthenticationError(f"signing algorithm {algorithm!r} does not match key {key.key_id!r}")
+        try:
+            claims = self._jwt.decode(
+                token,
+                key,
+                algorithms=[algorithm],
+                issuer=self.issuer,
+                audience=self.audience,
+                leeway=self.leeway_seconds,
+                options={"require": ["exp", "sub"], "verify_aud": self.audience is not None}
+            )
+        except self._jwt.PyJWTError as e:
+            # InvalidTokenError, but also key errors (InvalidKeyError and the like)
+            raise AuthenticationError(str(e)) from e
+
+        principal = self.principal(claims)
+        self.cache.put(token_hash, principal, float(claims["exp"]))
+        return principal
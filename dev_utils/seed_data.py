@@ -3,13 +3,13 @@ import asyncio
 from uuid import UUID
 from datetime import datetime
 
-from dev_utils.dev_database import AsyncSessionLocal, init_db
+from dev_utils.dev_database import get_sessionmaker, init_db
 from dev_utils.dev_gym_model import GymModel
 
 
 async def seed_gym_data():
     """Create a test gym with the ID used in dev_security"""
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         # Check if gym already exists
         from sqlalchemy import select
         
@@ -36,10 +36,10 @@ async def seed_gym_data():
 
 async def seed_membership_data():
     """Create test memberships"""
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         from sqlalchemy import select
         from features.membership.infrastructure.entities.membership_model import MembershipModel
-        from features.membership.domain.enums.membership_enums import MembershipStatus
+        from features.membership.domain.enums.membership_enums import MembershipStatus, MembershipType
         
         gym_id = UUID("00000000-0000-0000-0000-000000000000")
         
@@ -58,8 +58,9 @@ async def seed_membership_data():
             MembershipModel(
                 name="Daily Pass",
                 description="Access for one day",
-                price=15.0,
+                price_cents=1500,
                 duration_days=1,
+                type=MembershipType.DAILY,
                 status=MembershipStatus.ACTIVE,
                 gym_id=gym_id,
                 created_at=datetime.utcnow(),
@@ -68,8 +69,9 @@ async def seed_membership_data():
             MembershipModel(
                 name="Weekly Pass",
                 description="Access for one week",
-                price=50.0,
+                price_cents=5000,
                 duration_days=7,
+                type=MembershipType.REGULAR,
                 status=MembershipStatus.ACTIVE,
                 gym_id=gym_id,
                 created_at=datetime.utcnow(),
@@ -78,8 +80,9 @@ async def seed_membership_data():
             MembershipModel(
                 name="Monthly Membership",
                 description="Full month access with all amenities",
-                price=100.0,
+                price_cents=10000,
                 duration_days=30,
+                type=MembershipType.REGULAR,
                 status=MembershipStatus.ACTIVE,
                 gym_id=gym_id,
                 created_at=datetime.utcnow(),
@@ -88,8 +91,9 @@ async def seed_membership_data():
             MembershipModel(
                 name="Annual Membership",
                 description="Best value - full year access",
-                price=1000.0,
+                price_cents=100000,
                 duration_days=365,
+                type=MembershipType.PREMIUM,
                 status=MembershipStatus.ACTIVE,
                 gym_id=gym_id,
                 created_at=datetime.utcnow(),
@@ -7,6 +7,9 @@ from pydantic import \
     field_validator
 from features.membership.domain.enums.membership_enums import MembershipStatus, MembershipType
 
+# Upper bound for a single bulk request
+MAX_BULK_ITEMS = 500
+
 class MembershipBaseDTO(BaseModel):
     name: str = Field(..., min_length=1, max_length=100, description="Name of the membership")
     description: str = Field(..., min_length=1, max_length=500, description="Description of the membership")
@@ -48,6 +51,7 @@ class MembershipResponseDTO(BaseModel):
     created_at: datetime = Field(..., description="When the membership was created")
     updated_at: datetime = Field(..., description="When the membership was last updated")
     gym_id: UUID = Field(..., description="ID of the gym this membership belongs to")
+    version: int = Field(1, description="Row version, also exposed as the ETag for optimistic concurrency")
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat(),
@@ -60,4 +64,48 @@ class MembershipListResponseDTO(BaseModel):
     total: int = Field(..., description="Total number of memberships")
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
\ No newline at end of file
+    total_pages: int = Field(..., description="Total number of pages")
+
+class MembershipCursorPageDTO(BaseModel):
+    items: list[MembershipResponseDTO] = Field(..., description="List of memberships")
+    size: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page, if any")
+    prev_cursor: Optional[str] = Field(None, description="Opaque cursor for the previous page, if any")
+
+class MembershipBulkCreateDTO(BaseModel):
+    items: list[MembershipCreateDTO] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS, description="Memberships to create")
+
+class MembershipBulkUpdateItemDTO(MembershipUpdateDTO):
+    id: UUID = Field(..., description="ID of the membership to update")
+    version: Optional[int] = Field(None, ge=1, description="Expected row version (ETag); the item fails with 412 if stale")
+
+class MembershipBulkUpdateDTO(BaseModel):
+    items: list[MembershipBulkUpdateItemDTO] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS, description="Memberships to update")
+
+class MembershipBulkDeleteDTO(BaseModel):
+    ids: list[UUID] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS, description="IDs of the memberships to delete")
+
+class MembershipBulkItemResultDTO(BaseModel):
+    index: int = Field(..., description="Position of the item in the request")
+    id: Optional[UUID] = Field(None, description="ID of the membership, when known")
+    status_code: int = Field(..., description="HTTP status the item would have had as a single request")
+    membership: Optional[MembershipResponseDTO] = Field(None, description="Resulting membership (create/update)")
+    error_code: Optional[str] = Field(None, description="Error class name when the item failed")
+    detail: Optional[str] = Field(None, description="Error message when the item failed")
+
+class MembershipBulkResponseDTO(BaseModel):
+    items: list[MembershipBulkItemResultDTO] = Field(..., description="One result per requested item, in request order")
+    succeeded: int = Field(..., description="Number of items applied")
+    failed: int = Field(..., description="Number of items rejected")
+
+class MembershipImportStatusDTO(BaseModel):
+    job_id: UUID = Field(..., description="ID of the import job")
+    status: str = Field(..., description="running, completed or failed")
+    format: str = Field(..., description="Format of the uploaded file (csv/ndjson)")
+    rows_read: int = Field(0, description="Rows read from the file so far")
+    imported: int = Field(0, description="Rows inserted so far")
+    rejected: int = Field(0, description="Rows rejected so far (invalid or conflicting)")
+    chunks: int = Field(0, description="Chunks committed so far")
+    started_at: datetime = Field(..., description="When the job started")
+    finished_at: Optional[datetime] = Field(None, description="When the job finished")
+    error: Optional[str] = Field(None, description="Why the job failed, if it did")
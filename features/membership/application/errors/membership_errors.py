@@ -35,6 +35,12 @@ class DailyMembershipExistsError(MembershipError):
         self.detail = f"A daily membership already exists for gym {gym_id}"
         super().__init__(self.detail, self.status_code)
 
+class DailyMembershipNotFoundError(MembershipError):
+    status_code = 404
+    def __init__(self, gym_id: UUID):
+        self.detail = f"No active daily membership found for gym {gym_id}"
+        super().__init__(self.detail, self.status_code)
+
 class MembershipInUseError(MembershipError):
     status_code = 409
     def __init__(self, membership_id: uuid.UUID):
@@ -54,4 +60,19 @@ class UnauthorizedMembershipAccessError(MembershipError):
     status_code = 403
     def __init__(self, membership_id: MembershipId, user_id: uuid.UUID):
         self.detail = f"User {user_id} is not authorized to access membership {membership_id}"
+        super().__init__(self.detail, self.status_code)
+
+class MembershipVersionConflictError(MembershipError):
+    status_code = 412
+    def __init__(self, membership_id: uuid.UUID, expected_version: Optional[int], current_version: int):
+        self.detail = (
+            f"Membership with ID {membership_id} was modified concurrently "
+            f"(expected version {expected_version}, current version {current_version})"
+        )
+        super().__init__(self.detail, self.status_code)
+
+class MembershipImportNotFoundError(MembershipError):
+    status_code = 404
+    def __init__(self, job_id: uuid.UUID):
+        self.detail = f"Membership import job {job_id} not found"
         super().__init__(self.detail, self.status_code)
\ No newline at end of file
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from features.membership.domain.membership_aggregate import MembershipAggregate
+from features.membership.domain.repository_interfaces.unit_of_work import IUnitOfWork
+
+
+@dataclass(frozen=True, slots=True)
+class TenantContext:
+    """The authenticated user and the gym every query is scoped to, parsed once per request"""
+    user_id: str
+    gym_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class MembershipContext:
+    """Per-request state handed to the (stateless, shared) service and use cases"""
+    aggregate: MembershipAggregate
+    unit_of_work: IUnitOfWork
+    tenant: TenantContext
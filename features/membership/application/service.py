@@ -1,67 +1,228 @@
 import \
     uuid
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Sequence, Union
 from features.membership.application.dtos.membership_dtos import (
+    MembershipBulkCreateDTO,
+    MembershipBulkDeleteDTO,
+    MembershipBulkResponseDTO,
+    MembershipBulkUpdateDTO,
+    MembershipImportStatusDTO,
     MembershipCreateDTO,
     MembershipResponseDTO,
     MembershipUpdateDTO,
-    MembershipListResponseDTO
+    MembershipListResponseDTO,
+    MembershipCursorPageDTO
 )
+from features.membership.application.membership_context import MembershipContext
+from features.membership.application.use_cases.bulk_create_memberships import BulkCreateMembershipsUseCase
+from features.membership.application.use_cases.bulk_delete_memberships import BulkDeleteMembershipsUseCase
+from features.membership.application.use_cases.bulk_update_memberships import BulkUpdateMembershipsUseCase
 from features.membership.application.use_cases.create_membership import CreateMembershipUseCase
 from features.membership.application.use_cases.delete_membership import DeleteMembershipUseCase
+from features.membership.application.use_cases.export_memberships import ExportMembershipsUseCase
 from features.membership.application.use_cases.get_daily_membership import GetDailyMembershipUseCase
 from features.membership.application.use_cases.get_membership import GetMembershipUseCase
+from features.membership.application.use_cases.get_membership_catalog import GetMembershipCatalogUseCase
+from features.membership.application.use_cases.get_membership_stamps import (
+    GetDailyMembershipStampUseCase,
+    GetMembershipCatalogStampUseCase,
+    GetMembershipStampUseCase
+)
 from features.membership.application.use_cases.get_memberships import GetMembershipsUseCase
+from features.membership.application.use_cases.import_memberships import ImportMembershipsUseCase, ImportRow
 from features.membership.application.use_cases.update_membership import UpdateMembershipUseCase
-from features.membership.domain.membership_aggregate import MembershipAggregate
+from features.membership.domain.object_values.membership_stamp import MembershipCatalogStamp, MembershipStamp
 
 class MembershipService:
-    def __init__(self, membership_aggregate: MembershipAggregate, current_user: Dict[str, Any]):
-        self.membership_aggregate = membership_aggregate
-        self.current_user = current_user
-
-    async def create_membership(self, membership_data: MembershipCreateDTO) -> MembershipResponseDTO:
-
-        use_case = CreateMembershipUseCase(self.membership_aggregate, self.current_user)
+    """Entry point of the membership use cases.
 
-        return await use_case.execute(membership_data)
+    Stateless and shared by every request: the session-bound aggregate and
+    unit of work and the tenant travel in the MembershipContext argument.
+    """
 
-    async def get_membership(self, membership_id: uuid.UUID) -> MembershipResponseDTO:
+    def __init__(
+        self,
+        create_membership: CreateMembershipUseCase,
+        get_membership: GetMembershipUseCase,
+        get_daily_membership: GetDailyMembershipUseCase,
+        list_memberships: GetMembershipsUseCase,
+        get_membership_stamp: GetMembershipStampUseCase,
+        get_daily_membership_stamp: GetDailyMembershipStampUseCase,
+        get_membership_catalog_stamp: GetMembershipCatalogStampUseCase,
+        get_membership_catalog: GetMembershipCatalogUseCase,
+        export_memberships: ExportMembershipsUseCase,
+        update_membership: UpdateMembershipUseCase,
+        delete_membership: DeleteMembershipUseCase,
+        bulk_create_memberships: BulkCreateMembershipsUseCase,
+        bulk_update_memberships: BulkUpdateMembershipsUseCase,
+        bulk_delete_memberships: BulkDeleteMembershipsUseCase,
+        import_memberships: ImportMembershipsUseCase
+    ):
+        self._create_membership = create_membership
+        self._get_membership = get_membership
+        self._get_daily_membership = get_daily_membership
+        self._list_memberships = list_memberships
+        self._get_membership_stamp = get_membership_stamp
+        self._get_daily_membership_stamp = get_daily_membership_stamp
+        self._get_membership_catalog_stamp = get_membership_catalog_stamp
+        self._get_membership_catalog = get_membership_catalog
+        self._export_memberships = export_memberships
+        self._update_membership = update_membership
+        self._delete_membership = delete_membership
+        self._bulk_create_memberships = bulk_create_memberships
+        self._bulk_update_memberships = bulk_update_memberships
+        self._bulk_delete_memberships = bulk_delete_memberships
+        self._import_memberships = import_memberships
+
+    async def create_membership(self, context: MembershipContext, membership_data: MembershipCreateDTO) -> MembershipResponseDTO:
+
+        use_case = self._create_membership
+
+        async with context.unit_of_work:
+            membership = await use_case.execute(context, membership_data)
+            await context.unit_of_work.commit()
+        return membership
+
+    async def get_membership(
+        self,
+        context: MembershipContext,
+        membership_id: uuid.UUID,
+        fields: Optional[Sequence[str]] = None
+    ) -> MembershipResponseDTO:
 
-        use_case = GetMembershipUseCase(self.membership_aggregate, self.current_user)
+        use_case = self._get_membership
 
-        return await use_case.execute(membership_id)
+        return await use_case.execute(context, membership_id, fields)
 
-    async def get_daily_membership(self) -> MembershipResponseDTO:
+    async def get_daily_membership(self, context: MembershipContext, fields: Optional[Sequence[str]] = None) -> MembershipResponseDTO:
 
-        use_case = GetDailyMembershipUseCase(self.membership_aggregate, self.current_user)
+        use_case = self._get_daily_membership
 
-        return await use_case.execute()
+        return await use_case.execute(context, fields)
 
     async def list_memberships(
         self,
+        context: MembershipContext,
         page: int = 1,
         size: int = 10,
         status: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        pagination: str = "offset",
+        fields: Optional[Sequence[str]] = None,
+        total: Optional[int] = None
+    ) -> Union[MembershipListResponseDTO, MembershipCursorPageDTO]:
+
+        # total: the filtered count when the caller already has it (offset mode)
+        use_case = self._list_memberships
+
+        return await use_case.execute(
+            context,
+            page=page,
+            size=size,
+            status=status,
+            search=search,
+            cursor=cursor,
+            pagination=pagination,
+            fields=fields,
+            total=total
+        )
+
+    async def get_membership_stamp(self, context: MembershipContext, membership_id: uuid.UUID) -> Optional[MembershipStamp]:
+
+        use_case = self._get_membership_stamp
+
+        return await use_case.execute(context, membership_id)
+
+    async def get_daily_membership_stamp(self, context: MembershipContext) -> Optional[MembershipStamp]:
+
+        use_case = self._get_daily_membership_stamp
+
+        return await use_case.execute(context)
+
+    async def get_membership_catalog_stamp(
+        self,
+        context: MembershipContext,
+        status: Optional[str] = None,
         search: Optional[str] = None
-    ) -> MembershipListResponseDTO:
+    ) -> MembershipCatalogStamp:
+
+        use_case = self._get_membership_catalog_stamp
 
-        use_case = GetMembershipsUseCase(self.membership_aggregate, self.current_user)
+        return await use_case.execute(context, status, search)
 
-        return await use_case.execute(page=page, size=size, status=status, search=search)
+    async def get_membership_catalog(self, context: MembershipContext) -> List[MembershipResponseDTO]:
+
+        use_case = self._get_membership_catalog
+
+        return await use_case.execute(context)
+
+    async def export_memberships(self, context: MembershipContext, status: Optional[str] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+
+        use_case = self._export_memberships
+
+        return await use_case.execute(context, status)
 
     async def update_membership(
         self,
+        context: MembershipContext,
         membership_id: uuid.UUID,
-        update_data: MembershipUpdateDTO
+        update_data: MembershipUpdateDTO,
+        expected_version: Optional[int] = None
     ) -> MembershipResponseDTO:
 
-        use_case = UpdateMembershipUseCase(self.membership_aggregate, self.current_user)
+        use_case = self._update_membership
+
+        async with context.unit_of_work:
+            membership = await use_case.execute(context, membership_id, update_data, expected_version)
+            await context.unit_of_work.commit()
+        return membership
+
+    async def delete_membership(self, context: MembershipContext, membership_id: uuid.UUID) -> bool:
+
+        use_case = self._delete_membership
+
+        async with context.unit_of_work:
+            deleted = await use_case.execute(context, membership_id)
+            await context.unit_of_work.commit()
+        return deleted
 
-        return await use_case.execute(membership_id, update_data)
+    async def bulk_create_memberships(self, context: MembershipContext, bulk_data: MembershipBulkCreateDTO) -> MembershipBulkResponseDTO:
 
-    async def delete_membership(self, membership_id: uuid.UUID) -> bool:
+        use_case = self._bulk_create_memberships
+
+        async with context.unit_of_work:
+            result = await use_case.execute(context, bulk_data)
+            await context.unit_of_work.commit()
+        return result
+
+    async def bulk_update_memberships(self, context: MembershipContext, bulk_data: MembershipBulkUpdateDTO) -> MembershipBulkResponseDTO:
+
+        use_case = self._bulk_update_memberships
+
+        async with context.unit_of_work:
+            result = await use_case.execute(context, bulk_data)
+            await context.unit_of_work.commit()
+        return result
+
+    async def bulk_delete_memberships(self, context: MembershipContext, bulk_data: MembershipBulkDeleteDTO) -> MembershipBulkResponseDTO:
+
+        use_case = self._bulk_delete_memberships
+
+        async with context.unit_of_work:
+            result = await use_case.execute(context, bulk_data)
+            await context.unit_of_work.commit()
+        return result
+
+    async def import_memberships(
+        self,
+        context: MembershipContext,
+        chunks: AsyncIterable[List[ImportRow]],
+        progress: MembershipImportStatusDTO,
+        reject: Callable[[ImportRow, str], None]
+    ) -> MembershipImportStatusDTO:
 
-        use_case = DeleteMembershipUseCase(self.membership_aggregate, self.current_user)
+        # Commits once per chunk through the unit of work
+        use_case = self._import_memberships
 
-        return await use_case.execute(membership_id)
\ No newline at end of file
+        return await use_case.execute(context, chunks, progress, reject)
\ No newline at end of file
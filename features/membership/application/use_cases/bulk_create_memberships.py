@@ -0,0 +1,114 @@
+from typing import List
+from features.membership.application.dtos.membership_dtos import (
+    MembershipBulkCreateDTO,
+    MembershipBulkItemResultDTO,
+    MembershipBulkResponseDTO,
+    MembershipResponseDTO
+)
+from features.membership.application.errors.membership_errors import (
+    MembershipAlreadyExistsError,
+    DailyMembershipExistsError,
+    InvalidMembershipDataError,
+    MembershipError
+)
+from features.membership.application.membership_context import MembershipContext
+from features.membership.application.use_cases.base_use_case import BaseUseCase
+from features.membership.application.use_cases.bulk_results import bulk_failure, bulk_response, bulk_success
+from features.membership.domain.entities.membership import Membership
+from features.membership.domain.enums.membership_enums import MembershipStatus, MembershipType
+from features.membership.domain.object_values.create_membership_input import CreateMembershipInput
+
+
+class BulkCreateMembershipsUseCase(BaseUseCase[MembershipBulkResponseDTO]):
+
+    async def execute(self, context: MembershipContext, bulk_data: MembershipBulkCreateDTO) -> MembershipBulkResponseDTO:
+        gym_id = context.tenant.gym_id
+        items = bulk_data.items
+
+        # Every name of the batch is checked in a single query
+        taken_names, daily_taken = await context.aggregate.find_creation_conflicts(
+            gym_id, list({item.name for item in items})
+        )
+
+        results: List[MembershipBulkItemResultDTO] = []
+        accepted: List[tuple[int, Membership]] = []
+        for index, item in enumerate(items):
+            status = item.status or MembershipStatus.ACTIVE
+            daily = item.duration_days == 1 and status == MembershipStatus.ACTIVE
+
+            if item.name in taken_names:
+                results.append(bulk_failure(index, None, MembershipAlreadyExistsError(item.name, gym_id)))
+                continue
+            if daily and daily_taken:
+                results.append(bulk_failure(index, None, DailyMembershipExistsError(gym_id)))
+                continue
+            try:
+                membership = context.aggregate.new_membership(CreateMembershipInput(
+                    name=item.name,
+                    description=item.description,
+                    price=item.price,
+                    duration=item.duration_days,
+                    type=item.type or MembershipType.REGULAR,
+                    gym_id=gym_id,
+                    status=status
+                ))
+            except ValueError as e:
+                results.append(bulk_failure(index, None, InvalidMembershipDataError(f"items[{index}]", str(e))))
+                continue
+
+            # Later items of the same batch compete for the same slots
+            taken_names.add(item.name)
+            daily_taken = daily_taken or daily
+            accepted.append((index, membership))
+
+        results.extend(await self._insert(context, accepted))
+        return bulk_response(results)
+
+    async def _insert(
+            self,
+            context: MembershipContext,
+            accepted: List[tuple[int, Membership]]) -> List[MembershipBulkItemResultDTO]:
+        # One multi-row INSERT in the common case. A concurrent writer can
+        # still take a name or the daily slot after the conflict check, which
+        # rejects the whole statement: the batch is then retried one item per
+        # savepoint so only the items that lost the race are reported.
+        if not accepted:
+            return []
+        try:
+            async with context.unit_of_work.savepoint():
+                created = await context.aggregate.create_memberships([membership for _, membership in accepted])
+        except (MembershipAlreadyExistsError, DailyMembershipExistsError):
+            return [await self._insert_one(context, index, membership) for index, membership in accepted]
+        return [
+            bulk_success(index, membership.id.value, 201, self._to_response_dto(membership))
+            for (index, _), membership in zip(accepted, created)
+        ]
+
+    async def _insert_one(
+            self,
+            context: MembershipContext,
+            index: int,
+            membership: Membership) -> MembershipBulkItemResultDTO:
+        try:
+            async with context.unit_of_work.savepoint():
+                created, = await context.aggregate.create_memberships([membership])
+        except MembershipError as e:
+            return bulk_failure(index, None, e)
+        return bulk_success(index, created.id.value, 201, self._to_response_dto(created))
+
+    @staticmethod
+    def _to_response_dto(
+            membership: Membership) -> MembershipResponseDTO:
+        return MembershipResponseDTO(
+            id=membership.id.value,
+            name=membership.name,
+            description=membership.description,
+            price=membership.price.to_float(),
+            duration_days=membership.duration.to_int(),
+            status=membership.status,
+            type=membership.type,
+            created_at=membership.created_at,
+            updated_at=membership.updated_at,
+            gym_id=membership.gym_id,
+            version=membership.version
+        )
@@ -0,0 +1,64 @@
+from typing import Dict, List
+from uuid import UUID
+from features.membership.application.dtos.membership_dtos import (
+    MembershipBulkDeleteDTO,
+    MembershipBulkItemResultDTO,
+    MembershipBulkResponseDTO
+)
+from features.membership.application.errors.membership_errors import (
+    InvalidMembershipDataError,
+    MembershipInUseError,
+    MembershipNotFoundError,
+    UnauthorizedMembershipAccessError
+)
+from features.membership.application.membership_context import MembershipContext
+from features.membership.application.use_cases.base_use_case import BaseUseCase
+from features.membership.application.use_cases.bulk_results import bulk_failure, bulk_response, bulk_success
+from features.membership.domain.object_values.membership_id import MembershipId
+
+
+class BulkDeleteMembershipsUseCase(BaseUseCase[MembershipBulkResponseDTO]):
+
+    async def execute(self, context: MembershipContext, bulk_data: MembershipBulkDeleteDTO) -> MembershipBulkResponseDTO:
+        gym_id = context.tenant.gym_id
+        results: List[MembershipBulkItemResultDTO] = []
+
+        requested: Dict[UUID, int] = {}
+        for index, membership_id in enumerate(bulk_data.ids):
+            if membership_id in requested:
+                results.append(bulk_failure(
+                    index, membership_id, InvalidMembershipDataError("ids", "appears more than once in the batch")
+                ))
+                continue
+            requested[membership_id] = index
+
+        deleted = await context.aggregate.delete_memberships(
+            [MembershipId(membership_id) for membership_id in requested], gym_id
+        )
+        for membership_id in deleted:
+            results.append(bulk_success(requested[membership_id], membership_id, 204))
+
+        # Only the ids that were not deleted pay for the lookup that explains them
+        missed = [membership_id for membership_id in requested if membership_id not in deleted]
+        existing = {
+            membership.id.value: membership
+            for membership in await context.aggregate.get_memberships(
+                [MembershipId(membership_id) for membership_id in missed]
+            )
+        }
+        for membership_id in missed:
+            index = requested[membership_id]
+            membership = existing.get(membership_id)
+            if membership is None:
+                results.append(bulk_failure(index, membership_id, MembershipNotFoundError(membership_id)))
+            elif membership.gym_id != gym_id:
+                results.append(bulk_failure(index, membership_id, UnauthorizedMembershipAccessError(
+                    membership_id=membership.id,
+                    user_id=context.tenant.user_id
+                )))
+            elif await context.aggregate.is_membership_in_use(membership.id):
+                results.append(bulk_failure(index, membership_id, MembershipInUseError(membership_id)))
+            else:
+                results.append(bulk_failure(index, membership_id, MembershipNotFoundError(membership_id)))
+
+        return bulk_response(results)
@@ -0,0 +1,38 @@
+from typing import List, Optional
+from uuid import UUID
+from features.membership.application.dtos.membership_dtos import (
+    MembershipBulkItemResultDTO,
+    MembershipBulkResponseDTO,
+    MembershipResponseDTO
+)
+from features.membership.application.errors.membership_errors import MembershipError
+
+
+def bulk_success(
+    index: int,
+    membership_id: UUID,
+    status_code: int,
+    membership: Optional[MembershipResponseDTO] = None
+) -> MembershipBulkItemResultDTO:
+    return MembershipBulkItemResultDTO(
+        index=index,
+        id=membership_id,
+        status_code=status_code,
+        membership=membership
+    )
+
+
+def bulk_failure(index: int, membership_id: Optional[UUID], error: MembershipError) -> MembershipBulkItemResultDTO:
+    return MembershipBulkItemResultDTO(
+        index=index,
+        id=membership_id,
+        status_code=error.status_code,
+        error_code=error.__class__.__name__,
+        detail=error.detail
+    )
+
+
+def bulk_response(results: List[MembershipBulkItemResultDTO]) -> MembershipBulkResponseDTO:
+    results = sorted(results, key=lambda result: result.index)
+    failed = sum(1 for result in results if result.error_code is not None)
+    return MembershipBulkResponseDTO(items=results, succeeded=len(results) - failed, failed=failed)
@@ -0,0 +1,46 @@
+from typing import List, Set
+from uuid import UUID
+from features.membership.application.dtos.membership_dtos import (
+    MembershipBulkItemResultDTO,
+    MembershipBulkResponseDTO,
+    MembershipBulkUpdateDTO
+)
+from features.membership.application.errors.membership_errors import (
+    InvalidMembershipDataError,
+    MembershipError
+)
+from features.membership.application.membership_context import MembershipContext
+from features.membership.application.use_cases.base_use_case import BaseUseCase
+from features.membership.application.use_cases.bulk_results import bulk_failure, bulk_response, bulk_success
+from features.membership.application.use_cases.update_membership import UpdateMembershipUseCase
+
+
+class BulkUpdateMembershipsUseCase(BaseUseCase[MembershipBulkResponseDTO]):
+
+    def __init__(self, update_membership: UpdateMembershipUseCase):
+        self.update_membership = update_membership
+
+    async def execute(self, context: MembershipContext, bulk_data: MembershipBulkUpdateDTO) -> MembershipBulkResponseDTO:
+        results: List[MembershipBulkItemResultDTO] = []
+        seen_ids: Set[UUID] = set()
+
+        for index, item in enumerate(bulk_data.items):
+            if item.id in seen_ids:
+                results.append(bulk_failure(
+                    index, item.id, InvalidMembershipDataError("id", "appears more than once in the batch")
+                ))
+                continue
+            seen_ids.add(item.id)
+
+            # Each item is its own conditional UPDATE ... RETURNING inside a
+            # savepoint, so a conflicting item is reported without aborting
+            # the rest of the batch; everything commits together.
+            try:
+                async with context.unit_of_work.savepoint():
+                    membership = await self.update_membership.execute(context, item.id, item, item.version)
+            except MembershipError as e:
+                results.append(bulk_failure(index, item.id, e))
+                continue
+            results.append(bulk_success(index, item.id, 200, membership))
+
+        return bulk_response(results)
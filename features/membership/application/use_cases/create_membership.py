@@ -1,28 +1,22 @@
-from typing import Any, Dict
-from uuid import UUID
 from features.membership.application.dtos.membership_dtos import MembershipCreateDTO, MembershipResponseDTO
 from features.membership.application.errors.membership_errors import (
     MembershipAlreadyExistsError,
     DailyMembershipExistsError,
     InvalidMembershipDataError
 )
+from features.membership.application.membership_context import MembershipContext
 from features.membership.application.use_cases.base_use_case import BaseUseCase
 from features.membership.domain.entities.membership import Membership
 from features.membership.domain.enums.membership_enums import \
     MembershipType
-from features.membership.domain.membership_aggregate import MembershipAggregate
 from features.membership.domain.object_values.create_membership_input import \
     CreateMembershipInput
 
 
 class CreateMembershipUseCase(BaseUseCase[MembershipResponseDTO]):
 
-    def __init__(self, membership_aggregate: MembershipAggregate, current_user: Dict[str, Any]):
-        self.membership_aggregate = membership_aggregate
-        self.current_user = current_user
-
-    async def execute(self, membership_data: MembershipCreateDTO) -> MembershipResponseDTO:
-        gym_id = UUID(self.current_user["id_gym"])
+    async def execute(self, context: MembershipContext, membership_data: MembershipCreateDTO) -> MembershipResponseDTO:
+        gym_id = context.tenant.gym_id
         try:
             from features.membership.domain.enums.membership_enums import MembershipStatus
             status = getattr(membership_data, 'status', MembershipStatus.ACTIVE)
@@ -37,7 +31,7 @@ class CreateMembershipUseCase(BaseUseCase[MembershipResponseDTO]):
                 gym_id=gym_id,
                 status=status
             )
-            membership = await self.membership_aggregate.create_membership(membership_input)
+            membership = await context.aggregate.create_membership(membership_input)
             return self._to_response_dto(membership)
         except ValueError as e:
             error_message = str(e).lower()
@@ -61,5 +55,6 @@ class CreateMembershipUseCase(BaseUseCase[MembershipResponseDTO]):
             type=membership.type,
             created_at=membership.created_at,
             updated_at=membership.updated_at,
-            gym_id=membership.gym_id
+            gym_id=membership.gym_id,
+            version=membership.version
         )
\ No newline at end of file
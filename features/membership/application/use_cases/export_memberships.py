@@ -0,0 +1,10 @@
+from typing import Any, AsyncIterator, Dict, List, Optional
+from features.membership.application.membership_context import MembershipContext
+from features.membership.application.use_cases.base_use_case import BaseUseCase
+
+
+class ExportMembershipsUseCase(BaseUseCase[AsyncIterator[List[Dict[str, Any]]]]):
+
+    async def execute(self, context: MembershipContext, status: Optional[str] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        gym_id = context.tenant.gym_id
+        return context.aggregate.export_memberships(gym_id, status)
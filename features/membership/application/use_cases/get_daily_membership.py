@@ -1,27 +1,28 @@
-from typing import Any, Dict
+from typing import Optional, Sequence
 from features.membership.application.dtos.membership_dtos import MembershipResponseDTO
-from features.membership.application.errors.membership_errors import MembershipNotFoundError
+from features.membership.application.errors.membership_errors import DailyMembershipNotFoundError
+from features.membership.application.membership_context import MembershipContext
 from features.membership.application.use_cases.base_use_case import BaseUseCase
-from features.membership.application.use_cases.get_membership import GetMembershipUseCase
+from features.membership.application.use_cases.response_fields import validate_response_fields
 from features.membership.domain.entities.membership import Membership
-from features.membership.domain.membership_aggregate import MembershipAggregate
 
 class GetDailyMembershipUseCase(BaseUseCase[MembershipResponseDTO]):
 
-    def __init__(self, membership_aggregate: MembershipAggregate, current_user: Dict[str, Any]):
-        self.membership_aggregate = membership_aggregate
-        self.current_user = current_user
-        self.get_membership_use_case = GetMembershipUseCase(membership_aggregate, current_user)
+    async def execute(self, context: MembershipContext, fields: Optional[Sequence[str]] = None) -> MembershipResponseDTO:
 
-    async def execute(self) -> MembershipResponseDTO:
+        gym_id = context.tenant.gym_id
 
-        from uuid import UUID
-        gym_id = UUID(self.current_user["id_gym"])
+        fields = validate_response_fields(fields)
+        if fields:
+            row = await context.aggregate.get_daily_membership_row_for_gym(gym_id, fields)
+            if row is None:
+                raise DailyMembershipNotFoundError(gym_id)
+            return MembershipResponseDTO.model_construct(**row)
 
-        daily_membership = await self.membership_aggregate.get_daily_membership_for_gym(gym_id)
+        daily_membership = await context.aggregate.get_daily_membership_for_gym(gym_id)
 
         if not daily_membership:
-            raise MembershipNotFoundError("No daily membership found for this gym")
+            raise DailyMembershipNotFoundError(gym_id)
 
         return self._to_response_dto(self,daily_membership)
 
@@ -37,5 +38,6 @@ class GetDailyMembershipUseCase(BaseUseCase[MembershipResponseDTO]):
             type=membership.type,
             created_at=membership.created_at,
             updated_at=membership.updated_at,
-            gym_id=membership.gym_id
+            gym_id=membership.gym_id,
+            version=membership.version
         )
\ No newline at end of file
@@ -1,44 +1,66 @@
-from typing import Any, Dict, Union
+from typing import Optional, Sequence, Union
 from uuid import UUID
 from features.membership.application.dtos.membership_dtos import MembershipResponseDTO
 from features.membership.application.errors.membership_errors import (
     MembershipNotFoundError,
     UnauthorizedMembershipAccessError
 )
+from features.membership.application.membership_context import MembershipContext, TenantContext
 from features.membership.application.use_cases.base_use_case import BaseUseCase
+from features.membership.application.use_cases.response_fields import validate_response_fields
 from features.membership.domain.entities.membership import Membership
-from features.membership.domain.membership_aggregate import MembershipAggregate
 from features.membership.domain.object_values.membership_id import MembershipId
 
 class GetMembershipUseCase(BaseUseCase[MembershipResponseDTO]):
 
-    def __init__(self, membership_aggregate: MembershipAggregate, current_user: Dict[str, Any]):
-        self.membership_aggregate = membership_aggregate
-        self.current_user = current_user
-
-    async def execute(self, membership_id: Union[str, UUID]) -> MembershipResponseDTO:
+    async def execute(
+        self,
+        context: MembershipContext,
+        membership_id: Union[str, UUID],
+        fields: Optional[Sequence[str]] = None
+    ) -> MembershipResponseDTO:
         membership_uuid = membership_id if isinstance(membership_id, UUID) else UUID(membership_id)
+        fields = validate_response_fields(fields)
+        if fields:
+            return await self._execute_projection(context, membership_uuid, fields)
         try:
 
 
-            membership = await self.membership_aggregate.get_membership(MembershipId(membership_uuid))
+            membership = await context.aggregate.get_membership(MembershipId(membership_uuid))
 
             if not membership:
                 raise MembershipNotFoundError(membership_uuid)
 
-            self._check_authorization(membership)
+            self._check_authorization(context.tenant, membership)
 
             return self._to_response_dto(self, membership)
 
         except ValueError as e:
             raise MembershipNotFoundError(membership_uuid) from e
 
-    def _check_authorization(self, membership: Membership) -> None:
-        user_gym_id = UUID(self.current_user["id_gym"])
+    async def _execute_projection(
+        self,
+        context: MembershipContext,
+        membership_id: UUID,
+        fields: Sequence[str]
+    ) -> MembershipResponseDTO:
+        # Only the requested columns are read; the DTO is left partial
+        row = await context.aggregate.get_membership_row(MembershipId(membership_id), fields)
+        if row is None:
+            raise MembershipNotFoundError(membership_id)
+        if row["gym_id"] != context.tenant.gym_id:
+            raise UnauthorizedMembershipAccessError(
+                membership_id=MembershipId(membership_id),
+                user_id=context.tenant.user_id
+            )
+        return MembershipResponseDTO.model_construct(**row)
+
+    def _check_authorization(self, tenant: TenantContext, membership: Membership) -> None:
+        user_gym_id = tenant.gym_id
         if membership.gym_id != user_gym_id:
             raise UnauthorizedMembershipAccessError(
                 membership_id=membership.id,
-                user_id=self.current_user["id"]
+                user_id=tenant.user_id
             )
 
     @staticmethod
@@ -53,5 +75,6 @@ class GetMembershipUseCase(BaseUseCase[MembershipResponseDTO]):
             type=membership.type,
             created_at=membership.created_at,
             updated_at=membership.updated_at,
-            gym_id=membership.gym_id
+            gym_id=membership.gym_id,
+            version=membership.version
         )
\ No newline at end of file
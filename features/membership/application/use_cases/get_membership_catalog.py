@@ -0,0 +1,16 @@
+from typing import List
+from features.membership.application.dtos.membership_dtos import MembershipResponseDTO
+from features.membership.application.membership_context import MembershipContext
+from features.membership.application.use_cases.base_use_case import BaseUseCase
+
+
+class GetMembershipCatalogUseCase(BaseUseCase[List[MembershipResponseDTO]]):
+
+    async def execute(self, context: MembershipContext) -> List[MembershipResponseDTO]:
+        # The gym's whole catalog in list order (newest first), for snapshots
+        gym_id = context.tenant.gym_id
+        items: List[MembershipResponseDTO] = []
+        async for batch in context.aggregate.export_memberships(gym_id):
+            items.extend(MembershipResponseDTO(**row, gym_id=gym_id) for row in batch)
+        items.reverse()
+        return items
@@ -0,0 +1,33 @@
+from typing import Optional
+from uuid import UUID
+from features.membership.application.membership_context import MembershipContext
+from features.membership.application.use_cases.base_use_case import BaseUseCase
+from features.membership.domain.object_values.membership_id import MembershipId
+from features.membership.domain.object_values.membership_stamp import MembershipCatalogStamp, MembershipStamp
+
+# Validators for conditional GETs. A missing or foreign membership yields None
+# instead of an error, so the caller falls back to the regular read, which
+# raises the proper 404/403.
+
+
+class GetMembershipStampUseCase(BaseUseCase[Optional[MembershipStamp]]):
+
+    async def execute(self, context: MembershipContext, membership_id: UUID) -> Optional[MembershipStamp]:
+        stamp = await context.aggregate.get_membership_stamp(MembershipId(membership_id))
+        if stamp is None or stamp.gym_id != context.tenant.gym_id:
+            return None
+        return stamp
+
+
+class GetDailyMembershipStampUseCase(BaseUseCase[Optional[MembershipStamp]]):
+
+    async def execute(self, context: MembershipContext) -> Optional[MembershipStamp]:
+        gym_id = context.tenant.gym_id
+        return await context.aggregate.get_daily_membership_stamp_for_gym(gym_id)
+
+
+class GetMembershipCatalogStampUseCase(BaseUseCase[MembershipCatalogStamp]):
+
+    async def execute(self, context: MembershipContext, status: Optional[str] = None, search: Optional[str] = None) -> MembershipCatalogStamp:
+        gym_id = context.tenant.gym_id
+        return await context.aggregate.get_catalog_stamp(gym_id, status, search)
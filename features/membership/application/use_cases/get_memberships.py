@@ -1,53 +1,93 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 from uuid import UUID
-from features.membership.application.dtos.membership_dtos import MembershipListResponseDTO, MembershipResponseDTO
+from features.membership.application.dtos.membership_dtos import (
+    MembershipCursorPageDTO,
+    MembershipListResponseDTO,
+    MembershipResponseDTO
+)
+from features.membership.application.errors.membership_errors import InvalidMembershipDataError
+from features.membership.application.membership_context import MembershipContext
 from features.membership.application.use_cases.base_use_case import BaseUseCase
-from features.membership.domain.entities.membership import Membership
-from features.membership.domain.membership_aggregate import MembershipAggregate
+from features.membership.application.use_cases.response_fields import validate_response_fields
+from features.membership.domain.object_values.membership_cursor import MembershipCursor
 
-class GetMembershipsUseCase(BaseUseCase[MembershipListResponseDTO]):
-
-    def __init__(self, membership_aggregate: MembershipAggregate, current_user: Dict[str, Any]):
-        self.membership_aggregate = membership_aggregate
-        self.current_user = current_user
+class GetMembershipsUseCase(BaseUseCase[Union[MembershipListResponseDTO, MembershipCursorPageDTO]]):
 
     async def execute(
         self,
+        context: MembershipContext,
         page: int = 1,
         size: int = 10,
         status: Optional[str] = None,
-        search: Optional[str] = None
-    ) -> MembershipListResponseDTO:
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        pagination: str = "offset",
+        fields: Optional[Sequence[str]] = None,
+        total: Optional[int] = None
+    ) -> Union[MembershipListResponseDTO, MembershipCursorPageDTO]:
+
+        gym_id = context.tenant.gym_id
+        # With fields, the items only carry those columns (plus the sort key in cursor mode)
+        fields = validate_response_fields(fields)
 
-        gym_id = UUID(self.current_user["id_gym"])
+        if pagination == "cursor" or cursor is not None:
+            return await self._execute_keyset(context, gym_id, size, status, search, cursor, fields)
 
-        memberships, total = await self.membership_aggregate.list_memberships(
-            gym_id, page, size, status, search
+        rows, total = await context.aggregate.list_membership_rows(
+            gym_id, page, size, status, search, fields, total
         )
 
         total_pages = (total + size - 1) // size if size > 0 else 1
 
-        items = [self._to_response_dto(self, membership) for membership in memberships]
-
-        return MembershipListResponseDTO(
-            items=items,
+        return MembershipListResponseDTO.model_construct(
+            items=self._to_response_dtos(rows),
             total=total,
             page=page,
             size=size,
             total_pages=total_pages
         )
 
+    async def _execute_keyset(
+        self,
+        context: MembershipContext,
+        gym_id: UUID,
+        size: int,
+        status: Optional[str],
+        search: Optional[str],
+        cursor: Optional[str],
+        fields: Optional[List[str]]
+    ) -> MembershipCursorPageDTO:
+        filters = MembershipCursor.filter_key(status, search)
+        try:
+            decoded_cursor = MembershipCursor.decode(cursor) if cursor else None
+        except ValueError as e:
+            raise InvalidMembershipDataError("cursor", str(e)) from e
+        if decoded_cursor is not None and decoded_cursor.filters != filters:
+            raise InvalidMembershipDataError("cursor", "The cursor was issued for other status/search filters")
+
+        rows, has_more = await context.aggregate.list_membership_rows_by_cursor(
+            gym_id, size, status, search, decoded_cursor, fields
+        )
+
+        next_cursor = None
+        prev_cursor = None
+        if rows:
+            first, last = rows[0], rows[-1]
+            backwards = decoded_cursor is not None and decoded_cursor.backwards
+            if has_more or backwards:
+                next_cursor = MembershipCursor.after(last["created_at"], last["id"], filters).encode()
+            if decoded_cursor is not None and (has_more or not backwards):
+                prev_cursor = MembershipCursor.before(first["created_at"], first["id"], filters).encode()
+
+        return MembershipCursorPageDTO.model_construct(
+            items=self._to_response_dtos(rows),
+            size=size,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor
+        )
+
     @staticmethod
-    def _to_response_dto(_self, membership: Membership) -> MembershipResponseDTO:
-        return MembershipResponseDTO(
-            id=membership.id.value,
-            name=membership.name,
-            description=membership.description,
-            price=membership.price.to_float(),
-            duration_days=membership.duration.to_int(),
-            status=membership.status,
-            type=membership.type,
-            created_at=membership.created_at,
-            updated_at=membership.updated_at,
-            gym_id=membership.gym_id
-        )
\ No newline at end of file
+    def _to_response_dtos(rows: List[Dict[str, Any]]) -> List[MembershipResponseDTO]:
+        # Rows come from our own table with the DTO's columns, so they are
+        # trusted: no entity, value objects or validation per item
+        return [MembershipResponseDTO.model_construct(**row) for row in rows]
\ No newline at end of file
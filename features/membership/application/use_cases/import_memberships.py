@@ -0,0 +1,85 @@
+from typing import Any, AsyncIterable, Callable, Dict, List, NamedTuple, Optional
+from uuid import UUID
+from pydantic import ValidationError
+from features.membership.application.dtos.membership_dtos import MembershipCreateDTO, MembershipImportStatusDTO
+from features.membership.application.membership_context import MembershipContext
+from features.membership.application.use_cases.base_use_case import BaseUseCase
+from features.membership.domain.entities.membership import Membership
+from features.membership.domain.enums.membership_enums import MembershipStatus, MembershipType
+from features.membership.domain.object_values.create_membership_input import CreateMembershipInput
+
+
+class ImportRow(NamedTuple):
+    line: int
+    data: Dict[str, Any]
+    # Set when the row could not even be parsed
+    error: Optional[str] = None
+
+
+class ImportMembershipsUseCase(BaseUseCase[MembershipImportStatusDTO]):
+
+    CONFLICT_MESSAGE = "conflicts with an existing membership (same name or a second active daily pass)"
+
+    async def execute(
+        self,
+        context: MembershipContext,
+        chunks: AsyncIterable[List[ImportRow]],
+        progress: MembershipImportStatusDTO,
+        reject: Callable[[ImportRow, str], None]
+    ) -> MembershipImportStatusDTO:
+        # Only one chunk is held at a time and each is committed on its own, so
+        # memory stays flat and progress survives a failure half way through.
+        gym_id = context.tenant.gym_id
+
+        async for chunk in chunks:
+            accepted: List[tuple[ImportRow, Membership]] = []
+            for row in chunk:
+                progress.rows_read += 1
+                membership = None
+                error = row.error
+                if error is None:
+                    try:
+                        membership = self._to_membership(context, MembershipCreateDTO.model_validate(row.data), gym_id)
+                    except ValidationError as e:
+                        error = "; ".join(
+                            f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in e.errors()
+                        )
+                    except ValueError as e:
+                        error = str(e)
+                if membership is None:
+                    reject(row, error)
+                    progress.rejected += 1
+                    continue
+                accepted.append((row, membership))
+
+            if accepted:
+                async with context.unit_of_work:
+                    inserted = await context.aggregate.import_memberships(
+                        [membership for _, membership in accepted]
+                    )
+                    await context.unit_of_work.commit()
+                for row, membership in accepted:
+                    if membership.id.value in inserted:
+                        progress.imported += 1
+                    else:
+                        reject(row, self.CONFLICT_MESSAGE)
+                        progress.rejected += 1
+            progress.chunks += 1
+
+        return progress
+
+    def _to_membership(
+        self,
+        context: MembershipContext,
+        membership_data: MembershipCreateDTO,
+        gym_id: UUID
+    ) -> Membership:
+        return context.aggregate.new_membership(CreateMembershipInput(
+            name=membership_data.name,
+            description=membership_data.description,
+            price=membership_data.price,
+            duration=membership_data.duration_days,
+            type=membership_data.type or MembershipType.REGULAR,
+            gym_id=gym_id,
+            status=membership_data.status or MembershipStatus.ACTIVE
+        ))
@@ -0,0 +1,19 @@
+from typing import List, Optional, Sequence
+from features.membership.application.dtos.membership_dtos import MembershipResponseDTO
+from features.membership.application.errors.membership_errors import InvalidMembershipDataError
+
+# Part of every projection: clients need them to address the item and to send If-Match
+IDENTITY_FIELDS = ("id", "version")
+
+
+def validate_response_fields(fields: Optional[Sequence[str]]) -> Optional[List[str]]:
+    """Check a ?fields= projection against MembershipResponseDTO and add IDENTITY_FIELDS; None means every field"""
+    if not fields:
+        return None
+    unknown = [field for field in fields if field not in MembershipResponseDTO.model_fields]
+    if unknown:
+        raise InvalidMembershipDataError(
+            "fields",
+            f"unknown field(s) {', '.join(unknown)}; expected any of {', '.join(MembershipResponseDTO.model_fields)}"
+        )
+    return list(dict.fromkeys((*IDENTITY_FIELDS, *fields)))
@@ -1,40 +1,34 @@
-from typing import Any, Dict, Union
+from typing import Optional, Union
 from uuid import UUID
 from features.membership.application.dtos.membership_dtos import MembershipResponseDTO, MembershipUpdateDTO
 from features.membership.application.errors.membership_errors import (
     MembershipNotFoundError,
     UnauthorizedMembershipAccessError,
-    MembershipAlreadyExistsError,
-    DailyMembershipExistsError,
-    InvalidMembershipDataError
+    InvalidMembershipDataError,
+    MembershipVersionConflictError
 )
+from features.membership.application.membership_context import MembershipContext, TenantContext
 from features.membership.application.use_cases.base_use_case import BaseUseCase
 from features.membership.domain.entities.membership import Membership
-from features.membership.domain.membership_aggregate import MembershipAggregate
 from features.membership.domain.object_values.membership_id import MembershipId
 from features.membership.domain.object_values.update_membership_input import \
     UpdateMembershipInput
 
 class UpdateMembershipUseCase(BaseUseCase[MembershipResponseDTO]):
 
-    def __init__(self, membership_aggregate: MembershipAggregate, current_user: Dict[str, Any]):
-        self.membership_aggregate = membership_aggregate
-        self.current_user = current_user
-
-    async def execute(self, membership_id: Union[str, UUID], update_data: MembershipUpdateDTO) -> MembershipResponseDTO:
+    async def execute(
+        self,
+        context: MembershipContext,
+        membership_id: Union[str, UUID],
+        update_data: MembershipUpdateDTO,
+        expected_version: Optional[int] = None
+    ) -> MembershipResponseDTO:
         membership_uuid = membership_id if isinstance(
             membership_id,
             UUID) else UUID(
             membership_id)
-        existing_membership = await self.membership_aggregate.get_membership(MembershipId(membership_uuid))
+        gym_id = context.tenant.gym_id
         try:
-
-            if not existing_membership:
-                raise MembershipNotFoundError(membership_uuid)
-
-            self._check_authorization(existing_membership)
-
-
             update_membership_input = UpdateMembershipInput(
                name=update_data.name,
                description=update_data.description,
@@ -43,34 +37,31 @@ class UpdateMembershipUseCase(BaseUseCase[MembershipResponseDTO]):
                type=update_data.type,
                status=update_data.status,
             )
-            updated_membership = await self.membership_aggregate.update_membership(
+            updated_membership = await context.aggregate.update_membership(
                 MembershipId(membership_uuid),
-                update_membership_input
+                update_membership_input,
+                gym_id,
+                expected_version
             )
+        except ValueError as e:
+            raise InvalidMembershipDataError("update_data", str(e)) from e
 
-            if not updated_membership:
+        if not updated_membership:
+            # Only a failed write pays for the lookup that explains it
+            existing_membership = await context.aggregate.get_membership(MembershipId(membership_uuid))
+            if not existing_membership:
                 raise MembershipNotFoundError(membership_uuid)
+            self._check_authorization(context.tenant, existing_membership)
+            raise MembershipVersionConflictError(membership_uuid, expected_version, existing_membership.version)
 
-            return self._to_response_dto(self, updated_membership)
-
-        except ValueError as e:
-            error_message = str(e).lower()
-            if "already exists" in error_message:
-                if "daily" in error_message:
-                    raise DailyMembershipExistsError(UUID(self.current_user["id_gym"])) from e
-                else:
-                    raise MembershipAlreadyExistsError(
-                        update_data.name if update_data.name else existing_membership.name,
-                        UUID(self.current_user["id_gym"])
-                    ) from e
-            raise InvalidMembershipDataError("update_data", str(e)) from e
+        return self._to_response_dto(self, updated_membership)
 
-    def _check_authorization(self, membership: Membership) -> None:
-        user_gym_id = UUID(self.current_user["id_gym"])
+    def _check_authorization(self, tenant: TenantContext, membership: Membership) -> None:
+        user_gym_id = tenant.gym_id
         if membership.gym_id != user_gym_id:
             raise UnauthorizedMembershipAccessError(
                 membership_id=membership.id,
-                user_id=self.current_user["id"]
+                user_id=tenant.user_id
             )
 
     @staticmethod
@@ -85,5 +76,6 @@ class UpdateMembershipUseCase(BaseUseCase[MembershipResponseDTO]):
             type=membership.type,
             created_at=membership.created_at,
             updated_at=membership.updated_at,
-            gym_id=membership.gym_id
+            gym_id=membership.gym_id,
+            version=membership.version
         )
\ No newline at end of file
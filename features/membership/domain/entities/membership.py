@@ -7,7 +7,7 @@ from features.membership.domain.object_values.membership_duration import Members
 from features.membership.domain.object_values.membership_id import MembershipId
 from features.membership.domain.object_values.membership_price import MembershipPrice
 
-@dataclass
+@dataclass(slots=True)
 class Membership:
     id: MembershipId
     name: str
@@ -19,6 +19,7 @@ class Membership:
     status: MembershipStatus = field(default=MembershipStatus.ACTIVE)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    version: int = field(default=1)
 
     def to_domain(self):
         return Membership(
@@ -31,12 +32,43 @@ class Membership:
             gym_id=self.gym_id,
             status=self.status,
             created_at=self.created_at,
-            updated_at=self.updated_at
+            updated_at=self.updated_at,
+            version=self.version
         )
 
     def __post_init__(self):
         self._validate()
 
+    @classmethod
+    def restore(
+        cls,
+        id: MembershipId,
+        name: str,
+        description: str,
+        price: MembershipPrice,
+        duration: MembershipDuration,
+        type: MembershipType,
+        gym_id: UUID,
+        status: MembershipStatus,
+        created_at: datetime,
+        updated_at: datetime,
+        version: int
+    ) -> 'Membership':
+        """Rebuild a membership read from storage; it was validated when it was written"""
+        membership = object.__new__(cls)
+        membership.id = id
+        membership.name = name
+        membership.description = description
+        membership.price = price
+        membership.duration = duration
+        membership.type = type
+        membership.gym_id = gym_id
+        membership.status = status
+        membership.created_at = created_at
+        membership.updated_at = updated_at
+        membership.version = version
+        return membership
+
     def _validate(self):
         if not self.name or not self.name.strip():
             raise ValueError("Membership name cannot be empty")
@@ -99,5 +131,23 @@ class Membership:
             "type": self.type.value,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
-            "gym_id": str(self.gym_id)
-        }
\ No newline at end of file
+            "gym_id": str(self.gym_id),
+            "version": self.version
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Membership':
+        # Only fed with to_dict() output (caches, the shared catalog)
+        return cls.restore(
+            id=MembershipId.trusted(UUID(data["id"])),
+            name=data["name"],
+            description=data["description"],
+            price=MembershipPrice.from_float(data["price"]),
+            duration=MembershipDuration.from_int(data["duration_days"]),
+            status=MembershipStatus.from_value(data["status"]),
+            type=MembershipType.from_value(data["type"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            gym_id=UUID(data["gym_id"]),
+            version=data.get("version", 1)
+        )
\ No newline at end of file
@@ -5,6 +5,14 @@ class MembershipStatus(Enum):
     INACTIVE = "inactive"
     ARCHIVED = "archived"
 
+    @classmethod
+    def from_value(cls, value: str) -> 'MembershipStatus':
+        # Plain dict lookup instead of Enum.__call__
+        try:
+            return _STATUS_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
 class MembershipType(Enum):
     REGULAR = "regular"
     DAILY = "daily"
@@ -12,6 +20,13 @@ class MembershipType(Enum):
     STUDENT = "student"
     CORPORATE = "corporate"
 
+    @classmethod
+    def from_value(cls, value: str) -> 'MembershipType':
+        try:
+            return _TYPE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
     @classmethod
     def from_duration_days(cls, duration_days: int) -> 'MembershipType':
         if duration_days == 1:
@@ -19,4 +34,7 @@ class MembershipType(Enum):
         elif 2 <= duration_days <= 30:
             return cls.REGULAR
         else:
-            return cls.PREMIUM
\ No newline at end of file
+            return cls.PREMIUM
+
+_STATUS_BY_VALUE = {status.value: status for status in MembershipStatus}
+_TYPE_BY_VALUE = {membership_type.value: membership_type for membership_type in MembershipType}
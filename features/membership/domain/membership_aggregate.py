@@ -1,5 +1,11 @@
 from typing import \
-    Optional
+    Any, \
+    AsyncIterator, \
+    Dict, \
+    List, \
+    Optional, \
+    Sequence, \
+    Set
 from uuid import \
     UUID
 
@@ -9,12 +15,17 @@ from features.membership.domain.enums.membership_enums import \
     MembershipStatus
 from features.membership.domain.object_values.create_membership_input import \
     CreateMembershipInput
+from features.membership.domain.object_values.membership_cursor import \
+    MembershipCursor
 from features.membership.domain.object_values.membership_duration import \
     MembershipDuration
 from features.membership.domain.object_values.membership_id import \
     MembershipId
 from features.membership.domain.object_values.membership_price import \
     MembershipPrice
+from features.membership.domain.object_values.membership_stamp import \
+    MembershipCatalogStamp, \
+    MembershipStamp
 from features.membership.domain.object_values.update_membership_input import \
     UpdateMembershipInput
 from features.membership.domain.repository_interfaces.membership_repository import \
@@ -31,21 +42,22 @@ class MembershipAggregate:
             self,
             membership_input: CreateMembershipInput
     ) -> Membership:
-        if await self._repository.exists_with_name(
-                membership_input.name,
-                membership_input.gym_id):
-            raise ValueError(
-                f"A membership with the name '{membership_input.name}' already exists in this gym.")
+        # Name uniqueness and the single active daily pass are enforced by
+        # unique indexes; the repository maps violations to membership errors.
+        membership = self.new_membership(
+            membership_input)
 
+        return await self._repository.create(
+            membership)
+
+    def new_membership(
+            self,
+            membership_input: CreateMembershipInput
+    ) -> Membership:
         duration = MembershipDuration.from_int(
             membership_input.duration)
 
-        if duration.is_daily() and await self._repository.get_daily_membership(
-                membership_input.gym_id):
-            raise ValueError(
-                "A daily membership already exists for this gym.")
-
-        membership = Membership(
+        return Membership(
             id=MembershipId.generate(),
             name=membership_input.name,
             description=membership_input.description,
@@ -57,69 +69,79 @@ class MembershipAggregate:
             type=membership_input.type
         )
 
-        return await self._repository.create(
-            membership)
+    async def find_creation_conflicts(
+            self,
+            gym_id: UUID,
+            names: List[str]) -> tuple[Set[str], bool]:
+        # (names already used in the gym, whether an active daily pass exists)
+        return await self._repository.get_creation_conflicts(
+            gym_id,
+            names)
+
+    async def create_memberships(
+            self,
+            memberships: List[Membership]) -> List[Membership]:
+        return await self._repository.create_many(
+            memberships)
 
     async def update_membership(
             self,
             membership_id: MembershipId,
-            update_membership_input: UpdateMembershipInput
+            update_membership_input: UpdateMembershipInput,
+            gym_id: UUID,
+            expected_version: Optional[int] = None
     ) -> \
     Optional[
         Membership]:
-        membership = await self._repository.get_by_id(
-            membership_id)
-        if not membership:
-            return None
-
-        print(update_membership_input, "update_membership_input")
-
-        if update_membership_input.name is not None and update_membership_input.name != membership.name:
-            if await self._repository.exists_with_name(
-                    update_membership_input.name,
-                    membership.gym_id,
-                    exclude_id=membership_id):
-                raise ValueError(
-                    f"A membership with the name '{update_membership_input.name}' already exists in this gym.")
-
-        if update_membership_input.duration is not None and update_membership_input.duration == 1 and not membership.is_daily():
-            if await self._repository.get_daily_membership(
-                    membership.gym_id):
-                raise ValueError(
-                    "A daily membership already exists for this gym.")
-
-        if update_membership_input.name is not None:
-            membership.name = update_membership_input.name
-        if update_membership_input.description is not None:
-            membership.description = update_membership_input.description
+        if update_membership_input.name is not None and not update_membership_input.name.strip():
+            raise ValueError("Membership name cannot be empty")
+        if update_membership_input.description is not None and not update_membership_input.description.strip():
+            raise ValueError("Membership description cannot be empty")
         if update_membership_input.price is not None:
-            membership.price = MembershipPrice.from_float(
+            MembershipPrice.from_float(
                 update_membership_input.price)
         if update_membership_input.duration is not None:
-            membership.duration = MembershipDuration.from_int(
+            MembershipDuration.from_int(
                 update_membership_input.duration)
-        if update_membership_input.type is not None:
-            membership.type = update_membership_input.type
-        if update_membership_input.status is not None:
-            membership.status = update_membership_input.status
 
-        return await self._repository.update(
-            membership)
+        # Applied as a single conditional UPDATE; None means no row matched
+        # (missing, other gym or stale version).
+        return await self._repository.update_fields(
+            membership_id,
+            gym_id,
+            update_membership_input,
+            expected_version)
 
     async def delete_membership(
             self,
-            membership_id: MembershipId) -> bool:
-        membership = await self._repository.get_by_id(
-            membership_id)
-        if not membership:
-            return False
+            membership_id: MembershipId,
+            gym_id: UUID) -> bool:
+        # Single tenant-scoped DELETE that skips memberships still in use;
+        # False means missing, other gym or in use.
+        return await self._repository.delete_for_gym(
+            membership_id,
+            gym_id)
+
+    async def import_memberships(
+            self,
+            memberships: List[Membership]) -> Set[UUID]:
+        # IDs actually inserted; rows clashing with a unique index are skipped.
+        return await self._repository.import_many(
+            memberships)
 
-        if await self._repository.is_used_by_active_clients(
-                membership_id):
-            raise ValueError(
-                "Cannot delete membership: it is being used by active clients.")
+    async def delete_memberships(
+            self,
+            membership_ids: List[MembershipId],
+            gym_id: UUID) -> Set[UUID]:
+        # IDs actually deleted; the rest are missing, other gym or in use.
+        return await self._repository.delete_many_for_gym(
+            membership_ids,
+            gym_id)
 
-        return await self._repository.delete(
+    async def is_membership_in_use(
+            self,
+            membership_id: MembershipId) -> bool:
+        return await self._repository.is_used_by_active_clients(
             membership_id)
 
     async def get_membership(
@@ -130,6 +152,24 @@ class MembershipAggregate:
         return await self._repository.get_by_id(
             membership_id)
 
+    async def get_membership_row(
+            self,
+            membership_id: MembershipId,
+            fields:
+            Optional[
+                Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        # Always includes the id, gym_id, version and updated_at.
+        return await self._repository.get_row(
+            membership_id,
+            fields)
+
+    async def get_memberships(
+            self,
+            membership_ids: List[MembershipId]) -> List[Membership]:
+        return await self._repository.get_by_ids(
+            membership_ids)
+
     async def list_memberships(
             self,
             gym_id: UUID,
@@ -149,8 +189,137 @@ class MembershipAggregate:
             status,
             search)
 
+    async def list_memberships_by_cursor(
+            self,
+            gym_id: UUID,
+            size: int = 10,
+            status:
+            Optional[
+                MembershipStatus] = None,
+            search:
+            Optional[
+                str] = None,
+            cursor:
+            Optional[
+                MembershipCursor] = None
+    ) -> tuple[list[ Membership], bool]:
+        return await self._repository.get_by_gym_id_keyset(
+            gym_id,
+            size,
+            status,
+            search,
+            cursor)
+
+    async def list_membership_rows(
+            self,
+            gym_id: UUID,
+            page: int = 1,
+            size: int = 10,
+            status:
+            Optional[
+                str] = None,
+            search:
+            Optional[
+                str] = None,
+            fields:
+            Optional[
+                Sequence[str]] = None,
+            total:
+            Optional[
+                int] = None
+    ) -> tuple[List[Dict[str, Any]], int]:
+        # Same page as list_memberships, as plain rows for read-only responses,
+        # optionally limited to some response fields. A known total skips the count.
+        return await self._repository.get_rows_by_gym_id(
+            gym_id,
+            page,
+            size,
+            status,
+            search,
+            fields,
+            total)
+
+    async def list_membership_rows_by_cursor(
+            self,
+            gym_id: UUID,
+            size: int = 10,
+            status:
+            Optional[
+                str] = None,
+            search:
+            Optional[
+                str] = None,
+            cursor:
+            Optional[
+                MembershipCursor] = None,
+            fields:
+            Optional[
+                Sequence[str]] = None
+    ) -> tuple[List[Dict[str, Any]], bool]:
+        return await self._repository.get_rows_by_gym_id_keyset(
+            gym_id,
+            size,
+            status,
+            search,
+            cursor,
+            fields)
+
+    def export_memberships(
+            self,
+            gym_id: UUID,
+            status:
+            Optional[
+                str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        # Plain row batches straight from the database, no entity per row.
+        return self._repository.stream_by_gym_id(
+            gym_id,
+            status)
+
     async def get_daily_membership_for_gym(
             self,
             gym_id: UUID) ->Optional[Membership]:
         return await self._repository.get_daily_membership(
             gym_id)
+
+    async def get_daily_membership_row_for_gym(
+            self,
+            gym_id: UUID,
+            fields:
+            Optional[
+                Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        return await self._repository.get_daily_row(
+            gym_id,
+            fields)
+
+    async def get_membership_stamp(
+            self,
+            membership_id: MembershipId) -> \
+    Optional[
+        MembershipStamp]:
+        return await self._repository.get_stamp(
+            membership_id)
+
+    async def get_daily_membership_stamp_for_gym(
+            self,
+            gym_id: UUID) -> Optional[MembershipStamp]:
+        return await self._repository.get_daily_stamp(
+            gym_id)
+
+    async def get_catalog_stamp(
+            self,
+            gym_id: UUID,
+            status:
+            Optional[
+                str] = None,
+            search:
+            Optional[
+                str] = None
+    ) -> MembershipCatalogStamp:
+        # Changes whenever any membership matching the filters is created,
+        # updated or deleted.
+        return await self._repository.get_catalog_stamp(
+            gym_id,
+            status,
+            search)
@@ -0,0 +1,49 @@
+import base64
+import hashlib
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+@dataclass(frozen=True)
+class MembershipCursor:
+    created_at: datetime
+    id: uuid.UUID
+    backwards: bool = False
+    # Digest of the status/search filters the cursor was issued for; a seek
+    # position is meaningless under other filters
+    filters: str = ""
+
+    def encode(self) -> str:
+        direction = "p" if self.backwards else "n"
+        payload = f"{direction}|{self.created_at.isoformat()}|{self.id}|{self.filters}"
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> 'MembershipCursor':
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            direction, created_at, membership_id, filters = base64.urlsafe_b64decode(padded).decode().split("|")
+            if direction not in ("n", "p"):
+                raise ValueError(direction)
+            return cls(
+                created_at=datetime.fromisoformat(created_at),
+                id=uuid.UUID(membership_id),
+                backwards=direction == "p",
+                filters=filters
+            )
+        except ValueError as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+    @staticmethod
+    def filter_key(status: Optional[str], search: Optional[str]) -> str:
+        key = f"{(status or '').lower()}\x00{search or ''}"
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    @classmethod
+    def after(cls, created_at: datetime, membership_id: uuid.UUID, filters: str = "") -> 'MembershipCursor':
+        return cls(created_at, membership_id, backwards=False, filters=filters)
+
+    @classmethod
+    def before(cls, created_at: datetime, membership_id: uuid.UUID, filters: str = "") -> 'MembershipCursor':
+        return cls(created_at, membership_id, backwards=True, filters=filters)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MembershipDuration:
     days: int
 
@@ -17,7 +18,9 @@ class MembershipDuration:
         return self.days
 
     @classmethod
+    @lru_cache(maxsize=256, typed=True)
     def from_int(cls, days: int) -> 'MembershipDuration':
+        # Durations are few and immutable, so instances are shared
         return cls(days)
 
     def is_daily(self) -> bool:
@@ -1,7 +1,7 @@
 import uuid
 from dataclasses import dataclass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MembershipId:
     value: uuid.UUID
 
@@ -21,4 +21,11 @@ class MembershipId:
 
     @classmethod
     def from_string(cls, value: str) -> 'MembershipId':
-        return cls(uuid.UUID(value))
\ No newline at end of file
+        return cls(uuid.UUID(value))
+
+    @classmethod
+    def trusted(cls, value: uuid.UUID) -> 'MembershipId':
+        """Wrap a UUID that is known to be one (e.g. read from storage), skipping the checks"""
+        membership_id = object.__new__(cls)
+        object.__setattr__(membership_id, 'value', value)
+        return membership_id
\ No newline at end of file
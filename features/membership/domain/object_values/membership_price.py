@@ -1,35 +1,59 @@
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 
-@dataclass(frozen=True)
+_CENT = Decimal('0.01')
+
+@dataclass(frozen=True, slots=True)
 class MembershipPrice:
-    value: Decimal
+    """A non-negative amount, held as whole cents so storage and sums stay exact"""
+    cents: int
 
     def __post_init__(self):
-        if not isinstance(self.value, Decimal):
-            try:
-                decimal_value = Decimal(str(self.value))
-                object.__setattr__(self, 'value', decimal_value)
-            except (ValueError, InvalidOperation) as e:
-                raise ValueError("Price must be a valid decimal number") from e
-        if self.value < 0:
+        if not isinstance(self.cents, int) or isinstance(self.cents, bool):
+            raise ValueError("Price must be a whole number of cents")
+        if self.cents < 0:
             raise ValueError("Price cannot be negative")
-        # Ensure exactly 2 decimal places
-        object.__setattr__(self, 'value', self.value.quantize(Decimal('0.00')))
+
+    @property
+    def value(self) -> Decimal:
+        return Decimal(self.cents).scaleb(-2)
 
     def __str__(self) -> str:
-        return f"${self.value:.2f}"
+        return f"${self.cents // 100}.{self.cents % 100:02d}"
 
     def to_float(self) -> float:
-        return float(self.value)
+        # Correctly rounded, so it equals float() of the two-decimal amount
+        return self.cents / 100
+
+    def to_cents(self) -> int:
+        return self.cents
+
+    @classmethod
+    def from_cents(cls, cents: int) -> 'MembershipPrice':
+        return cls(cents)
 
     @classmethod
+    def from_decimal(cls, value: Decimal) -> 'MembershipPrice':
+        if not value.is_finite():
+            raise ValueError("Price must be a valid decimal number")
+        if value < 0:
+            raise ValueError("Price cannot be negative")
+        # Rounded to exactly 2 decimal places
+        return cls(int(value.quantize(_CENT) * 100))
+
+    @classmethod
+    @lru_cache(maxsize=1024, typed=True)
     def from_float(cls, value: float) -> 'MembershipPrice':
-        return cls(Decimal(str(value)))
+        # A catalog has few distinct prices; caching skips the str/Decimal/quantize round trip
+        try:
+            return cls.from_decimal(Decimal(str(value)))
+        except InvalidOperation as e:
+            raise ValueError("Price must be a valid decimal number") from e
 
     @classmethod
     def from_string(cls, value: str) -> 'MembershipPrice':
         try:
-            return cls(Decimal(value))
+            return cls.from_decimal(Decimal(value))
         except (ValueError, InvalidOperation) as e:
-            raise ValueError("Invalid price format") from e
\ No newline at end of file
+            raise ValueError("Invalid price format") from e
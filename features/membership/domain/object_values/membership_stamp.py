@@ -0,0 +1,25 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class MembershipStamp:
+    """What identifies one state of a membership, without its data"""
+    id: uuid.UUID
+    gym_id: uuid.UUID
+    version: int
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class MembershipCatalogStamp:
+    """Change markers of a (filtered) set of a gym's memberships.
+
+    The newest updated_at alone misses deletes and writes within the same
+    instant, so the row count and the sum of versions are part of it too.
+    """
+    count: int
+    last_updated_at: Optional[datetime]
+    version_sum: int
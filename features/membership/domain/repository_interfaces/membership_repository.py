@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set
 from uuid import UUID
 from features.membership.domain.entities.membership import Membership
+from features.membership.domain.object_values.membership_cursor import MembershipCursor
 from features.membership.domain.object_values.membership_id import MembershipId
+from features.membership.domain.object_values.membership_stamp import MembershipCatalogStamp, MembershipStamp
+from features.membership.domain.object_values.update_membership_input import UpdateMembershipInput
 
 class IMembershipRepository(ABC):
 
@@ -10,10 +13,34 @@ class IMembershipRepository(ABC):
     async def create(self, membership: Membership) -> Membership:
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(self, memberships: List[Membership]) -> List[Membership]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def import_many(self, memberships: List[Membership]) -> Set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_creation_conflicts(self, gym_id: UUID, names: List[str]) -> tuple[Set[str], bool]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_id(self, membership_id: MembershipId) -> Optional[Membership]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_by_ids(self, membership_ids: List[MembershipId]) -> List[Membership]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_row(
+        self,
+        membership_id: MembershipId,
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_gym_id(
         self, 
@@ -25,18 +52,106 @@ class IMembershipRepository(ABC):
     ) -> tuple[List[Membership], int]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_by_gym_id_keyset(
+        self,
+        gym_id: UUID,
+        size: int = 10,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[MembershipCursor] = None
+    ) -> tuple[List[Membership], bool]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_rows_by_gym_id(
+        self,
+        gym_id: UUID,
+        page: int = 1,
+        size: int = 10,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        total: Optional[int] = None
+    ) -> tuple[List[Dict[str, Any]], int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_rows_by_gym_id_keyset(
+        self,
+        gym_id: UUID,
+        size: int = 10,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[MembershipCursor] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> tuple[List[Dict[str, Any]], bool]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_by_gym_id(
+        self,
+        gym_id: UUID,
+        status: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_daily_row(
+        self,
+        gym_id: UUID,
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_daily_membership(self, gym_id: UUID) -> Optional[Membership]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_stamp(self, membership_id: MembershipId) -> Optional[MembershipStamp]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_daily_stamp(self, gym_id: UUID) -> Optional[MembershipStamp]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_catalog_stamp(
+        self,
+        gym_id: UUID,
+        status: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> MembershipCatalogStamp:
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, membership: Membership) -> Optional[Membership]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_fields(
+        self,
+        membership_id: MembershipId,
+        gym_id: UUID,
+        changes: UpdateMembershipInput,
+        expected_version: Optional[int] = None
+    ) -> Optional[Membership]:
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, membership_id: MembershipId) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    async def delete_for_gym(self, membership_id: MembershipId, gym_id: UUID) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many_for_gym(self, membership_ids: List[MembershipId], gym_id: UUID) -> Set[UUID]:
+        raise NotImplementedError
+
     @abstractmethod
     async def exists_with_name(self, name: str, gym_id: UUID, exclude_id: Optional[MembershipId] = None) -> bool:
         raise NotImplementedError
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, Awaitable, Callable, Optional
+
+
+class IUnitOfWork(ABC):
+
+    async def __aenter__(self) -> 'IUnitOfWork':
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> Optional[bool]:
+        # Anything not explicitly committed is discarded
+        if exc_type is not None:
+            await self.rollback()
+        return None
+
+    @abstractmethod
+    async def commit(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def savepoint(self) -> AsyncContextManager:
+        """Nested transaction; leaving it with an error undoes only its own writes"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run callback once the current transaction has been committed"""
+        raise NotImplementedError
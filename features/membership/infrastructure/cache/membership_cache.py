@@ -0,0 +1,56 @@
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from features.membership.infrastructure.cache.cache_backend import CacheBackend
+from features.membership.infrastructure.cache.memory_cache_backend import LruTtlCacheBackend
+from features.membership.infrastructure.cache.redis_cache_backend import RedisCacheBackend
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class MembershipCache:
+    """Backend, TTL and counters shared by every request of the process"""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float = 60.0):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "evictions": self.backend.evictions,
+            "invalidations": self.stats.invalidations,
+            "hit_ratio": self.stats.hits / lookups if lookups else 0.0,
+        }
+
+
+@lru_cache(maxsize=None)
+def get_membership_cache() -> Optional[MembershipCache]:
+    """Cache configured by MEMBERSHIP_CACHE (memory, redis or none)"""
+    # Off unless asked for: a per-process cache serves other workers' stale rows
+    kind = os.getenv("MEMBERSHIP_CACHE", "none").lower()
+    ttl_seconds = float(os.getenv("MEMBERSHIP_CACHE_TTL", "60"))
+    if kind == "none":
+        return None
+    if kind == "memory":
+        max_entries = int(os.getenv("MEMBERSHIP_CACHE_MAX_ENTRIES", "10000"))
+        return MembershipCache(LruTtlCacheBackend(max_entries=max_entries), ttl_seconds)
+    if kind == "redis":
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("MEMBERSHIP_CACHE=redis requires the 'redis' package") from e
+        client = redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+        return MembershipCache(RedisCacheBackend(client), ttl_seconds)
+    raise ValueError(f"Unknown MEMBERSHIP_CACHE '{kind}', expected memory, redis or none")
@@ -0,0 +1,58 @@
+import time
+from typing import Callable, Dict, Optional, Protocol, Tuple
+
+from features.membership.infrastructure.cache.cache_backend import CacheBackend
+
+
+class RedisClient(Protocol):
+    """The subset of redis.asyncio.Redis used by the cache"""
+
+    async def get(self, name: str) -> Optional[bytes]: ...
+
+    async def set(self, name: str, value: bytes, px: Optional[int] = None) -> Optional[bool]: ...
+
+    async def delete(self, *names: str) -> int: ...
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared cache for every worker; Redis applies TTLs and its own eviction policy"""
+
+    def __init__(self, client: RedisClient, prefix: str = "gym:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        await self.client.set(self.prefix + key, value, px=max(int(ttl_seconds * 1000), 1))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis (GET/SET PX/DEL only)"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._data: Dict[str, Tuple[Optional[float], bytes]] = {}
+
+    async def get(self, name: str) -> Optional[bytes]:
+        entry = self._data.get(name)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self.clock():
+            del self._data[name]
+            return None
+        return value
+
+    async def set(self, name: str, value: bytes, px: Optional[int] = None) -> Optional[bool]:
+        expires_at = self.clock() + px / 1000 if px is not None else None
+        self._data[name] = (expires_at, value)
+        return True
+
+    async def delete(self, *names: str) -> int:
+        return sum(1 for name in names if self._data.pop(name, None) is not None)
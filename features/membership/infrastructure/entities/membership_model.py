@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import BigInteger, Column, String, Integer, DateTime, ForeignKey, Index, and_, func, literal_column, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 
@@ -8,6 +8,13 @@ from dev_utils.dev_database import Base
 from features.membership.domain.enums.membership_enums import \
     MembershipStatus, \
     MembershipType
+from features.membership.infrastructure.search.text_folding import fold_search_text
+
+
+def _folded_default(source: str):
+    def default(context) -> str:
+        return fold_search_text(context.get_current_parameters().get(source))
+    return default
 
 
 class MembershipModel(Base):
@@ -15,13 +22,53 @@ class MembershipModel(Base):
     id = Column(PG_UUID(as_uuid=True), primary_key=True, index=True, default=uuid4)
     name = Column(String(100), nullable=False, index=True)
     description = Column(String(500), nullable=True)
-    price = Column(Float, nullable=False)
+    # Whole cents: exact storage and exact SUM()s
+    price_cents = Column(BigInteger, nullable=False)
     duration_days = Column(Integer, nullable=False)
     type = Column(SQLEnum(MembershipType), nullable=False)
     status = Column(SQLEnum(MembershipStatus), default=MembershipStatus.ACTIVE, nullable=False)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
     gym_id = Column(PG_UUID(as_uuid=True), ForeignKey("gyms.id"), nullable=False, index=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # Accent-folded, lowercased copies of name/description used by the search filter
+    name_folded = Column(String(100), nullable=False, default=_folded_default("name"))
+    description_folded = Column(String(500), nullable=False, default=_folded_default("description"))
+
+    NAME_UNIQUE_INDEX = "uq_memberships_gym_name"
+    DAILY_UNIQUE_INDEX = "uq_memberships_gym_active_daily"
+
+    __table_args__ = (
+        # Serves both the offset listing and the keyset (created_at, id) seek
+        Index("ix_memberships_gym_created_id", "gym_id", "created_at", "id"),
+        Index(NAME_UNIQUE_INDEX, "gym_id", "name", unique=True),
+        # At most one active daily pass per gym
+        Index(
+            DAILY_UNIQUE_INDEX,
+            "gym_id",
+            unique=True,
+            postgresql_where=and_(duration_days == 1, status == MembershipStatus.ACTIVE),
+            sqlite_where=and_(duration_days == 1, status == MembershipStatus.ACTIVE),
+        ),
+        # Trigram indexes serve the substring match, the tsvector one the ranking
+        Index(
+            "ix_memberships_name_trgm",
+            name_folded,
+            postgresql_using="gin",
+            postgresql_ops={"name_folded": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_memberships_description_trgm",
+            description_folded,
+            postgresql_using="gin",
+            postgresql_ops={"description_folded": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_memberships_search_fts",
+            func.to_tsvector(literal_column("'simple'"), name_folded + " " + description_folded),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     # Relationships
     gym = relationship("GymModel", back_populates="memberships")
@@ -31,17 +78,25 @@ class MembershipModel(Base):
 
     @classmethod
     def from_domain(cls, membership) -> 'MembershipModel':
-        return cls(
+        return cls(**cls.values_from_domain(membership))
+
+    @staticmethod
+    def values_from_domain(membership) -> dict:
+        return dict(
             id=membership.id.value,
             name=membership.name,
             description=membership.description,
-            price=membership.price.to_float(),
+            price_cents=membership.price.to_cents(),
             duration_days=membership.duration.to_int(),
             type=membership.type,
             status=membership.status,
             created_at=membership.created_at,
             updated_at=membership.updated_at,
-            gym_id=membership.gym_id
+            gym_id=membership.gym_id,
+            version=membership.version,
+            # Explicit so multi-row inserts do not depend on per-row defaults
+            name_folded=fold_search_text(membership.name),
+            description_folded=fold_search_text(membership.description)
         )
 
     def to_domain(self):
@@ -49,16 +104,16 @@ class MembershipModel(Base):
         from features.membership.domain.object_values.membership_id import MembershipId
         from features.membership.domain.object_values.membership_price import MembershipPrice
         from features.membership.domain.object_values.membership_duration import MembershipDuration
-        print(self.type, "self")
-        return Membership(
-            id=MembershipId(self.id),
+        return Membership.restore(
+            id=MembershipId.trusted(self.id),
             name=self.name,
             description=self.description,
-            price=MembershipPrice.from_float(self.price),
+            price=MembershipPrice.from_cents(self.price_cents),
             duration=MembershipDuration.from_int(self.duration_days),
             type=self.type,
             status=self.status,  # Direct enum assignment
             created_at=self.created_at,
             updated_at=self.updated_at,
-            gym_id=self.gym_id
+            gym_id=self.gym_id,
+            version=self.version
         )
\ No newline at end of file
@@ -0,0 +1,147 @@
+from typing import List, Set
+
+from sqlalchemy import Index, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateIndex
+
+from features.membership.infrastructure.entities.membership_model import MembershipModel
+from features.membership.infrastructure.search.text_folding import fold_search_text
+
+# In-place upgrades for databases created by older versions; create_all only
+# adds missing tables, never columns. Each step is a no-op once applied, and
+# inspects the schema inside the caller's transaction: init_db holds an
+# advisory lock there on PostgreSQL, so concurrent workers run them in turn.
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _membership_columns(connection: Connection) -> Set[str]:
+    return {column["name"] for column in inspect(connection).get_columns("memberships")}
+
+
+def _membership_indexes(connection: Connection) -> Set[str]:
+    return {index["name"] for index in inspect(connection).get_indexes("memberships")}
+
+
+def _create_index(connection: Connection, name: str) -> None:
+    # Rendered from the model's definition, so partial predicates and index
+    # methods stay identical to what create_all builds on a new database
+    index: Index = next(index for index in MembershipModel.__table__.indexes if index.name == name)
+    connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+def upgrade_price_to_cents(connection: Connection) -> None:
+    """Replace the float memberships.price (currency units) with integer price_cents"""
+    columns = _membership_columns(connection)
+    if "price" not in columns:
+        return
+    if "price_cents" not in columns:
+        connection.execute(text("ALTER TABLE memberships ADD COLUMN price_cents BIGINT"))
+    connection.execute(text("UPDATE memberships SET price_cents = CAST(ROUND(price * 100) AS BIGINT)"))
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("ALTER TABLE memberships ALTER COLUMN price_cents SET NOT NULL"))
+    connection.execute(text("ALTER TABLE memberships DROP COLUMN price"))
+
+
+def add_version_column(connection: Connection) -> None:
+    """Optimistic-locking counter; existing rows start at version 1"""
+    if "version" in _membership_columns(connection):
+        return
+    connection.execute(text("ALTER TABLE memberships ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+
+def add_search_columns(connection: Connection) -> None:
+    """Add name_folded/description_folded and fill them for the existing rows"""
+    columns = _membership_columns(connection)
+    if {"name_folded", "description_folded"} <= columns:
+        return
+    if "name_folded" not in columns:
+        connection.execute(text("ALTER TABLE memberships ADD COLUMN name_folded VARCHAR(100) NOT NULL DEFAULT ''"))
+    if "description_folded" not in columns:
+        connection.execute(
+            text("ALTER TABLE memberships ADD COLUMN description_folded VARCHAR(500) NOT NULL DEFAULT ''")
+        )
+    _backfill_search_columns(connection)
+    if connection.dialect.name == "postgresql":
+        # The application always writes both; the default only served the ADD COLUMN
+        connection.execute(text(
+            "ALTER TABLE memberships ALTER COLUMN name_folded DROP DEFAULT, "
+            "ALTER COLUMN description_folded DROP DEFAULT"
+        ))
+
+
+def _backfill_search_columns(connection: Connection) -> None:
+    # Folding is Unicode normalization done in Python (fold_search_text), so
+    # the rows are read and written back rather than updated in one statement.
+    # Ids are bound back exactly as the driver returned them.
+    rows = connection.execute(text("SELECT id, name, description FROM memberships")).all()
+    update = text(
+        "UPDATE memberships SET name_folded = :name_folded, description_folded = :description_folded "
+        "WHERE id = :id"
+    )
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        connection.execute(update, [
+            {
+                "id": row.id,
+                "name_folded": fold_search_text(row.name),
+                "description_folded": fold_search_text(row.description),
+            }
+            for row in rows[start:start + BACKFILL_BATCH_SIZE]
+        ])
+
+
+def add_unique_indexes(connection: Connection) -> None:
+    """Enforce one name per gym and one active daily pass per gym in the database"""
+    missing = {MembershipModel.NAME_UNIQUE_INDEX, MembershipModel.DAILY_UNIQUE_INDEX} - _membership_indexes(connection)
+    if not missing:
+        return
+    # Older versions only checked these rules in the application, so racing
+    # writers may have broken them. Which row to rename or deactivate is a
+    # business decision: report every violation and leave the schema as it was.
+    violations = _unique_violations(connection)
+    if violations:
+        raise RuntimeError(
+            "Cannot add the membership unique indexes, resolve these rows first:\n  " + "\n  ".join(violations)
+        )
+    for name in sorted(missing):
+        _create_index(connection, name)
+
+
+def _unique_violations(connection: Connection) -> List[str]:
+    names = connection.execute(text(
+        "SELECT gym_id, name, COUNT(*) AS copies FROM memberships "
+        "GROUP BY gym_id, name HAVING COUNT(*) > 1 ORDER BY gym_id, name"
+    )).all()
+    dailies = connection.execute(text(
+        "SELECT gym_id, COUNT(*) AS copies FROM memberships "
+        "WHERE duration_days = 1 AND status = 'ACTIVE' "
+        "GROUP BY gym_id HAVING COUNT(*) > 1 ORDER BY gym_id"
+    )).all()
+    return [
+        *(f"gym {row.gym_id}: {row.copies} memberships named {row.name!r}" for row in names),
+        *(f"gym {row.gym_id}: {row.copies} active daily passes" for row in dailies),
+    ]
+
+
+KEYSET_INDEX = "ix_memberships_gym_created_id"
+# PostgreSQL only (pg_trgm, created by init_db, and tsvector)
+SEARCH_INDEXES = ("ix_memberships_name_trgm", "ix_memberships_description_trgm", "ix_memberships_search_fts")
+
+
+def add_query_indexes(connection: Connection) -> None:
+    """Indexes behind the keyset listing and the text search"""
+    wanted = [KEYSET_INDEX]
+    if connection.dialect.name == "postgresql":
+        wanted.extend(SEARCH_INDEXES)
+    existing = _membership_indexes(connection)
+    for name in wanted:
+        if name not in existing:
+            _create_index(connection, name)
+
+
+def upgrade_schema(connection: Connection) -> None:
+    upgrade_price_to_cents(connection)
+    add_version_column(connection)
+    add_search_columns(connection)
+    add_unique_indexes(connection)
+    add_query_indexes(connection)
@@ -0,0 +1,42 @@
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List
+from uuid import UUID
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+async def encode_export(batches: AsyncIterator[List[Dict[str, Any]]], export_format: str) -> AsyncIterator[bytes]:
+    """Encode row batches as NDJSON or CSV, one response chunk per batch"""
+    header_written = False
+    async for batch in batches:
+        if export_format == "ndjson":
+            chunk = "".join(
+                json.dumps({key: _plain(value) for key, value in row.items()}, ensure_ascii=False) + "\n"
+                for row in batch
+            )
+        else:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            if not header_written and batch:
+                writer.writerow(batch[0].keys())
+                header_written = True
+            writer.writerows([_plain(value) for value in row.values()] for row in batch)
+            chunk = buffer.getvalue()
+        yield chunk.encode("utf-8")
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from features.membership.application.dtos.membership_dtos import MembershipImportStatusDTO
+from features.membership.application.errors.membership_errors import MembershipImportNotFoundError
+from features.membership.application.use_cases.import_memberships import ImportRow
+from features.membership.infrastructure.imports.membership_import_reader import (
+    RejectedRowsWriter,
+    iter_membership_rows
+)
+
+logger = logging.getLogger(__name__)
+
+# Runs the import use case over the chunks, updating the status in place
+ImportRunner = Callable[
+    [AsyncIterable[List[ImportRow]], MembershipImportStatusDTO, Callable[[ImportRow, str], None]],
+    Awaitable[object]
+]
+
+
+@dataclass
+class _ImportJob:
+    gym_id: UUID
+    status: MembershipImportStatusDTO
+    upload_path: str
+    rejected_path: str
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+
+class MembershipImportJobs:
+    """Background membership imports of this worker process.
+
+    The upload is spooled to a temporary file, parsed lazily and handed to the
+    runner in fixed-size chunks; rejected rows go to an NDJSON file next to it.
+    """
+
+    def __init__(self, chunk_size: int = 1000, keep_finished: int = 50, directory: Optional[str] = None):
+        self.chunk_size = chunk_size
+        self.keep_finished = keep_finished
+        self.directory = directory or tempfile.gettempdir()
+        self._jobs: Dict[UUID, _ImportJob] = {}
+
+    async def start(
+        self,
+        body: AsyncIterator[bytes],
+        import_format: str,
+        gym_id: UUID,
+        runner: ImportRunner
+    ) -> MembershipImportStatusDTO:
+        job_id = uuid4()
+        upload_path = os.path.join(self.directory, f"membership-import-{job_id}.{import_format}")
+        with open(upload_path, "wb") as upload:
+            async for chunk in body:
+                upload.write(chunk)
+
+        job = _ImportJob(
+            gym_id=gym_id,
+            status=MembershipImportStatusDTO(
+                job_id=job_id,
+                status="running",
+                format=import_format,
+                started_at=datetime.now()
+            ),
+            upload_path=upload_path,
+            rejected_path=os.path.join(self.directory, f"membership-import-{job_id}-rejected.ndjson")
+        )
+        self._forget_old_jobs()
+        self._jobs[job_id] = job
+        job.task = asyncio.create_task(self._run(job, runner))
+        return job.status
+
+    def get(self, job_id: UUID, gym_id: UUID) -> MembershipImportStatusDTO:
+        return self._job(job_id, gym_id).status
+
+    def rejected_rows_path(self, job_id: UUID, gym_id: UUID) -> str:
+        return self._job(job_id, gym_id).rejected_path
+
+    def _job(self, job_id: UUID, gym_id: UUID) -> _ImportJob:
+        job = self._jobs.get(job_id)
+        # Jobs of other gyms are reported as missing
+        if job is None or job.gym_id != gym_id:
+            raise MembershipImportNotFoundError(job_id)
+        return job
+
+    async def _run(self, job: _ImportJob, runner: ImportRunner) -> None:
+        try:
+            with open(job.upload_path, newline="", encoding="utf-8-sig") as source, \
+                    RejectedRowsWriter(job.rejected_path) as rejected:
+                rows = iter_membership_rows(source, job.status.format)
+                await runner(self._chunks(rows), job.status, rejected.write)
+            job.status.status = "completed"
+        except Exception as e:
+            logger.exception("Membership import %s failed", job.status.job_id)
+            job.status.status = "failed"
+            job.status.error = str(e)
+        finally:
+            job.status.finished_at = datetime.now()
+            os.remove(job.upload_path)
+
+    async def _chunks(self, rows) -> AsyncIterator[List[ImportRow]]:
+        while True:
+            # Parsing happens off the event loop
+            chunk = await asyncio.to_thread(lambda: list(islice(rows, self.chunk_size)))
+            if not chunk:
+                return
+            yield chunk
+
+    def _forget_old_jobs(self) -> None:
+        finished = [job for job in self._jobs.values() if job.status.finished_at is not None]
+        finished.sort(key=lambda job: job.status.finished_at)
+        for job in finished[:max(len(finished) - self.keep_finished + 1, 0)]:
+            del self._jobs[job.status.job_id]
+            if os.path.exists(job.rejected_path):
+                os.remove(job.rejected_path)
+
+
+membership_import_jobs = MembershipImportJobs()
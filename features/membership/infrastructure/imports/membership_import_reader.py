@@ -0,0 +1,78 @@
+import csv
+import json
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+from features.membership.application.use_cases.import_memberships import ImportRow
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+def detect_import_format(content_type: Optional[str]) -> Optional[str]:
+    """Import format implied by a Content-Type header, if any"""
+    if not content_type:
+        return None
+    return _CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+
+
+def iter_membership_rows(source: TextIO, import_format: str) -> Iterator[ImportRow]:
+    """Lazily parse rows from an open text file, one at a time"""
+    if import_format == "csv":
+        reader = csv.DictReader(source)
+        for row in reader:
+            yield ImportRow(reader.line_num, _clean(row))
+        return
+
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ImportRow(line_number, {"raw": line.rstrip("\n")}, f"invalid JSON: {e.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRow(line_number, {"raw": data}, "expected a JSON object")
+            continue
+        yield ImportRow(line_number, _clean(data))
+
+
+def _clean(row: Dict[Any, Any]) -> Dict[str, Any]:
+    # Empty CSV cells fall back to the DTO defaults; surplus cells (key None) are dropped
+    cleaned = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        cleaned[str(key).strip()] = value
+    return cleaned
+
+
+class RejectedRowsWriter:
+    """Appends rejected rows as NDJSON: {"line": ..., "error": ..., "row": {...}}"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, row: ImportRow, error: str) -> None:
+        self._file.write(json.dumps({"line": row.line, "error": error, "row": row.data}, default=str) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'RejectedRowsWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
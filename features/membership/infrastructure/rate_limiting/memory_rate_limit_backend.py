@@ -0,0 +1,40 @@
+import time
+from collections import OrderedDict
+from typing import Callable, List
+
+from features.membership.infrastructure.rate_limiting.rate_limit_backend import RateLimit, RateLimitBackend
+
+
+class TokenBucketRateLimitBackend(RateLimitBackend):
+    """In-process token buckets; each worker process counts on its own.
+
+    Holds at most max_keys buckets, dropping the least recently used. A
+    dropped bucket comes back full, so eviction can only be lenient.
+    """
+
+    def __init__(self, max_keys: int = 100000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        # key -> [tokens, updated_at], mutated in place
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    async def acquire(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        now = self.clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [limit.burst, now]
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            tokens = bucket[0] + (now - bucket[1]) * limit.rate_per_second
+            bucket[0] = tokens if tokens < limit.burst else limit.burst
+            bucket[1] = now
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return 0.0
+        return (cost - bucket[0]) / limit.rate_per_second
+
+    def __len__(self) -> int:
+        return len(self._buckets)
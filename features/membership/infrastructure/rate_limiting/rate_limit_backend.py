@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """Token bucket refilled at rate_per_second, holding at most burst tokens"""
+    rate_per_second: float
+    burst: float
+
+    def __post_init__(self):
+        if self.rate_per_second <= 0 or self.burst < 1:
+            raise ValueError("A rate limit needs a positive rate and a burst of at least 1")
+
+
+class RateLimitBackend(ABC):
+    """Token buckets by key"""
+
+    @abstractmethod
+    async def acquire(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        """Takes cost tokens from the bucket of key.
+
+        Returns 0 when they were taken, otherwise the seconds until the
+        bucket will hold them (nothing is taken then).
+        """
+        raise NotImplementedError
@@ -0,0 +1,119 @@
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+from features.membership.infrastructure.rate_limiting.memory_rate_limit_backend import TokenBucketRateLimitBackend
+from features.membership.infrastructure.rate_limiting.rate_limit_backend import RateLimit, RateLimitBackend
+from features.membership.infrastructure.rate_limiting.redis_rate_limit_backend import RedisRateLimitBackend
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RateLimitStats:
+    allowed: int = 0
+    limited: int = 0
+    backend_errors: int = 0
+
+
+class RateLimiter:
+    """Per-user and per-gym token buckets shared by every request of the process.
+
+    A request takes a token from its user's bucket, sized by the most
+    generous of the user's scopes, and then from its gym's bucket, so one
+    busy integration cannot use up the gym's whole quota and one gym cannot
+    use up the API. When the backend fails, requests are let through.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        scope_limits: Mapping[str, RateLimit],
+        default_limit: RateLimit,
+        gym_limit: Optional[RateLimit] = None
+    ):
+        self.backend = backend
+        self.scope_limits = dict(scope_limits)
+        self.default_limit = default_limit
+        self.gym_limit = gym_limit
+        self.stats = RateLimitStats()
+
+    def user_limit(self, scopes: Sequence[str]) -> RateLimit:
+        limit = None
+        for scope, scope_limit in self.scope_limits.items():
+            if scope in scopes and (limit is None or scope_limit.rate_per_second > limit.rate_per_second):
+                limit = scope_limit
+        return limit if limit is not None else self.default_limit
+
+    async def acquire(self, gym_id: str, user_id: str, scopes: Sequence[str]) -> float:
+        """0 when the request may go ahead, otherwise the seconds to wait before retrying"""
+        try:
+            wait = await self.backend.acquire(f"user:{gym_id}:{user_id}", self.user_limit(scopes))
+            if not wait and self.gym_limit is not None:
+                wait = await self.backend.acquire(f"gym:{gym_id}", self.gym_limit)
+        except Exception:
+            self.stats.backend_errors += 1
+            logger.warning("Rate limit backend failed; letting the request through", exc_info=True)
+            return 0.0
+        if wait:
+            self.stats.limited += 1
+        else:
+            self.stats.allowed += 1
+        return wait
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "allowed": self.stats.allowed,
+            "limited": self.stats.limited,
+            "backend_errors": self.stats.backend_errors,
+        }
+
+
+def parse_rate_limit(value: str) -> RateLimit:
+    """'<requests per second>:<burst>', e.g. '10:20'"""
+    try:
+        rate, burst = value.split(":")
+        return RateLimit(float(rate), float(burst))
+    except ValueError as e:
+        raise ValueError(f"Invalid rate limit '{value}', expected '<rate per second>:<burst>'") from e
+
+
+def parse_scope_limits(value: str) -> Dict[str, RateLimit]:
+    """'<scope>=<rate>:<burst>,...', e.g. 'gym:admin=20:40,gym:worker=10:20'"""
+    limits = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        scope, separator, limit = item.rpartition("=")
+        if not separator:
+            raise ValueError(f"Invalid scope rate limit '{item}', expected '<scope>=<rate per second>:<burst>'")
+        limits[scope] = parse_rate_limit(limit)
+    return limits
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Rate limiter configured by RATE_LIMIT (memory, redis or none)"""
+    kind = os.getenv("RATE_LIMIT", "memory").lower()
+    if kind == "none":
+        return None
+    if kind == "memory":
+        backend: RateLimitBackend = TokenBucketRateLimitBackend(
+            max_keys=int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+        )
+    elif kind == "redis":
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT=redis requires the 'redis' package") from e
+        backend = RedisRateLimitBackend(redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0")))
+    else:
+        raise ValueError(f"Unknown RATE_LIMIT '{kind}', expected memory, redis or none")
+    gym_limit = os.getenv("RATE_LIMIT_GYM", "100:200")
+    return RateLimiter(
+        backend,
+        parse_scope_limits(os.getenv("RATE_LIMIT_SCOPES", "gym:superadmin=50:100,gym:admin=20:40,gym:worker=10:20")),
+        parse_rate_limit(os.getenv("RATE_LIMIT_DEFAULT", "10:20")),
+        gym_limit=None if gym_limit.lower() == "none" else parse_rate_limit(gym_limit)
+    )
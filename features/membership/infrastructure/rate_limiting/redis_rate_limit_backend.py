@@ -0,0 +1,78 @@
+import time
+from typing import Any, Callable, Dict, Protocol, Tuple
+
+from features.membership.infrastructure.rate_limiting.rate_limit_backend import RateLimit, RateLimitBackend
+
+# Same algorithm as TokenBucketRateLimitBackend, run atomically next to the data.
+# Redis' own clock is used so workers with skewed clocks agree.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1])
+if tokens == nil then
+    tokens = burst
+else
+    tokens = math.min(burst, tokens + (now - tonumber(bucket[2])) * rate)
+end
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+else
+    wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class RedisScriptClient(Protocol):
+    """The subset of redis.asyncio.Redis used by the rate limiter"""
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any: ...
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Token buckets shared by every worker; costs one round trip per acquire"""
+
+    def __init__(self, client: RedisScriptClient, prefix: str = "gym:ratelimit:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def acquire(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        wait = await self.client.eval(
+            TOKEN_BUCKET_SCRIPT, 1, self.prefix + key, limit.rate_per_second, limit.burst, cost
+        )
+        return float(wait)
+
+
+class FakeRedisTokenBuckets:
+    """In-memory stand-in for redis.asyncio.Redis that runs TOKEN_BUCKET_SCRIPT in Python"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        # key -> (tokens, updated_at, expires_at)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        if script != TOKEN_BUCKET_SCRIPT or numkeys != 1:
+            raise NotImplementedError("FakeRedisTokenBuckets only runs TOKEN_BUCKET_SCRIPT")
+        key, rate, burst, cost = keys_and_args
+        rate, burst, cost = float(rate), float(burst), float(cost)
+        now = self.clock()
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket[2] <= now:
+            tokens = burst
+        else:
+            tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+        wait = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            wait = (cost - tokens) / rate
+        self._buckets[key] = (tokens, now, now + burst / rate + 1.0)
+        return str(wait).encode()
@@ -0,0 +1,96 @@
+import json
+from typing import Iterable, Optional
+from uuid import UUID
+
+from features.membership.domain.entities.membership import Membership
+from features.membership.domain.object_values.membership_id import MembershipId
+from features.membership.domain.repository_interfaces.membership_repository import IMembershipRepository
+from features.membership.domain.repository_interfaces.unit_of_work import IUnitOfWork
+from features.membership.infrastructure.cache.membership_cache import MembershipCache
+from features.membership.infrastructure.repositories.membership_repository_decorator import MembershipRepositoryDecorator
+
+# Cached "no daily pass" answer, so gyms without one do not hit the database either
+_NONE = b"null"
+
+
+# Read-through cache for single-membership lookups (by id and the gym's daily
+# pass). Every write drops the keys it touches when it is issued and again
+# after the unit of work commits, so a read racing the transaction cannot
+# keep a stale row cached. Lists and counts always go to the database.
+# Without fill (sessions on a lagging replica) hits are served but misses
+# are not stored, so replica lag is never frozen into the cache.
+class CachedMembershipRepository(MembershipRepositoryDecorator):
+
+    def __init__(
+        self,
+        repository: IMembershipRepository,
+        cache: MembershipCache,
+        unit_of_work: Optional[IUnitOfWork] = None,
+        fill: bool = True
+    ):
+        super().__init__(repository)
+        self.cache = cache
+        self.unit_of_work = unit_of_work
+        self.fill = fill
+
+    @staticmethod
+    def membership_key(membership_id: UUID) -> str:
+        return f"membership:{membership_id}"
+
+    @staticmethod
+    def daily_key(gym_id: UUID) -> str:
+        return f"membership:gym:{gym_id}:daily"
+
+    # Reads
+
+    async def get_by_id(self, membership_id: MembershipId) -> Optional[Membership]:
+        key = self.membership_key(membership_id.value)
+        cached = await self.cache.backend.get(key)
+        if cached is not None:
+            self.cache.stats.hits += 1
+            return self._decode(cached)
+
+        self.cache.stats.misses += 1
+        membership = await self.repository.get_by_id(membership_id)
+        if membership is not None and self.fill:
+            await self.cache.backend.set(key, self._encode(membership), self.cache.ttl_seconds)
+        return membership
+
+    async def get_daily_membership(self, gym_id: UUID) -> Optional[Membership]:
+        key = self.daily_key(gym_id)
+        cached = await self.cache.backend.get(key)
+        if cached is not None:
+            self.cache.stats.hits += 1
+            return self._decode(cached)
+
+        self.cache.stats.misses += 1
+        membership = await self.repository.get_daily_membership(gym_id)
+        if self.fill:
+            await self.cache.backend.set(key, self._encode(membership), self.cache.ttl_seconds)
+        return membership
+
+    async def _on_write(self, membership_ids: Iterable[UUID], gym_ids: Iterable[UUID]) -> None:
+        keys = [self.membership_key(membership_id) for membership_id in membership_ids]
+        keys += [self.daily_key(gym_id) for gym_id in gym_ids]
+        if not keys:
+            return
+
+        async def drop() -> None:
+            await self.cache.backend.delete(*keys)
+
+        self.cache.stats.invalidations += len(keys)
+        await drop()
+        if self.unit_of_work is not None:
+            self.unit_of_work.after_commit(drop)
+
+    @staticmethod
+    def _encode(membership: Optional[Membership]) -> bytes:
+        if membership is None:
+            return _NONE
+        return json.dumps(membership.to_dict()).encode()
+
+    @staticmethod
+    def _decode(value: bytes) -> Optional[Membership]:
+        if value == _NONE:
+            return None
+        return Membership.from_dict(json.loads(value))
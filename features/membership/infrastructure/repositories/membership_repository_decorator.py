@@ -0,0 +1,179 @@
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set
+from uuid import UUID
+
+from features.membership.domain.entities.membership import Membership
+from features.membership.domain.object_values.membership_cursor import MembershipCursor
+from features.membership.domain.object_values.membership_id import MembershipId
+from features.membership.domain.object_values.membership_stamp import MembershipCatalogStamp, MembershipStamp
+from features.membership.domain.object_values.update_membership_input import UpdateMembershipInput
+from features.membership.domain.repository_interfaces.membership_repository import IMembershipRepository
+
+
+# Forwards every call to the wrapped repository. Each successful write reports
+# the memberships and gyms it touched to _on_write, so decorators that cache
+# reads usually only override the reads they serve plus that hook.
+class MembershipRepositoryDecorator(IMembershipRepository):
+
+    def __init__(self, repository: IMembershipRepository):
+        self.repository = repository
+
+    async def create(self, membership: Membership) -> Membership:
+        created = await self.repository.create(membership)
+        await self._on_write([created.id.value], [created.gym_id])
+        return created
+
+    async def create_many(self, memberships: List[Membership]) -> List[Membership]:
+        created = await self.repository.create_many(memberships)
+        if created:
+            await self._on_write(
+                [membership.id.value for membership in created],
+                {membership.gym_id for membership in created}
+            )
+        return created
+
+    async def import_many(self, memberships: List[Membership]) -> Set[UUID]:
+        inserted = await self.repository.import_many(memberships)
+        if inserted:
+            await self._on_write(
+                inserted,
+                {membership.gym_id for membership in memberships if membership.id.value in inserted}
+            )
+        return inserted
+
+    async def get_creation_conflicts(self, gym_id: UUID, names: List[str]) -> tuple[Set[str], bool]:
+        return await self.repository.get_creation_conflicts(gym_id, names)
+
+    async def get_by_id(self, membership_id: MembershipId) -> Optional[Membership]:
+        return await self.repository.get_by_id(membership_id)
+
+    async def get_by_ids(self, membership_ids: List[MembershipId]) -> List[Membership]:
+        return await self.repository.get_by_ids(membership_ids)
+
+    async def get_row(
+        self,
+        membership_id: MembershipId,
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        return await self.repository.get_row(membership_id, fields)
+
+    async def get_by_gym_id(
+        self,
+        gym_id: UUID,
+        page: int = 1,
+        size: int = 10,
+        status: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> tuple[List[Membership], int]:
+        return await self.repository.get_by_gym_id(gym_id, page, size, status, search)
+
+    async def get_by_gym_id_keyset(
+        self,
+        gym_id: UUID,
+        size: int = 10,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[MembershipCursor] = None
+    ) -> tuple[List[Membership], bool]:
+        return await self.repository.get_by_gym_id_keyset(gym_id, size, status, search, cursor)
+
+    async def get_rows_by_gym_id(
+        self,
+        gym_id: UUID,
+        page: int = 1,
+        size: int = 10,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        total: Optional[int] = None
+    ) -> tuple[List[Dict[str, Any]], int]:
+        return await self.repository.get_rows_by_gym_id(gym_id, page, size, status, search, fields, total)
+
+    async def get_rows_by_gym_id_keyset(
+        self,
+        gym_id: UUID,
+        size: int = 10,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[MembershipCursor] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> tuple[List[Dict[str, Any]], bool]:
+        return await self.repository.get_rows_by_gym_id_keyset(gym_id, size, status, search, cursor, fields)
+
+    def stream_by_gym_id(
+        self,
+        gym_id: UUID,
+        status: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        return self.repository.stream_by_gym_id(gym_id, status, batch_size)
+
+    async def get_daily_row(
+        self,
+        gym_id: UUID,
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        return await self.repository.get_daily_row(gym_id, fields)
+
+    async def get_daily_membership(self, gym_id: UUID) -> Optional[Membership]:
+        return await self.repository.get_daily_membership(gym_id)
+
+    async def get_stamp(self, membership_id: MembershipId) -> Optional[MembershipStamp]:
+        return await self.repository.get_stamp(membership_id)
+
+    async def get_daily_stamp(self, gym_id: UUID) -> Optional[MembershipStamp]:
+        return await self.repository.get_daily_stamp(gym_id)
+
+    async def get_catalog_stamp(
+        self,
+        gym_id: UUID,
+        status: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> MembershipCatalogStamp:
+        return await self.repository.get_catalog_stamp(gym_id, status, search)
+
+    async def update(self, membership: Membership) -> Optional[Membership]:
+        updated = await self.repository.update(membership)
+        if updated is not None:
+            await self._on_write([updated.id.value], [updated.gym_id])
+        return updated
+
+    async def update_fields(
+        self,
+        membership_id: MembershipId,
+        gym_id: UUID,
+        changes: UpdateMembershipInput,
+        expected_version: Optional[int] = None
+    ) -> Optional[Membership]:
+        updated = await self.repository.update_fields(membership_id, gym_id, changes, expected_version)
+        if updated is not None:
+            await self._on_write([membership_id.value], [gym_id])
+        return updated
+
+    async def delete(self, membership_id: MembershipId) -> bool:
+        # Not tenant-scoped, so the gym has to be looked up first
+        existing = await self.repository.get_by_id(membership_id)
+        deleted = await self.repository.delete(membership_id)
+        if deleted:
+            await self._on_write([membership_id.value], [existing.gym_id] if existing else [])
+        return deleted
+
+    async def delete_for_gym(self, membership_id: MembershipId, gym_id: UUID) -> bool:
+        deleted = await self.repository.delete_for_gym(membership_id, gym_id)
+        if deleted:
+            await self._on_write([membership_id.value], [gym_id])
+        return deleted
+
+    async def delete_many_for_gym(self, membership_ids: List[MembershipId], gym_id: UUID) -> Set[UUID]:
+        deleted = await self.repository.delete_many_for_gym(membership_ids, gym_id)
+        if deleted:
+            await self._on_write(deleted, [gym_id])
+        return deleted
+
+    async def exists_with_name(self, name: str, gym_id: UUID, exclude_id: Optional[MembershipId] = None) -> bool:
+        return await self.repository.exists_with_name(name, gym_id, exclude_id)
+
+    async def is_used_by_active_clients(self, membership_id: MembershipId) -> bool:
+        return await self.repository.is_used_by_active_clients(membership_id)
+
+    async def _on_write(self, membership_ids: Iterable[UUID], gym_ids: Iterable[UUID]) -> None:
+        pass
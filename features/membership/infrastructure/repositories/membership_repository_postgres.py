@@ -1,26 +1,185 @@
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, NoReturn, Optional, Sequence, Set
 from uuid import UUID
 
-from sqlalchemy import select, update, delete, and_, or_
+from enum import Enum
+
+from sqlalchemy import Float, Select, cast, select, insert, update, delete, and_, or_, not_, false, func, tuple_, text, table, column
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from features.membership.application.errors.membership_errors import (
+    MembershipAlreadyExistsError,
+    DailyMembershipExistsError
+)
 from features.membership.domain.entities.membership import Membership
+from features.membership.domain.object_values.membership_cursor import MembershipCursor
 from features.membership.domain.object_values.membership_id import MembershipId
+from features.membership.domain.object_values.membership_price import MembershipPrice
+from features.membership.domain.object_values.membership_stamp import MembershipCatalogStamp, MembershipStamp
+from features.membership.domain.object_values.update_membership_input import UpdateMembershipInput
 from features.membership.domain.repository_interfaces.membership_repository import IMembershipRepository
 from features.membership.infrastructure.entities.membership_model import MembershipModel
+from features.membership.infrastructure.search.membership_search import MembershipSearch, search_for_dialect
+from features.membership.infrastructure.search.text_folding import fold_search_text
+
+# Temporary table that import chunks are COPY'd into before the merge
+IMPORT_STAGING_TABLE = "memberships_import_staging"
+
+# Price in currency units for rows read without an entity. The division runs in
+# double precision, which gives the same float as MembershipPrice.to_float().
+PRICE_COLUMN = (cast(MembershipModel.price_cents, Float) / 100).label("price")
+
+# Columns written by exports, in output order
+EXPORT_COLUMNS = (
+    MembershipModel.id,
+    MembershipModel.name,
+    MembershipModel.description,
+    PRICE_COLUMN,
+    MembershipModel.duration_days,
+    MembershipModel.type,
+    MembershipModel.status,
+    MembershipModel.created_at,
+    MembershipModel.updated_at,
+    MembershipModel.version,
+)
+
+# Columns of a MembershipResponseDTO, for reads serialized straight from rows
+RESPONSE_COLUMNS = (*EXPORT_COLUMNS, MembershipModel.gym_id)
 
+
+def response_columns(fields: Optional[Sequence[str]], *required: str) -> tuple:
+    """The response columns named in fields (a ?fields= projection) plus the required ones; all when None"""
+    if not fields:
+        return RESPONSE_COLUMNS
+    names = {*fields, *required}
+    return tuple(column for column in RESPONSE_COLUMNS if column.key in names)
+
+
+# Columns of a MembershipStamp, in field order
+STAMP_COLUMNS = (
+    MembershipModel.id,
+    MembershipModel.gym_id,
+    MembershipModel.version,
+    MembershipModel.updated_at,
+)
+# Always read by single-row projections: the tenant check and the validators need them
+STAMP_FIELDS = tuple(column.key for column in STAMP_COLUMNS)
+
+# Writes are sent immediately but never committed here; the application layer
+# owns the transaction through IUnitOfWork.
 class MembershipRepositoryPostgres(IMembershipRepository):
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, search: Optional[MembershipSearch] = None):
         self.session = session
+        self.search = search or search_for_dialect(session.bind.dialect.name)
     
     async def create(self, membership: Membership) -> Membership:
-        membership_model = MembershipModel.from_domain(membership)
-        self.session.add(membership_model)
-        await self.session.commit()
-        await self.session.refresh(membership_model)
-        print(membership_model, "membership_model")
+        statement = (
+            insert(MembershipModel)
+            .values(**MembershipModel.values_from_domain(membership))
+            .returning(MembershipModel)
+        )
+        try:
+            result = await self.session.execute(statement)
+            membership_model = result.scalar_one()
+        except IntegrityError as e:
+            await self._raise_constraint_error(e, membership.name, membership.gym_id)
         return membership_model.to_domain()
+
+    async def create_many(self, memberships: List[Membership]) -> List[Membership]:
+        if not memberships:
+            return []
+        # One multi-row INSERT ... VALUES (...), (...) RETURNING *
+        statement = (
+            insert(MembershipModel)
+            .values([MembershipModel.values_from_domain(membership) for membership in memberships])
+            .returning(MembershipModel)
+        )
+        try:
+            result = await self.session.execute(statement)
+            models = {model.id: model for model in result.scalars().all()}
+        except IntegrityError as e:
+            # Only reachable when a concurrent writer won the race after the
+            # caller's conflict check; the whole statement is rejected
+            await self._raise_constraint_error(
+                e,
+                ", ".join(membership.name for membership in memberships),
+                memberships[0].gym_id
+            )
+        return [models[membership.id.value].to_domain() for membership in memberships]
+
+    async def import_many(self, memberships: List[Membership]) -> Set[UUID]:
+        if not memberships:
+            return set()
+        rows = [MembershipModel.values_from_domain(membership) for membership in memberships]
+        dialect = self.session.bind.dialect
+        if dialect.name == "postgresql" and dialect.driver == "asyncpg":
+            return await self._copy_and_merge(rows)
+
+        insert_for_dialect = postgresql_insert if dialect.name == "postgresql" else sqlite_insert
+        result = await self.session.execute(
+            insert_for_dialect(MembershipModel.__table__)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(MembershipModel.id)
+        )
+        return set(result.scalars().all())
+
+    async def _copy_and_merge(self, rows: List[dict]) -> Set[UUID]:
+        # COPY the chunk into a transaction-scoped staging table, then merge it
+        # with INSERT ... SELECT ... ON CONFLICT DO NOTHING so rows clashing
+        # with the name or daily-pass indexes are skipped instead of failing.
+        columns = list(rows[0])
+        connection = await self.session.connection()
+        await connection.execute(text(
+            f"CREATE TEMP TABLE {IMPORT_STAGING_TABLE} "
+            "(LIKE memberships INCLUDING DEFAULTS) ON COMMIT DROP"
+        ))
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            IMPORT_STAGING_TABLE,
+            records=[
+                # SQLAlchemy stores enums by name
+                tuple(row[name].name if isinstance(row[name], Enum) else row[name] for name in columns)
+                for row in rows
+            ],
+            columns=columns
+        )
+
+        staging = table(IMPORT_STAGING_TABLE, *(column(name) for name in columns))
+        result = await connection.execute(
+            postgresql_insert(MembershipModel.__table__)
+            .from_select(columns, select(*staging.c))
+            .on_conflict_do_nothing()
+            .returning(MembershipModel.id)
+        )
+        return set(result.scalars().all())
+
+    async def get_creation_conflicts(self, gym_id: UUID, names: List[str]) -> tuple[Set[str], bool]:
+        from features.membership.domain.enums.membership_enums import MembershipStatus
+        # Names already taken plus whether an active daily pass exists, in one query
+        active_daily = and_(
+            MembershipModel.duration_days == 1,
+            MembershipModel.status == MembershipStatus.ACTIVE
+        )
+        result = await self.session.execute(
+            select(MembershipModel.name, active_daily)
+            .where(
+                MembershipModel.gym_id == gym_id,
+                or_(MembershipModel.name.in_(names), active_daily)
+            )
+        )
+        requested = set(names)
+        taken_names: Set[str] = set()
+        has_active_daily = False
+        for name, is_active_daily in result.all():
+            if name in requested:
+                taken_names.add(name)
+            has_active_daily = has_active_daily or bool(is_active_daily)
+        return taken_names, has_active_daily
     
     async def get_by_id(self, membership_id: MembershipId) -> Optional[Membership]:
         result = await self.session.execute(
@@ -28,7 +187,26 @@ class MembershipRepositoryPostgres(IMembershipRepository):
         )
         membership_model = result.scalar_one_or_none()
         return membership_model.to_domain() if membership_model else None
+
+    async def get_by_ids(self, membership_ids: List[MembershipId]) -> List[Membership]:
+        if not membership_ids:
+            return []
+        result = await self.session.execute(
+            select(MembershipModel).where(MembershipModel.id.in_([membership_id.value for membership_id in membership_ids]))
+        )
+        return [model.to_domain() for model in result.scalars().all()]
     
+    async def get_row(
+        self,
+        membership_id: MembershipId,
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        result = await self.session.execute(
+            select(*response_columns(fields, *STAMP_FIELDS)).where(MembershipModel.id == membership_id.value)
+        )
+        row = result.mappings().one_or_none()
+        return dict(row) if row else None
+
     async def get_by_gym_id(
         self, 
         gym_id: UUID,
@@ -37,43 +215,180 @@ class MembershipRepositoryPostgres(IMembershipRepository):
         status: Optional[str] = None,
         search: Optional[str] = None
     ) -> tuple[List[Membership], int]:
-        query = select(MembershipModel).where(MembershipModel.gym_id == gym_id)
+        total = await self._count(gym_id, status, search)
+        result = await self.session.execute(
+            self._page_query(select(MembershipModel), gym_id, page, size, status, search)
+        )
+        memberships = [model.to_domain() for model in result.scalars().all()]
         
+        return memberships, total
+
+    async def get_rows_by_gym_id(
+        self,
+        gym_id: UUID,
+        page: int = 1,
+        size: int = 10,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        total: Optional[int] = None
+    ) -> tuple[List[Dict[str, Any]], int]:
+        # A total the caller already knows (e.g. the catalog stamp's count) saves the count query
+        if total is None:
+            total = await self._count(gym_id, status, search)
+        result = await self.session.execute(
+            self._page_query(select(*response_columns(fields)), gym_id, page, size, status, search)
+        )
+        return [dict(row) for row in result.mappings().all()], total
+
+    async def _count(self, gym_id: UUID, status: Optional[str], search: Optional[str]) -> int:
+        result = await self.session.execute(
+            select(func.count()).select_from(MembershipModel).where(*self._build_filters(gym_id, status, search))
+        )
+        return result.scalar_one()
+
+    def _page_query(
+        self,
+        query: Select,
+        gym_id: UUID,
+        page: int,
+        size: int,
+        status: Optional[str],
+        search: Optional[str]
+    ) -> Select:
+        # The id breaks created_at ties, so pages never overlap or skip rows
+        # and match the snapshot's order
+        order_by = [MembershipModel.created_at.desc(), MembershipModel.id.desc()]
+        rank = self.search.rank(search) if search else None
+        if rank is not None:
+            order_by.insert(0, rank.desc())
+
+        offset = (page - 1) * size
+        return (
+            query
+            .where(*self._build_filters(gym_id, status, search))
+            .order_by(*order_by)
+            .offset(offset)
+            .limit(size)
+        )
+    
+    async def get_by_gym_id_keyset(
+        self,
+        gym_id: UUID,
+        size: int = 10,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[MembershipCursor] = None
+    ) -> tuple[List[Membership], bool]:
+        result = await self.session.execute(
+            self._keyset_query(select(MembershipModel), gym_id, size, status, search, cursor)
+        )
+        models, has_more = self._keyset_page(result.scalars().all(), size, cursor)
+        return [model.to_domain() for model in models], has_more
+
+    async def get_rows_by_gym_id_keyset(
+        self,
+        gym_id: UUID,
+        size: int = 10,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[MembershipCursor] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> tuple[List[Dict[str, Any]], bool]:
+        # The sort key is always read, the page's cursors are built from it,
+        # and so is the version, for the page's ETag
+        columns = response_columns(fields, "created_at", "id", "version")
+        result = await self.session.execute(
+            self._keyset_query(select(*columns), gym_id, size, status, search, cursor)
+        )
+        rows, has_more = self._keyset_page(result.mappings().all(), size, cursor)
+        return [dict(row) for row in rows], has_more
+
+    def _keyset_query(
+        self,
+        query: Select,
+        gym_id: UUID,
+        size: int,
+        status: Optional[str],
+        search: Optional[str],
+        cursor: Optional[MembershipCursor]
+    ) -> Select:
+        filters = self._build_filters(gym_id, status, search)
+        sort_key = tuple_(MembershipModel.created_at, MembershipModel.id)
+        backwards = cursor is not None and cursor.backwards
+
+        if cursor is not None:
+            boundary = tuple_(cursor.created_at, cursor.id)
+            filters.append(sort_key > boundary if backwards else sort_key < boundary)
+
+        if backwards:
+            order_by = (MembershipModel.created_at.asc(), MembershipModel.id.asc())
+        else:
+            order_by = (MembershipModel.created_at.desc(), MembershipModel.id.desc())
+
+        # One extra row tells us whether another page exists in this direction
+        return query.where(*filters).order_by(*order_by).limit(size + 1)
+
+    @staticmethod
+    def _keyset_page(rows: Sequence[Any], size: int, cursor: Optional[MembershipCursor]) -> tuple[List[Any], bool]:
+        has_more = len(rows) > size
+        rows = list(rows[:size])
+        if cursor is not None and cursor.backwards:
+            rows.reverse()
+        return rows, has_more
+
+    async def stream_by_gym_id(
+        self,
+        gym_id: UUID,
+        status: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        # Server-side cursor read in batches of plain column mappings, so only
+        # one batch is in memory and no ORM object or entity is built per row
+        result = await self.session.stream(
+            select(*EXPORT_COLUMNS)
+            .where(*self._build_filters(gym_id, status))
+            .order_by(MembershipModel.created_at, MembershipModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+
+    def _build_filters(
+        self,
+        gym_id: UUID,
+        status: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> List[ColumnElement[bool]]:
         from features.membership.domain.enums.membership_enums import MembershipStatus
-        status_enum = None
+        filters: List[ColumnElement[bool]] = [MembershipModel.gym_id == gym_id]
+
         if status:
             status_enum = MembershipStatus.ACTIVE if status.lower() == "active" else MembershipStatus.INACTIVE
-            query = query.where(MembershipModel.status == status_enum)
-        
-        if search:
-            query = query.where(
-                or_(
-                    MembershipModel.name.ilike(f"%{search}%"),
-                    MembershipModel.description.ilike(f"%{search}%")
-                )
-            )
-        
-        count_query = select(MembershipModel).where(MembershipModel.gym_id == gym_id)
-        if status:
-            count_query = count_query.where(MembershipModel.status == status_enum)
+            filters.append(MembershipModel.status == status_enum)
+
         if search:
-            count_query = count_query.where(
-                or_(
-                    MembershipModel.name.ilike(f"%{search}%"),
-                    MembershipModel.description.ilike(f"%{search}%")
-                )
+            filters.append(self.search.filter(search))
+
+        return filters
+
+    async def get_daily_row(
+        self,
+        gym_id: UUID,
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        from features.membership.domain.enums.membership_enums import MembershipStatus
+        result = await self.session.execute(
+            select(*response_columns(fields, *STAMP_FIELDS))
+            .where(
+                MembershipModel.gym_id == gym_id,
+                MembershipModel.duration_days == 1,
+                MembershipModel.status == MembershipStatus.ACTIVE
             )
-        count_result = await self.session.execute(count_query)
-        total = len(count_result.scalars().all())
-        
-        offset = (page - 1) * size
-        query = query.order_by(MembershipModel.created_at.desc()).offset(offset).limit(size)
-        
-        result = await self.session.execute(query)
-        memberships = [model.to_domain() for model in result.scalars().all()]
-        
-        return memberships, total
-    
+        )
+        row = result.mappings().one_or_none()
+        return dict(row) if row else None
+
     async def get_daily_membership(self, gym_id: UUID) -> Optional[Membership]:
         from features.membership.domain.enums.membership_enums import MembershipStatus
         result = await self.session.execute(
@@ -89,43 +404,165 @@ class MembershipRepositoryPostgres(IMembershipRepository):
         membership_model = result.scalar_one_or_none()
         return membership_model.to_domain() if membership_model else None
     
-    async def update(self, membership: Membership) -> Optional[Membership]:
+    # Stamps read a few columns (or aggregates) only, so a conditional GET can
+    # be answered without loading rows into models or entities.
+
+    async def get_stamp(self, membership_id: MembershipId) -> Optional[MembershipStamp]:
         result = await self.session.execute(
-            select(MembershipModel).where(MembershipModel.id == membership.id.value)
+            select(*STAMP_COLUMNS).where(MembershipModel.id == membership_id.value)
         )
-        existing = result.scalar_one_or_none()
-        
-        if not existing:
-            return None
-        
+        row = result.one_or_none()
+        return MembershipStamp(*row) if row else None
+
+    async def get_daily_stamp(self, gym_id: UUID) -> Optional[MembershipStamp]:
+        from features.membership.domain.enums.membership_enums import MembershipStatus
+        result = await self.session.execute(
+            select(*STAMP_COLUMNS)
+            .where(
+                MembershipModel.gym_id == gym_id,
+                MembershipModel.duration_days == 1,
+                MembershipModel.status == MembershipStatus.ACTIVE
+            )
+        )
+        row = result.one_or_none()
+        return MembershipStamp(*row) if row else None
+
+    async def get_catalog_stamp(
+        self,
+        gym_id: UUID,
+        status: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> MembershipCatalogStamp:
+        result = await self.session.execute(
+            select(
+                func.count(),
+                func.max(MembershipModel.updated_at),
+                func.coalesce(func.sum(MembershipModel.version), 0)
+            )
+            .select_from(MembershipModel)
+            .where(*self._build_filters(gym_id, status, search))
+        )
+        count, last_updated_at, version_sum = result.one()
+        return MembershipCatalogStamp(count, last_updated_at, int(version_sum))
+
+    async def update(self, membership: Membership) -> Optional[Membership]:
         update_data = {
             "name": membership.name,
             "description": membership.description,
-            "price": membership.price.to_float(),
+            "price_cents": membership.price.to_cents(),
             "duration_days": membership.duration.to_int(),
             "type": membership.type,
             "status": membership.status,  # Direct enum assignment
+            "name_folded": fold_search_text(membership.name),
+            "description_folded": fold_search_text(membership.description),
             "updated_at": membership.updated_at
         }
-        
-        await self.session.execute(
+        return await self._update_returning(
+            membership.id,
+            membership.gym_id,
+            update_data,
+            expected_version=membership.version,
+            name=membership.name
+        )
+
+    async def update_fields(
+        self,
+        membership_id: MembershipId,
+        gym_id: UUID,
+        changes: UpdateMembershipInput,
+        expected_version: Optional[int] = None
+    ) -> Optional[Membership]:
+        update_data = {}
+        if changes.name is not None:
+            update_data["name"] = changes.name
+            update_data["name_folded"] = fold_search_text(changes.name)
+        if changes.description is not None:
+            update_data["description"] = changes.description
+            update_data["description_folded"] = fold_search_text(changes.description)
+        if changes.price is not None:
+            update_data["price_cents"] = MembershipPrice.from_float(changes.price).to_cents()
+        if changes.duration is not None:
+            update_data["duration_days"] = changes.duration
+        if changes.type is not None:
+            update_data["type"] = changes.type
+        if changes.status is not None:
+            update_data["status"] = changes.status
+
+        return await self._update_returning(
+            membership_id,
+            gym_id,
+            update_data,
+            expected_version=expected_version,
+            name=changes.name
+        )
+
+    async def _update_returning(
+        self,
+        membership_id: MembershipId,
+        gym_id: UUID,
+        update_data: dict,
+        expected_version: Optional[int],
+        name: Optional[str]
+    ) -> Optional[Membership]:
+        # UPDATE ... WHERE id AND gym_id [AND version] RETURNING *: a miss means
+        # not found, other tenant or stale version; the caller tells them apart.
+        conditions = [MembershipModel.id == membership_id.value, MembershipModel.gym_id == gym_id]
+        if expected_version is not None:
+            conditions.append(MembershipModel.version == expected_version)
+
+        statement = (
             update(MembershipModel)
-            .where(MembershipModel.id == membership.id.value)
-            .values(**update_data)
+            .where(*conditions)
+            .values(**update_data, version=MembershipModel.version + 1)
+            .returning(MembershipModel)
+            .execution_options(synchronize_session=False)
         )
-        
-        await self.session.commit()
-        
-        await self.session.refresh(existing)
-        return existing.to_domain()
-    
+        try:
+            result = await self.session.execute(statement)
+            membership_model = result.scalar_one_or_none()
+        except IntegrityError as e:
+            await self._raise_constraint_error(e, name, gym_id)
+
+        return membership_model.to_domain() if membership_model else None
+
     async def delete(self, membership_id: MembershipId) -> bool:
         result = await self.session.execute(
             delete(MembershipModel).where(MembershipModel.id == membership_id.value)
         )
-        await self.session.commit()
         return result.rowcount > 0
     
+    async def delete_for_gym(self, membership_id: MembershipId, gym_id: UUID) -> bool:
+        # DELETE ... WHERE id AND gym_id AND NOT <in use> RETURNING id; on a miss
+        # the caller decides between 404, 403 and 409.
+        result = await self.session.execute(
+            delete(MembershipModel)
+            .where(
+                MembershipModel.id == membership_id.value,
+                MembershipModel.gym_id == gym_id,
+                not_(self._in_use_clause(MembershipModel.id))
+            )
+            .returning(MembershipModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted_id = result.scalar_one_or_none()
+        return deleted_id is not None
+
+    async def delete_many_for_gym(self, membership_ids: List[MembershipId], gym_id: UUID) -> Set[UUID]:
+        if not membership_ids:
+            return set()
+        # Same rules as delete_for_gym for a whole batch in one statement
+        result = await self.session.execute(
+            delete(MembershipModel)
+            .where(
+                MembershipModel.id.in_([membership_id.value for membership_id in membership_ids]),
+                MembershipModel.gym_id == gym_id,
+                not_(self._in_use_clause(MembershipModel.id))
+            )
+            .returning(MembershipModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        return set(result.scalars().all())
+
     async def exists_with_name(
         self, 
         name: str, 
@@ -144,6 +581,28 @@ class MembershipRepositoryPostgres(IMembershipRepository):
         result = await self.session.execute(query)
         return result.scalar_one_or_none() is not None
     
+    async def _raise_constraint_error(
+        self,
+        error: IntegrityError,
+        name: Optional[str],
+        gym_id: UUID
+    ) -> NoReturn:
+        # The failed transaction is rolled back by the caller's unit of work.
+        # Anything but our two unique indexes (e.g. a foreign key) propagates.
+        message = str(error.orig)
+        # PostgreSQL reports the index name, SQLite only the indexed columns
+        if MembershipModel.NAME_UNIQUE_INDEX in message or message.endswith("memberships.gym_id, memberships.name"):
+            raise MembershipAlreadyExistsError(name, gym_id) from error
+        if MembershipModel.DAILY_UNIQUE_INDEX in message or message.endswith("UNIQUE constraint failed: memberships.gym_id"):
+            raise DailyMembershipExistsError(gym_id) from error
+        raise error
+
     async def is_used_by_active_clients(self, membership_id: MembershipId) -> bool:
-        
-        return False
+        result = await self.session.execute(select(self._in_use_clause(membership_id.value)))
+        return bool(result.scalar())
+
+    @staticmethod
+    def _in_use_clause(membership_id) -> ColumnElement[bool]:
+        # EXISTS over active client subscriptions once that table lives in this
+        # service; until then no membership is ever in use.
+        return false()
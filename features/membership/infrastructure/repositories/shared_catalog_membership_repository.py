@@ -0,0 +1,62 @@
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+from features.membership.domain.entities.membership import Membership
+from features.membership.domain.object_values.membership_id import MembershipId
+from features.membership.domain.repository_interfaces.membership_repository import IMembershipRepository
+from features.membership.domain.repository_interfaces.unit_of_work import IUnitOfWork
+from features.membership.infrastructure.repositories.membership_repository_decorator import MembershipRepositoryDecorator
+from features.membership.infrastructure.shared_catalog.shared_catalog_store import SharedCatalogStore
+
+
+# Serves single-membership reads from the node's shared catalog segment while
+# it is fresh and falls back to the wrapped repository otherwise. Writes mark
+# their gyms dirty once committed, which makes every worker fall back until
+# the writer has published a new segment with those gyms reloaded.
+class SharedCatalogMembershipRepository(MembershipRepositoryDecorator):
+
+    def __init__(
+        self,
+        repository: IMembershipRepository,
+        store: SharedCatalogStore,
+        unit_of_work: Optional[IUnitOfWork] = None
+    ):
+        super().__init__(repository)
+        self.store = store
+        self.unit_of_work = unit_of_work
+
+    # Reads
+
+    async def get_by_id(self, membership_id: MembershipId) -> Optional[Membership]:
+        segment = self.store.fresh_segment()
+        if segment is None:
+            return await self.repository.get_by_id(membership_id)
+        record = segment.membership(membership_id.value)
+        return Membership.from_dict(record) if record else None
+
+    async def get_by_ids(self, membership_ids: List[MembershipId]) -> List[Membership]:
+        segment = self.store.fresh_segment()
+        if segment is None:
+            return await self.repository.get_by_ids(membership_ids)
+        records = (segment.membership(membership_id.value) for membership_id in membership_ids)
+        return [Membership.from_dict(record) for record in records if record]
+
+    async def get_daily_membership(self, gym_id: UUID) -> Optional[Membership]:
+        segment = self.store.fresh_segment()
+        if segment is None:
+            return await self.repository.get_daily_membership(gym_id)
+        record = segment.daily_membership(gym_id)
+        return Membership.from_dict(record) if record else None
+
+    async def _on_write(self, membership_ids: Iterable[UUID], gym_ids: Iterable[UUID]) -> None:
+        # Bumped after the commit so a rebuild that starts in between still
+        # ends up stale; without a unit of work the write is already final.
+        gym_ids = list(gym_ids)
+
+        async def mark_dirty() -> None:
+            self.store.mark_dirty(gym_ids)
+
+        if self.unit_of_work is not None:
+            self.unit_of_work.after_commit(mark_dirty)
+        else:
+            self.store.mark_dirty(gym_ids)
@@ -0,0 +1,33 @@
+from typing import Iterable, Optional
+from uuid import UUID
+
+from features.membership.domain.repository_interfaces.membership_repository import IMembershipRepository
+from features.membership.domain.repository_interfaces.unit_of_work import IUnitOfWork
+from features.membership.infrastructure.repositories.membership_repository_decorator import MembershipRepositoryDecorator
+from features.membership.infrastructure.snapshots.membership_snapshots import MembershipSnapshotStore
+
+
+# Drops the per-gym catalog snapshots of every gym a write touches, when the
+# write is issued and again once it is committed.
+class SnapshotMembershipRepository(MembershipRepositoryDecorator):
+
+    def __init__(
+        self,
+        repository: IMembershipRepository,
+        snapshots: MembershipSnapshotStore,
+        unit_of_work: Optional[IUnitOfWork] = None
+    ):
+        super().__init__(repository)
+        self.snapshots = snapshots
+        self.unit_of_work = unit_of_work
+
+    async def _on_write(self, membership_ids: Iterable[UUID], gym_ids: Iterable[UUID]) -> None:
+        gym_ids = set(gym_ids)
+
+        async def invalidate() -> None:
+            for gym_id in gym_ids:
+                self.snapshots.invalidate(gym_id)
+
+        await invalidate()
+        if self.unit_of_work is not None:
+            self.unit_of_work.after_commit(invalidate)
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
+
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from features.membership.infrastructure.entities.membership_model import MembershipModel
+from features.membership.infrastructure.search.text_folding import fold_search_text
+
+
+class MembershipSearch(ABC):
+
+    @abstractmethod
+    def filter(self, term: str) -> ColumnElement[bool]:
+        raise NotImplementedError
+
+    def rank(self, term: str) -> Optional[ColumnElement[float]]:
+        return None
+
+
+class LikeMembershipSearch(MembershipSearch):
+    """Substring match on the folded columns; portable fallback used for SQLite."""
+
+    def filter(self, term: str) -> ColumnElement[bool]:
+        folded = fold_search_text(term)
+        return or_(
+            MembershipModel.name_folded.contains(folded, autoescape=True),
+            MembershipModel.description_folded.contains(folded, autoescape=True)
+        )
+
+
+class PostgresMembershipSearch(LikeMembershipSearch):
+    """Same matching as the fallback, served by the pg_trgm GIN index and ranked
+    by trigram similarity combined with full-text relevance."""
+
+    def rank(self, term: str) -> Optional[ColumnElement[float]]:
+        folded = fold_search_text(term)
+        document = func.to_tsvector(
+            literal_column("'simple'"),
+            MembershipModel.name_folded + " " + MembershipModel.description_folded
+        )
+        query = func.plainto_tsquery(literal_column("'simple'"), folded)
+        return func.greatest(
+            func.similarity(MembershipModel.name_folded, folded),
+            func.ts_rank(document, query)
+        )
+
+
+@lru_cache(maxsize=None)
+def search_for_dialect(dialect_name: str) -> MembershipSearch:
+    if dialect_name == "postgresql":
+        return PostgresMembershipSearch()
+    return LikeMembershipSearch()
@@ -0,0 +1,11 @@
+import unicodedata
+from typing import Optional
+
+
+def fold_search_text(value: Optional[str]) -> str:
+    """Lowercase, strip accents and collapse whitespace ("Membresía" -> "membresia")."""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
@@ -0,0 +1,157 @@
+import json
+import mmap
+import os
+import struct
+import time
+from typing import AbstractSet, Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+# Layout: header | JSON records | id index | daily index | gym index. The id
+# and daily indexes are arrays of (16-byte UUID, offset, length) sorted by
+# UUID, binary-searched in place on the mapped pages; only the record found
+# is decoded. The gym index lists every record as (gym UUID, id UUID, offset,
+# length), so a rebuild can copy the gyms that did not change as raw bytes.
+MAGIC = b"GYMCATLG"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<8sH6xQQdQQQQQ")
+ENTRY = struct.Struct("<16sQI")
+GYM_ENTRY = struct.Struct("<16s16sQI")
+
+
+class CatalogSegmentBuilder:
+    """Writes a segment to a temporary file; publish() renames it into place"""
+
+    def __init__(self, path: str, generation: int, sequence: int, built_at: Optional[float] = None):
+        self.path = path
+        self.generation = generation
+        self.sequence = sequence
+        # Time of the oldest data in the segment; a segment that copies
+        # records from a previous one keeps that one's built_at
+        self.built_at = time.time() if built_at is None else built_at
+        self._tmp_path = f"{path}.{os.getpid()}.tmp"
+        self._file = open(self._tmp_path, "wb")
+        self._file.write(b"\0" * HEADER.size)
+        self._offset = HEADER.size
+        self._ids: List[Tuple[bytes, int, int]] = []
+        self._dailies: List[Tuple[bytes, int, int]] = []
+        self._gyms: List[Tuple[bytes, bytes, int, int]] = []
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Append one record in Membership.to_dict() form"""
+        self._add_raw(
+            json.dumps(record, separators=(",", ":")).encode(),
+            UUID(record["id"]).bytes,
+            UUID(record["gym_id"]).bytes,
+            record["duration_days"] == 1 and record["status"] == "active"
+        )
+
+    def copy_from(self, segment: 'CatalogSegment', skip_gym_ids: AbstractSet[UUID]) -> int:
+        """Append the records of every gym of segment but the skipped ones, without decoding them"""
+        skipped = {gym_id.bytes for gym_id in skip_gym_ids}
+        dailies = segment.daily_offsets()
+        count = 0
+        for gym_id, membership_id, offset, length in segment.gym_entries():
+            if gym_id in skipped:
+                continue
+            self._add_raw(segment.raw(offset, length), membership_id, gym_id, dailies.get(gym_id) == offset)
+            count += 1
+        return count
+
+    def _add_raw(self, data: bytes, membership_id: bytes, gym_id: bytes, daily: bool) -> None:
+        self._file.write(data)
+        entry = (self._offset, len(data))
+        self._ids.append((membership_id, *entry))
+        if daily:
+            self._dailies.append((gym_id, *entry))
+        self._gyms.append((gym_id, membership_id, *entry))
+        self._offset += len(data)
+
+    def publish(self) -> None:
+        try:
+            id_index_offset = self._write_index(self._ids)
+            daily_index_offset = self._write_index(self._dailies)
+            gym_index_offset = self._write_index(self._gyms, GYM_ENTRY)
+            self._file.seek(0)
+            self._file.write(HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                self.generation,
+                self.sequence,
+                self.built_at,
+                len(self._ids),
+                id_index_offset,
+                len(self._dailies),
+                daily_index_offset,
+                gym_index_offset
+            ))
+            self._file.close()
+            # Readers still mapping the previous file keep a consistent view
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.discard()
+            raise
+
+    def discard(self) -> None:
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def _write_index(self, entries: List[tuple], entry_struct: struct.Struct = ENTRY) -> int:
+        entries.sort()
+        index_offset = self._offset
+        for entry in entries:
+            self._file.write(entry_struct.pack(*entry))
+        self._offset += entry_struct.size * len(entries)
+        return index_offset
+
+
+class CatalogSegment:
+    """Read-only view of a published segment"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as segment_file:
+            self._map = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, format_version, self.generation, self.sequence, self.built_at,
+         self.record_count, self._id_index_offset, self.daily_count,
+         self._daily_index_offset, self._gym_index_offset) = HEADER.unpack_from(self._map)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} membership catalog segment")
+
+    def membership(self, membership_id: UUID) -> Optional[Dict[str, Any]]:
+        return self._find(self._id_index_offset, self.record_count, membership_id.bytes)
+
+    def daily_membership(self, gym_id: UUID) -> Optional[Dict[str, Any]]:
+        return self._find(self._daily_index_offset, self.daily_count, gym_id.bytes)
+
+    def gym_entries(self) -> Iterator[Tuple[bytes, bytes, int, int]]:
+        """(gym UUID bytes, id UUID bytes, offset, length) of every record, by gym"""
+        return GYM_ENTRY.iter_unpack(
+            self._map[self._gym_index_offset:self._gym_index_offset + GYM_ENTRY.size * self.record_count]
+        )
+
+    def daily_offsets(self) -> Dict[bytes, int]:
+        """Offset of each gym's daily pass record"""
+        index = self._map[self._daily_index_offset:self._daily_index_offset + ENTRY.size * self.daily_count]
+        return {gym_id: offset for gym_id, offset, _ in ENTRY.iter_unpack(index)}
+
+    def raw(self, offset: int, length: int) -> bytes:
+        return self._map[offset:offset + length]
+
+    def close(self) -> None:
+        self._map.close()
+
+    def _find(self, index_offset: int, count: int, key: bytes) -> Optional[Dict[str, Any]]:
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            position = index_offset + middle * ENTRY.size
+            entry_key = self._map[position:position + 16]
+            if entry_key < key:
+                low = middle + 1
+            elif entry_key > key:
+                high = middle
+            else:
+                _, offset, length = ENTRY.unpack_from(self._map, position)
+                return json.loads(self._map[offset:offset + length])
+        return None
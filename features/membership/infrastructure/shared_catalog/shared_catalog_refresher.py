@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from typing import AsyncContextManager, Callable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from features.membership.infrastructure.entities.membership_model import MembershipModel
+from features.membership.infrastructure.shared_catalog.shared_catalog_store import SharedCatalogStore
+
+logger = logging.getLogger(__name__)
+
+
+class SharedCatalogRefresher:
+    """Runs in every worker; only the one holding the writer lock rebuilds.
+
+    session_factory opens the session for a rebuild; the app passes one that
+    also holds a database admission slot while the catalog is read.
+    """
+
+    def __init__(
+        self,
+        store: SharedCatalogStore,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        interval_seconds: float = 1.0
+    ):
+        self.store = store
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.store.release_writer()
+
+    async def refresh(self) -> int:
+        """Publish a new segment; returns how many memberships were read from the database"""
+        plan = self.store.refresh_plan()
+        builder = self.store.builder(plan)
+        statement = select(MembershipModel.__table__)
+        if plan.base is not None:
+            # Only the gyms written since the published segment are reloaded
+            statement = statement.where(MembershipModel.gym_id.in_(plan.changed_gym_ids))
+        count = 0
+        try:
+            if plan.base is not None:
+                builder.copy_from(plan.base, plan.changed_gym_ids)
+            if plan.base is None or plan.changed_gym_ids:
+                async with self.session_factory() as session:
+                    result = await session.stream(statement.execution_options(yield_per=5000))
+                    async for partition in result.mappings().partitions():
+                        for row in partition:
+                            builder.add(self._record(row))
+                            count += 1
+            builder.publish()
+        except BaseException:
+            builder.discard()
+            raise
+        self.store.published(builder, plan)
+        return count
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self.store.try_acquire_writer() and self.store.needs_refresh():
+                    count = await self.refresh()
+                    logger.info("Shared membership catalog rebuilt, %s memberships read", count)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Shared membership catalog refresh failed")
+            await asyncio.sleep(self.interval_seconds)
+
+    @staticmethod
+    def _record(row) -> dict:
+        # Same shape as Membership.to_dict(), built without an entity per row
+        return {
+            "id": str(row["id"]),
+            "name": row["name"],
+            "description": row["description"],
+            "price": row["price_cents"] / 100,
+            "duration_days": row["duration_days"],
+            "status": row["status"].value,
+            "type": row["type"].value,
+            "created_at": row["created_at"].isoformat(),
+            "updated_at": row["updated_at"].isoformat(),
+            "gym_id": str(row["gym_id"]),
+            "version": row["version"],
+        }
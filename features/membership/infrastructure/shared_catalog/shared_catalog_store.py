@@ -0,0 +1,207 @@
+import fcntl
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Iterator, Optional
+from uuid import UUID
+
+from features.membership.infrastructure.shared_catalog.catalog_segment import CatalogSegment, CatalogSegmentBuilder
+
+# (dirty generation, publish sequence); the generation is bumped after every
+# committed write, the sequence every time a new segment is published
+_CONTROL = struct.Struct("<QQ")
+_GYM_ID_SIZE = 16
+
+
+@dataclass(frozen=True)
+class RefreshPlan:
+    """What the next segment has to load; base is None for a full rebuild"""
+
+    generation: int
+    base: Optional[CatalogSegment]
+    # Gyms written since base was built; their records are reloaded, the
+    # rest are copied from base
+    changed_gym_ids: FrozenSet[UUID]
+    # Bytes of the dirty-gyms file covered by this plan
+    consumed: int
+
+
+class SharedCatalogStore:
+    """Membership catalog shared by all worker processes of a node (POSIX).
+
+    Every worker maps the same segment file. One worker at a time holds the
+    writer lock and rebuilds the segment; a segment is only served while no
+    write has been committed since it was built and it is younger than
+    max_age_seconds (which also bounds staleness from writes on other nodes).
+    """
+
+    SEGMENT_FILE = "memberships.segment"
+    CONTROL_FILE = "control"
+    WRITER_LOCK_FILE = "writer.lock"
+    DIRTY_GYMS_FILE = "dirty_gyms"
+
+    def __init__(self, directory: str, max_age_seconds: float = 30.0, max_dirty_gyms: int = 1000):
+        self.directory = directory
+        self.max_age_seconds = max_age_seconds
+        self.max_dirty_gyms = max_dirty_gyms
+        os.makedirs(directory, exist_ok=True)
+        self._control_fd = os.open(os.path.join(directory, self.CONTROL_FILE), os.O_RDWR | os.O_CREAT, 0o600)
+        # Gyms written since the published segment was built, appended under
+        # the control lock; once it holds max_dirty_gyms the next rebuild is
+        # a full one
+        self._dirty_fd = os.open(os.path.join(directory, self.DIRTY_GYMS_FILE), os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked_control():
+            if os.fstat(self._control_fd).st_size < _CONTROL.size:
+                os.ftruncate(self._control_fd, _CONTROL.size)
+        self._control = mmap.mmap(self._control_fd, _CONTROL.size)
+        self._segment: Optional[CatalogSegment] = None
+        self._writer_lock_fd: Optional[int] = None
+
+    @property
+    def segment_path(self) -> str:
+        return os.path.join(self.directory, self.SEGMENT_FILE)
+
+    def dirty_generation(self) -> int:
+        return _CONTROL.unpack_from(self._control)[0]
+
+    def mark_dirty(self, gym_ids: Iterable[UUID]) -> None:
+        """Record that these gyms' catalogs changed; published segments become stale"""
+        with self._locked_control():
+            generation, sequence = _CONTROL.unpack_from(self._control)
+            size = os.fstat(self._dirty_fd).st_size
+            if size < self.max_dirty_gyms * _GYM_ID_SIZE:
+                os.pwrite(self._dirty_fd, b"".join(gym_id.bytes for gym_id in gym_ids), size)
+            _CONTROL.pack_into(self._control, 0, generation + 1, sequence)
+
+    def fresh_segment(self) -> Optional[CatalogSegment]:
+        """The published segment if it can be trusted, otherwise None"""
+        segment = self._current_segment()
+        if segment is None:
+            return None
+        if segment.generation != self.dirty_generation():
+            return None
+        if time.time() - segment.built_at > self.max_age_seconds:
+            return None
+        return segment
+
+    def needs_refresh(self) -> bool:
+        segment = self._current_segment()
+        if segment is None or segment.generation != self.dirty_generation():
+            return True
+        # Rebuilt ahead of expiry so readers never fall back on age alone
+        return time.time() - segment.built_at > self.max_age_seconds / 2
+
+    def try_acquire_writer(self) -> bool:
+        """Become (or stay) the node's single writer; never blocks"""
+        if self._writer_lock_fd is not None:
+            return True
+        fd = os.open(os.path.join(self.directory, self.WRITER_LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._writer_lock_fd = fd
+        return True
+
+    def release_writer(self) -> None:
+        if self._writer_lock_fd is not None:
+            os.close(self._writer_lock_fd)
+            self._writer_lock_fd = None
+
+    def refresh_plan(self) -> RefreshPlan:
+        """The changes since the published segment, read before loading anything.
+
+        A write committed while the new segment loads bumps the generation and
+        leaves its gym in the dirty-gyms file, so the new segment is born
+        stale and the next rebuild reloads that gym.
+        """
+        with self._locked_control():
+            generation, _ = _CONTROL.unpack_from(self._control)
+            size = os.fstat(self._dirty_fd).st_size
+            dirty = os.pread(self._dirty_fd, size, 0)
+        base = self._current_segment()
+        # Writes on other nodes never reach the dirty-gyms file: rebuilding
+        # everything at half the max age bounds their staleness
+        if base is not None and (
+            size >= self.max_dirty_gyms * _GYM_ID_SIZE
+            or time.time() - base.built_at > self.max_age_seconds / 2
+        ):
+            base = None
+        return RefreshPlan(
+            generation=generation,
+            base=base,
+            changed_gym_ids=frozenset(
+                UUID(bytes=dirty[position:position + _GYM_ID_SIZE])
+                for position in range(0, len(dirty) - len(dirty) % _GYM_ID_SIZE, _GYM_ID_SIZE)
+            ),
+            consumed=size
+        )
+
+    def builder(self, plan: RefreshPlan) -> CatalogSegmentBuilder:
+        """Start the segment a plan describes"""
+        _, sequence = _CONTROL.unpack_from(self._control)
+        return CatalogSegmentBuilder(
+            self.segment_path,
+            plan.generation,
+            sequence + 1,
+            built_at=plan.base.built_at if plan.base is not None else None
+        )
+
+    def published(self, builder: CatalogSegmentBuilder, plan: RefreshPlan) -> None:
+        with self._locked_control():
+            generation, _ = _CONTROL.unpack_from(self._control)
+            _CONTROL.pack_into(self._control, 0, generation, builder.sequence)
+            # Keep only the gyms written after the plan was read
+            size = os.fstat(self._dirty_fd).st_size
+            remaining = os.pread(self._dirty_fd, size - plan.consumed, plan.consumed)
+            os.pwrite(self._dirty_fd, remaining, 0)
+            os.ftruncate(self._dirty_fd, len(remaining))
+
+    def close(self) -> None:
+        self.release_writer()
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+        self._control.close()
+        os.close(self._control_fd)
+        os.close(self._dirty_fd)
+
+    def _current_segment(self) -> Optional[CatalogSegment]:
+        _, sequence = _CONTROL.unpack_from(self._control)
+        if sequence == 0:
+            return None
+        if self._segment is None or self._segment.sequence != sequence:
+            try:
+                segment = CatalogSegment(self.segment_path)
+            except (FileNotFoundError, ValueError):
+                return None
+            if self._segment is not None:
+                self._segment.close()
+            self._segment = segment
+        return self._segment
+
+    @contextmanager
+    def _locked_control(self) -> Iterator[None]:
+        fcntl.flock(self._control_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._control_fd, fcntl.LOCK_UN)
+
+
+@lru_cache(maxsize=None)
+def get_shared_catalog_store() -> Optional[SharedCatalogStore]:
+    """Store in MEMBERSHIP_SHARED_CATALOG_DIR (e.g. /dev/shm/gym-catalog), or None when unset"""
+    directory = os.getenv("MEMBERSHIP_SHARED_CATALOG_DIR")
+    if not directory:
+        return None
+    return SharedCatalogStore(
+        directory,
+        float(os.getenv("MEMBERSHIP_SHARED_CATALOG_MAX_AGE", "30")),
+        int(os.getenv("MEMBERSHIP_SHARED_CATALOG_MAX_DIRTY_GYMS", "1000"))
+    )
@@ -0,0 +1,174 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from features.membership.application.dtos.membership_dtos import MembershipResponseDTO
+from features.membership.domain.object_values.membership_stamp import MembershipCatalogStamp, MembershipStamp
+
+# Rendered list pages kept per snapshot; the (page, size) space is small in practice
+_MAX_PAGES = 256
+
+
+@dataclass
+class GymCatalogSnapshot:
+    """A gym's catalog serialized once, in list order (newest first)"""
+
+    items: List[bytes]
+    daily: Optional[bytes]
+    # Same values the repository's stamp queries return for this state
+    stamp: MembershipCatalogStamp
+    daily_stamp: Optional[MembershipStamp]
+    built_at: float
+    external_generation: int
+    _pages: Dict[Tuple[int, int], bytes] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        memberships: List[MembershipResponseDTO],
+        external_generation: int = 0
+    ) -> 'GymCatalogSnapshot':
+        daily = next(
+            (membership for membership in memberships
+             if membership.duration_days == 1 and membership.status.value == "active"),
+            None
+        )
+        return cls(
+            items=[membership.model_dump_json().encode() for membership in memberships],
+            daily=daily.model_dump_json().encode() if daily else None,
+            stamp=MembershipCatalogStamp(
+                count=len(memberships),
+                last_updated_at=max((membership.updated_at for membership in memberships), default=None),
+                version_sum=sum(membership.version for membership in memberships)
+            ),
+            daily_stamp=MembershipStamp(daily.id, daily.gym_id, daily.version, daily.updated_at) if daily else None,
+            built_at=time.monotonic(),
+            external_generation=external_generation
+        )
+
+    def page(self, page: int, size: int) -> bytes:
+        """Body of an unfiltered offset page, identical to MembershipListResponseDTO"""
+        body = self._pages.get((page, size))
+        if body is None:
+            total = len(self.items)
+            offset = (page - 1) * size
+            total_pages = (total + size - 1) // size if size > 0 else 1
+            body = b"".join((
+                b'{"items":[',
+                b",".join(self.items[offset:offset + size]),
+                f'],"total":{total},"page":{page},"size":{size},"total_pages":{total_pages}}}'.encode(),
+            ))
+            if len(self._pages) >= _MAX_PAGES:
+                self._pages.clear()
+            self._pages[(page, size)] = body
+        return body
+
+
+@dataclass
+class _GymEntry:
+    snapshot: Optional[GymCatalogSnapshot] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Bumped by invalidate(); a rebuild that overlapped a write is not kept
+    write_count: int = 0
+
+
+class MembershipSnapshotStore:
+    """Per-gym catalog snapshots of this worker process.
+
+    A snapshot is dropped when a write to its gym commits in this process,
+    when the optional external generation (the node's shared catalog, bumped
+    by every worker's writes) moves, and after ttl_seconds, which bounds
+    staleness from writes no generation reports (e.g. other nodes). It is rebuilt by the next read, once per gym.
+    At most max_gyms gyms are tracked, least recently used first out.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 5.0,
+        external_generation: Callable[[], int] = lambda: 0,
+        max_gyms: int = 1000
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.external_generation = external_generation
+        self.max_gyms = max_gyms
+        self._gyms: "OrderedDict[UUID, _GymEntry]" = OrderedDict()
+
+    async def get(
+        self,
+        gym_id: UUID,
+        load: Callable[[], Awaitable[List[MembershipResponseDTO]]]
+    ) -> GymCatalogSnapshot:
+        entry = self._entry(gym_id)
+        snapshot = self._fresh(entry)
+        if snapshot is not None:
+            return snapshot
+
+        async with entry.lock:
+            # Someone else may have rebuilt it while we waited
+            snapshot = self._fresh(entry)
+            if snapshot is None:
+                write_count = entry.write_count
+                generation = self.external_generation()
+                snapshot = GymCatalogSnapshot.build(await load(), generation)
+                # An entry evicted meanwhile may have missed an invalidation
+                if entry.write_count == write_count and self._gyms.get(gym_id) is entry:
+                    entry.snapshot = snapshot
+            return snapshot
+
+    def invalidate(self, gym_id: UUID) -> None:
+        entry = self._gyms.get(gym_id)
+        if entry is not None:
+            entry.write_count += 1
+            entry.snapshot = None
+
+    def __len__(self) -> int:
+        return len(self._gyms)
+
+    def _entry(self, gym_id: UUID) -> _GymEntry:
+        entry = self._gyms.get(gym_id)
+        if entry is None:
+            entry = self._gyms[gym_id] = _GymEntry()
+            while len(self._gyms) > self.max_gyms:
+                self._gyms.popitem(last=False)
+        else:
+            self._gyms.move_to_end(gym_id)
+        return entry
+
+    def _fresh(self, entry: _GymEntry) -> Optional[GymCatalogSnapshot]:
+        snapshot = entry.snapshot
+        if snapshot is None:
+            return None
+        if time.monotonic() - snapshot.built_at > self.ttl_seconds \
+                or snapshot.external_generation != self.external_generation():
+            entry.snapshot = None
+            return None
+        return snapshot
+
+
+@lru_cache(maxsize=None)
+def get_membership_snapshots() -> Optional[MembershipSnapshotStore]:
+    """Snapshot store per MEMBERSHIP_SNAPSHOTS (auto, on or off).
+
+    auto (the default) enables snapshots only with the shared catalog, whose
+    write generation every worker of the node sees as soon as a write
+    commits. Without it a worker learns of other workers' writes only when
+    the TTL expires, and could answer 304 for data that already changed, so
+    on is meant for single-worker deployments.
+    """
+    mode = os.getenv("MEMBERSHIP_SNAPSHOTS", "auto").lower()
+    if mode in ("0", "off", "false", "no"):
+        return None
+    from features.membership.infrastructure.shared_catalog.shared_catalog_store import get_shared_catalog_store
+    shared_store = get_shared_catalog_store()
+    if shared_store is None and mode not in ("1", "on", "true", "yes"):
+        return None
+    return MembershipSnapshotStore(
+        ttl_seconds=float(os.getenv("MEMBERSHIP_SNAPSHOT_TTL", "5")),
+        external_generation=shared_store.dirty_generation if shared_store else (lambda: 0),
+        max_gyms=int(os.getenv("MEMBERSHIP_SNAPSHOT_MAX_GYMS", "1000"))
+    )
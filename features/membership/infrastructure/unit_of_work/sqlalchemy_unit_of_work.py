@@ -0,0 +1,28 @@
+from typing import AsyncContextManager, Awaitable, Callable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from features.membership.domain.repository_interfaces.unit_of_work import IUnitOfWork
+
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._after_commit: List[Callable[[], Awaitable[None]]] = []
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            await callback()
+
+    async def rollback(self) -> None:
+        self._after_commit = []
+        await self.session.rollback()
+
+    def savepoint(self) -> AsyncContextManager:
+        return self.session.begin_nested()
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self._after_commit.append(callback)
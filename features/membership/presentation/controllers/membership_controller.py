@@ -1,22 +1,30 @@
 import \
     uuid
-from typing import Optional
+from typing import Optional, Union
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 from features.membership.application.dtos.membership_dtos import (
+    MembershipBulkCreateDTO,
+    MembershipBulkDeleteDTO,
+    MembershipBulkResponseDTO,
+    MembershipBulkUpdateDTO,
     MembershipCreateDTO,
     MembershipResponseDTO,
     MembershipUpdateDTO,
-    MembershipListResponseDTO
+    MembershipListResponseDTO,
+    MembershipCursorPageDTO
 )
 from features.membership.application.errors.membership_errors import (
     MembershipNotFoundError,
     MembershipAlreadyExistsError,
     DailyMembershipExistsError,
+    DailyMembershipNotFoundError,
     MembershipInUseError,
     UnauthorizedMembershipAccessError,
-    InvalidMembershipDataError
+    InvalidMembershipDataError,
+    MembershipVersionConflictError
 )
+from features.membership.application.membership_context import MembershipContext
 from features.membership.application.service import MembershipService
 
 class ErrorResponse(BaseModel):
@@ -25,8 +33,9 @@ class ErrorResponse(BaseModel):
 
 class MembershipController:
 
-    def __init__(self, membership_service: MembershipService):
+    def __init__(self, membership_service: MembershipService, context: MembershipContext):
         self.membership_service = membership_service
+        self.context = context
         self.router = APIRouter()
         self._register_routes()
 
@@ -43,6 +52,28 @@ class MembershipController:
             },
         )
 
+        # Registered before "/{membership_id}" so "bulk" is not parsed as an ID
+        self.router.add_api_route(
+            "/bulk",
+            self.bulk_create_memberships,
+            methods=["POST"],
+            response_model=MembershipBulkResponseDTO,
+        )
+
+        self.router.add_api_route(
+            "/bulk",
+            self.bulk_update_memberships,
+            methods=["PUT"],
+            response_model=MembershipBulkResponseDTO,
+        )
+
+        self.router.add_api_route(
+            "/bulk",
+            self.bulk_delete_memberships,
+            methods=["DELETE"],
+            response_model=MembershipBulkResponseDTO,
+        )
+
         self.router.add_api_route(
             "/daily",
             self.get_daily_membership,
@@ -68,7 +99,7 @@ class MembershipController:
             "/",
             self.list_memberships,
             methods=["GET"],
-            response_model=MembershipListResponseDTO,
+            response_model=Union[MembershipListResponseDTO, MembershipCursorPageDTO],
         )
 
         self.router.add_api_route(
@@ -81,6 +112,7 @@ class MembershipController:
                 403: {"model": ErrorResponse},
                 404: {"model": ErrorResponse},
                 409: {"model": ErrorResponse},
+                412: {"model": ErrorResponse},
             },
         )
 
@@ -98,7 +130,7 @@ class MembershipController:
 
     async def create_membership(self, membership_data: MembershipCreateDTO) -> MembershipResponseDTO:
         try:
-            return await self.membership_service.create_membership(membership_data)
+            return await self.membership_service.create_membership(self.context, membership_data)
         except (MembershipAlreadyExistsError, DailyMembershipExistsError, InvalidMembershipDataError) as e:
             status_code = 400 if isinstance(e, InvalidMembershipDataError) else 409
             raise HTTPException(
@@ -106,9 +138,18 @@ class MembershipController:
                 detail={"detail": str(e), "error_code": e.__class__.__name__}
             )
 
+    async def bulk_create_memberships(self, bulk_data: MembershipBulkCreateDTO) -> MembershipBulkResponseDTO:
+        return await self.membership_service.bulk_create_memberships(self.context, bulk_data)
+
+    async def bulk_update_memberships(self, bulk_data: MembershipBulkUpdateDTO) -> MembershipBulkResponseDTO:
+        return await self.membership_service.bulk_update_memberships(self.context, bulk_data)
+
+    async def bulk_delete_memberships(self, bulk_data: MembershipBulkDeleteDTO) -> MembershipBulkResponseDTO:
+        return await self.membership_service.bulk_delete_memberships(self.context, bulk_data)
+
     async def get_membership(self, membership_id: uuid.UUID) -> MembershipResponseDTO:
         try:
-            return await self.membership_service.get_membership(membership_id)
+            return await self.membership_service.get_membership(self.context, membership_id)
 
         except MembershipNotFoundError as e:
             raise HTTPException(
@@ -124,9 +165,9 @@ class MembershipController:
 
     async def get_daily_membership(self) -> MembershipResponseDTO:
         try:
-            return await self.membership_service.get_daily_membership()
+            return await self.membership_service.get_daily_membership(self.context)
 
-        except MembershipNotFoundError as e:
+        except DailyMembershipNotFoundError as e:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"detail": str(e), "error_code": e.__class__.__name__}
@@ -137,22 +178,28 @@ class MembershipController:
         page: int = 1,
         size: int = 10,
         membership_status: Optional[str] = None,
-        search: Optional[str] = None
-    ) -> MembershipListResponseDTO:
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        pagination: str = "offset"
+    ) -> Union[MembershipListResponseDTO, MembershipCursorPageDTO]:
         return await self.membership_service.list_memberships(
+            self.context,
             page=page,
             size=size,
             status=membership_status,
-            search=search
+            search=search,
+            cursor=cursor,
+            pagination=pagination
         )
 
     async def update_membership(
         self,
         membership_id: uuid.UUID,
-        update_data: MembershipUpdateDTO
+        update_data: MembershipUpdateDTO,
+        expected_version: Optional[int] = None
     ) -> MembershipResponseDTO:
         try:
-            return await self.membership_service.update_membership(membership_id, update_data)
+            return await self.membership_service.update_membership(self.context, membership_id, update_data, expected_version)
 
         except (MembershipNotFoundError, UnauthorizedMembershipAccessError) as e:
             status_code = 404 if isinstance(e, MembershipNotFoundError) else 403
@@ -168,9 +215,15 @@ class MembershipController:
                 detail={"detail": str(e), "error_code": e.__class__.__name__}
             )
 
+        except MembershipVersionConflictError as e:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail={"detail": str(e), "error_code": e.__class__.__name__}
+            )
+
     async def delete_membership(self, membership_id: uuid.UUID) -> None:
         try:
-            deleted = await self.membership_service.delete_membership(membership_id)
+            deleted = await self.membership_service.delete_membership(self.context, membership_id)
 
             if not deleted:
                 raise MembershipNotFoundError(membership_id)
@@ -0,0 +1,104 @@
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from features.membership.presentation.encoding.response_encoders import Compressor, ContentCoding, ResponseEncoders
+
+# Media types worth compressing; everything else (images, already compressed files) is passed through
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/msgpack")
+
+
+class CompressionMiddleware:
+    """Compresses responses with the coding negotiated from Accept-Encoding.
+
+    Single-message bodies are compressed only from minimum_size bytes on.
+    Streamed bodies (exports, rejected-row downloads) are compressed chunk by
+    chunk as they are produced, so memory stays flat and the client receives
+    data as soon as the server does.
+    """
+
+    def __init__(self, app: ASGIApp, encoders: ResponseEncoders, minimum_size: int = 1024):
+        self.app = app
+        self.encoders = encoders
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        coding = self.encoders.negotiate_coding(Headers(scope=scope).get("accept-encoding"))
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponder(self.app, coding, self.minimum_size, send)(scope, receive)
+
+
+class _CompressedResponder:
+
+    def __init__(self, app: ASGIApp, coding: ContentCoding, minimum_size: int, send: Send):
+        self.app = app
+        self.coding = coding
+        self.minimum_size = minimum_size
+        self.send = send
+        self.start: Optional[Message] = None
+        self.compressor: Optional[Compressor] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive) -> None:
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 304)
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            )
+            if not self.passthrough:
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+
+            self.compressor = self.coding.compressor()
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.coding.name
+            # The compressed bytes are another representation of the same data
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                del headers["Content-Length"]
+                await self.send(start)
+            else:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        chunk = self.compressor.compress(body) if body else b""
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -0,0 +1,182 @@
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class ResponseEncoder(ABC):
+    """Serializes response DTOs to one media type"""
+    media_type: str
+
+    @abstractmethod
+    def encode_model(self, model: BaseModel, exclude: Any = None) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def encode_json(self, body: bytes) -> bytes:
+        """Re-encode a body that was already serialized as JSON (e.g. a snapshot page)"""
+        raise NotImplementedError
+
+
+class JsonEncoder(ResponseEncoder):
+    media_type = "application/json"
+
+    def encode_model(self, model: BaseModel, exclude: Any = None) -> bytes:
+        return type(model).__pydantic_serializer__.to_json(model, exclude=exclude)
+
+    def encode_json(self, body: bytes) -> bytes:
+        return body
+
+
+class MsgpackEncoder(ResponseEncoder):
+    """Requires the optional 'msgpack' package; raises ImportError without it"""
+    media_type = "application/msgpack"
+
+    def __init__(self):
+        import msgpack
+        self._packb = msgpack.packb
+
+    def encode_model(self, model: BaseModel, exclude: Any = None) -> bytes:
+        # JSON mode gives the same strings for UUIDs, enums and datetimes as the JSON body
+        return self._packb(type(model).__pydantic_serializer__.to_python(model, mode="json", exclude=exclude))
+
+    def encode_json(self, body: bytes) -> bytes:
+        return self._packb(json.loads(body))
+
+
+class Compressor(ABC):
+    """One response body being compressed; every chunk is flushed so it can be sent right away"""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        raise NotImplementedError
+
+
+class ContentCoding(ABC):
+    name: str
+
+    @abstractmethod
+    def compressor(self) -> Compressor:
+        raise NotImplementedError
+
+
+class _GzipCompressor(Compressor):
+
+    def __init__(self, level: int):
+        # wbits=31: zlib stream with a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class GzipCoding(ContentCoding):
+    name = "gzip"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compressor(self) -> Compressor:
+        return _GzipCompressor(self.level)
+
+
+class _BrotliCompressor(Compressor):
+
+    def __init__(self, brotli: Any, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class BrotliCoding(ContentCoding):
+    """Requires the optional 'brotli' package; raises ImportError without it"""
+    name = "br"
+
+    def __init__(self, quality: int = 4):
+        import brotli
+        self._brotli = brotli
+        # Low qualities keep brotli cheaper than gzip on dynamic responses
+        self.quality = quality
+
+    def compressor(self) -> Compressor:
+        return _BrotliCompressor(self._brotli, self.quality)
+
+
+def _parse_header_values(header: Optional[str]) -> List[Tuple[str, float]]:
+    """(value, q) pairs of an Accept-style header"""
+    values = []
+    for part in (header or "").split(","):
+        value, *params = (item.strip() for item in part.split(";"))
+        if not value:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, raw = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(raw)
+                except ValueError:
+                    q = 0.0
+        values.append((value.lower(), q))
+    return values
+
+
+class ResponseEncoders:
+    """Media types and content codings the API can produce, registered once at startup.
+
+    Negotiation never fails: without an acceptable media type the default
+    (first registered) one is used, and without an acceptable coding the
+    body is sent uncompressed.
+    """
+
+    def __init__(self):
+        self._media: Dict[str, ResponseEncoder] = {}
+        self._codings: Dict[str, ContentCoding] = {}
+
+    @property
+    def default(self) -> ResponseEncoder:
+        return next(iter(self._media.values()))
+
+    def register_media(self, encoder: ResponseEncoder) -> None:
+        self._media[encoder.media_type] = encoder
+
+    def register_coding(self, coding: ContentCoding) -> None:
+        self._codings[coding.name] = coding
+
+    def negotiate_media(self, accept: Optional[str]) -> ResponseEncoder:
+        ranges = _parse_header_values(accept)
+        best, best_q = self.default, 0.0
+        for media_type, encoder in self._media.items():
+            main_type = media_type.split("/")[0]
+            # The most specific matching range decides the quality
+            q = next(
+                (q for candidate in (media_type, f"{main_type}/*", "*/*")
+                 for value, q in ranges if value == candidate),
+                0.0
+            )
+            if q > best_q:
+                best, best_q = encoder, q
+        return best
+
+    def negotiate_coding(self, accept_encoding: Optional[str]) -> Optional[ContentCoding]:
+        values = dict(_parse_header_values(accept_encoding))
+        best, best_q = None, 0.0
+        # Registration order breaks ties, so the preferred coding goes first
+        for name, coding in self._codings.items():
+            q = values.get(name, values.get("*", 0.0))
+            if q > best_q:
+                best, best_q = coding, q
+        return best
@@ -0,0 +1,133 @@
+from typing import Optional
+
+from dependency_injector import containers, providers
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dev_utils.dev_database import PINNED_SESSION, REPLICA_SESSION
+
+from features.membership.application.membership_context import MembershipContext, TenantContext
+from features.membership.application.service import MembershipService
+from features.membership.application.use_cases.bulk_create_memberships import BulkCreateMembershipsUseCase
+from features.membership.application.use_cases.bulk_delete_memberships import BulkDeleteMembershipsUseCase
+from features.membership.application.use_cases.bulk_update_memberships import BulkUpdateMembershipsUseCase
+from features.membership.application.use_cases.create_membership import CreateMembershipUseCase
+from features.membership.application.use_cases.delete_membership import DeleteMembershipUseCase
+from features.membership.application.use_cases.export_memberships import ExportMembershipsUseCase
+from features.membership.application.use_cases.get_daily_membership import GetDailyMembershipUseCase
+from features.membership.application.use_cases.get_membership import GetMembershipUseCase
+from features.membership.application.use_cases.get_membership_catalog import GetMembershipCatalogUseCase
+from features.membership.application.use_cases.get_membership_stamps import (
+    GetDailyMembershipStampUseCase,
+    GetMembershipCatalogStampUseCase,
+    GetMembershipStampUseCase
+)
+from features.membership.application.use_cases.get_memberships import GetMembershipsUseCase
+from features.membership.application.use_cases.import_memberships import ImportMembershipsUseCase
+from features.membership.application.use_cases.update_membership import UpdateMembershipUseCase
+from features.membership.domain.membership_aggregate import MembershipAggregate
+from features.membership.infrastructure.cache.membership_cache import MembershipCache, get_membership_cache
+from features.membership.infrastructure.rate_limiting.rate_limiter import get_rate_limiter
+from features.membership.infrastructure.repositories.cached_membership_repository import CachedMembershipRepository
+from features.membership.infrastructure.repositories.membership_repository_postgres import MembershipRepositoryPostgres
+from features.membership.infrastructure.repositories.shared_catalog_membership_repository import SharedCatalogMembershipRepository
+from features.membership.infrastructure.repositories.snapshot_membership_repository import SnapshotMembershipRepository
+from features.membership.infrastructure.shared_catalog.shared_catalog_store import SharedCatalogStore, get_shared_catalog_store
+from features.membership.infrastructure.snapshots.membership_snapshots import MembershipSnapshotStore, get_membership_snapshots
+from features.membership.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+
+
+class MembershipContextFactory:
+    """Builds the session-bound part of the stack: unit of work, repository chain and aggregate.
+
+    A singleton holding the optional stores, so they are resolved once
+    rather than on every request (a provider whose value is None, i.e. a
+    disabled store, would be re-evaluated each time).
+    """
+
+    def __init__(
+        self,
+        shared_catalog_store: Optional[SharedCatalogStore],
+        membership_cache: Optional[MembershipCache],
+        membership_snapshots: Optional[MembershipSnapshotStore]
+    ):
+        self.shared_catalog_store = shared_catalog_store
+        self.membership_cache = membership_cache
+        self.membership_snapshots = membership_snapshots
+
+    def create(self, session: AsyncSession, tenant: TenantContext) -> MembershipContext:
+        unit_of_work = SqlAlchemyUnitOfWork(session)
+        repository = MembershipRepositoryPostgres(session)
+        if self.shared_catalog_store is not None:
+            repository = SharedCatalogMembershipRepository(repository, self.shared_catalog_store, unit_of_work)
+        # Reads pinned to the primary must see the caller's own writes, which
+        # another worker's cache may not know about yet
+        if self.membership_cache is not None and not session.info.get(PINNED_SESSION):
+            repository = CachedMembershipRepository(
+                repository,
+                self.membership_cache,
+                unit_of_work,
+                fill=not session.info.get(REPLICA_SESSION)
+            )
+        if self.membership_snapshots is not None:
+            repository = SnapshotMembershipRepository(repository, self.membership_snapshots, unit_of_work)
+        return MembershipContext(MembershipAggregate(repository), unit_of_work, tenant)
+
+
+class MembershipContainer(containers.DeclarativeContainer):
+    """Wires the membership feature.
+
+    Everything is an app-lifetime singleton; only the MembershipContext made
+    by membership_context_factory is built per request, from the request's
+    session and tenant.
+    """
+
+    # Optional stores, configured from the environment (None when disabled)
+    shared_catalog_store = providers.Singleton(get_shared_catalog_store)
+    membership_cache = providers.Singleton(get_membership_cache)
+    membership_snapshots = providers.Singleton(get_membership_snapshots)
+    rate_limiter = providers.Singleton(get_rate_limiter)
+
+    create_membership = providers.Singleton(CreateMembershipUseCase)
+    get_membership = providers.Singleton(GetMembershipUseCase)
+    get_daily_membership = providers.Singleton(GetDailyMembershipUseCase)
+    list_memberships = providers.Singleton(GetMembershipsUseCase)
+    get_membership_stamp = providers.Singleton(GetMembershipStampUseCase)
+    get_daily_membership_stamp = providers.Singleton(GetDailyMembershipStampUseCase)
+    get_membership_catalog_stamp = providers.Singleton(GetMembershipCatalogStampUseCase)
+    get_membership_catalog = providers.Singleton(GetMembershipCatalogUseCase)
+    export_memberships = providers.Singleton(ExportMembershipsUseCase)
+    update_membership = providers.Singleton(UpdateMembershipUseCase)
+    delete_membership = providers.Singleton(DeleteMembershipUseCase)
+    bulk_create_memberships = providers.Singleton(BulkCreateMembershipsUseCase)
+    bulk_update_memberships = providers.Singleton(BulkUpdateMembershipsUseCase, update_membership=update_membership)
+    bulk_delete_memberships = providers.Singleton(BulkDeleteMembershipsUseCase)
+    import_memberships = providers.Singleton(ImportMembershipsUseCase)
+
+    membership_service = providers.Singleton(
+        MembershipService,
+        create_membership=create_membership,
+        get_membership=get_membership,
+        get_daily_membership=get_daily_membership,
+        list_memberships=list_memberships,
+        get_membership_stamp=get_membership_stamp,
+        get_daily_membership_stamp=get_daily_membership_stamp,
+        get_membership_catalog_stamp=get_membership_catalog_stamp,
+        get_membership_catalog=get_membership_catalog,
+        export_memberships=export_memberships,
+        update_membership=update_membership,
+        delete_membership=delete_membership,
+        bulk_create_memberships=bulk_create_memberships,
+        bulk_update_memberships=bulk_update_memberships,
+        bulk_delete_memberships=bulk_delete_memberships,
+        import_memberships=import_memberships
+    )
+
+    membership_context_factory = providers.Singleton(
+        MembershipContextFactory,
+        shared_catalog_store=shared_catalog_store,
+        membership_cache=membership_cache,
+        membership_snapshots=membership_snapshots
+    )
+
+
+membership_container = MembershipContainer()
@@ -0,0 +1,68 @@
+import math
+from typing import Any, Awaitable, Callable, Optional, Protocol, Sequence
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from features.membership.infrastructure.rate_limiting.rate_limiter import RateLimiter
+
+LIMITED_BODY = b'{"detail":"Rate limit exceeded","error_code":"RATE_LIMITED"}'
+
+
+class Principal(Protocol):
+    id: str
+    id_gym: Optional[str]
+    scopes: Sequence[str]
+
+
+PrincipalResolver = Callable[[str], Awaitable[Optional[Principal]]]
+
+
+class RateLimitMiddleware:
+    """Answers 429 with Retry-After once the caller's user or gym bucket is empty.
+
+    The caller is the principal of the bearer token, resolved with
+    resolve_principal (None for tokens it rejects). Requests without a token
+    or a gym are passed through; authentication is left to the routes.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter, resolve_principal: PrincipalResolver):
+        self.app = app
+        self.limiter = limiter
+        self.resolve_principal = resolve_principal
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            token = _bearer_token(scope["headers"])
+            if token is not None:
+                principal = await self.resolve_principal(token)
+                if principal is not None and principal.id_gym:
+                    wait = await self.limiter.acquire(principal.id_gym, principal.id, principal.scopes)
+                    if wait:
+                        await _send_limited(send, wait)
+                        return
+        await self.app(scope, receive, send)
+
+
+def _bearer_token(headers: Any) -> Optional[str]:
+    # Raw header scan; cheaper than building a Headers object on every request
+    for name, value in headers:
+        if name == b"authorization":
+            scheme, _, credentials = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and credentials:
+                return credentials
+            return None
+    return None
+
+
+async def _send_limited(send: Send, wait: float) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(LIMITED_BODY)).encode()),
+            # Whole seconds, rounded up so a retry at that time finds a token
+            (b"retry-after", str(max(math.ceil(wait), 1)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": LIMITED_BODY})
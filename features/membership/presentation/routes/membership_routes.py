@@ -1,24 +1,59 @@
 
-from fastapi import APIRouter, Depends, Security, Query
+from fastapi import APIRouter, Depends, Header, Request, Response, Security, Query
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Annotated, Optional
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Set, Union
+import hashlib
 import uuid
 
 
+from features.membership.application.errors.membership_errors import DailyMembershipNotFoundError, InvalidMembershipDataError
+from features.membership.application.membership_context import MembershipContext, TenantContext
 from features.membership.application.service import MembershipService
+from features.membership.application.use_cases.response_fields import IDENTITY_FIELDS
 from features.membership.application.dtos.membership_dtos import (
+    MembershipBulkCreateDTO,
+    MembershipBulkDeleteDTO,
+    MembershipBulkResponseDTO,
+    MembershipBulkUpdateDTO,
+    MembershipImportStatusDTO,
     MembershipListResponseDTO,
+    MembershipCursorPageDTO,
     MembershipCreateDTO,
     MembershipUpdateDTO,
     MembershipResponseDTO
 )
-from features.membership.domain.membership_aggregate import MembershipAggregate
-from features.membership.infrastructure.repositories.membership_repository_postgres import MembershipRepositoryPostgres
+from features.membership.domain.object_values.membership_stamp import MembershipCatalogStamp
+from features.membership.infrastructure.exports.membership_export_writer import EXPORT_FORMATS, encode_export
+from features.membership.infrastructure.imports.membership_import_jobs import membership_import_jobs
+from features.membership.infrastructure.imports.membership_import_reader import IMPORT_FORMATS, detect_import_format
+from features.membership.infrastructure.snapshots.membership_snapshots import GymCatalogSnapshot
+from features.membership.presentation.membership_container import membership_container
+from features.membership.presentation.encoding.response_encoders import JsonEncoder, ResponseEncoder, ResponseEncoders
 
 # Import from our new development modules
-from dev_utils.dev_database import get_session
+from dev_utils.db_admission import AdmissionLane
+from dev_utils.dev_database import (
+    DeferredReadSession,
+    admitted_session,
+    get_admission_controller,
+    get_deferred_priority_read_session,
+    get_deferred_read_session,
+    get_priority_read_session,
+    get_read_session,
+    get_session,
+    is_pinned_to_primary,
+    pin_to_primary
+)
 from dev_utils.dev_security import get_current_active_user, Scopes, User
 
+# Used when the app registered no response encoders
+JSON_ENCODER = JsonEncoder()
+
 # Router
 router = APIRouter(
     prefix="/api/memberships",
@@ -27,16 +62,210 @@ router = APIRouter(
 )
 
 
-def get_membership_service(db: AsyncSession, current_user: User) -> MembershipService:
-    repository = MembershipRepositoryPostgres(db)
-    aggregate = MembershipAggregate(repository)
-    return MembershipService(aggregate, current_user.model_dump())
+def get_membership_service() -> MembershipService:
+    return membership_container.membership_service()
+
+
+@lru_cache(maxsize=4096)
+def tenant_context(user_id: str, gym_id: str) -> TenantContext:
+    # Immutable, so each user/gym pair is parsed once and then shared
+    return TenantContext(user_id=user_id, gym_id=uuid.UUID(gym_id))
+
+
+def membership_context(db: AsyncSession, current_user: User) -> MembershipContext:
+    """The per-request state: the session-bound stack and the caller's tenant"""
+    tenant = tenant_context(current_user.id, current_user.id_gym)
+    return membership_container.membership_context_factory().create(db, tenant)
+
+
+async def get_catalog_snapshot(
+    current_user: User,
+    lane: AdmissionLane = AdmissionLane.DEFAULT
+) -> Optional[GymCatalogSnapshot]:
+    """The gym's serialized catalog, or None when snapshots are disabled"""
+    snapshots = membership_container.membership_snapshots()
+    if snapshots is None:
+        return None
+
+    async def load():
+        # Rebuilt from the primary so a lagging replica is never frozen into it
+        async with admitted_session(lane) as db:
+            return await get_membership_service().get_membership_catalog(membership_context(db, current_user))
+
+    return await snapshots.get(uuid.UUID(current_user.id_gym), load)
+
+
+def membership_etag(membership_id: uuid.UUID, version: int) -> str:
+    # The ID is part of the tag because /daily may start serving another
+    # membership that happens to have the same version
+    return f'"{membership_id}.{version}"'
+
+
+def catalog_etag(current_user: User, stamp: MembershipCatalogStamp, params: Dict[str, Any]) -> str:
+    """Strong ETag of a list response: the gym, its query parameters and the stamp of the filtered set"""
+    last_updated_at = stamp.last_updated_at.isoformat() if stamp.last_updated_at else ""
+    key = "|".join((
+        current_user.id_gym,
+        *(f"{name}={value}" for name, value in sorted(params.items())),
+        str(stamp.count),
+        last_updated_at,
+        str(stamp.version_sum),
+    ))
+    return f'"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+
+def page_etag(current_user: User, result: MembershipCursorPageDTO, params: Dict[str, Any]) -> str:
+    """Strong ETag of a cursor page: the gym, its query parameters and the rows it returned"""
+    key = "|".join((
+        current_user.id_gym,
+        *(f"{name}={value}" for name, value in sorted(params.items())),
+        *(f"{item.id}.{item.version}" for item in result.items),
+        result.next_cursor or "",
+        result.prev_cursor or "",
+    ))
+    return f'"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """Return the version a conditional write expects, or None when unconditional."""
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        # Bare versions (the previous ETag format) are still accepted
+        return int(if_match.strip().removeprefix("W/").strip('"').rpartition(".")[2])
+    except ValueError as e:
+        raise InvalidMembershipDataError("If-Match", "expected an ETag returned by this API") from e
+
+
+def is_conditional(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when there is no If-None-Match (RFC 9110)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have second precision
+    return last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    # Stored timestamps are naive local times; astimezone() reads them as such
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def split_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Field names of a ?fields= projection; the use cases validate them"""
+    names = [name.strip() for name in fields.split(",") if name.strip()] if fields else []
+    return names or None
+
+
+def unselected_fields(fields: Optional[List[str]]) -> Optional[Set[str]]:
+    """Response fields left out by a projection (projected DTOs may carry extra columns)"""
+    return set(MembershipResponseDTO.model_fields) - {*fields, *IDENTITY_FIELDS} if fields else None
+
+
+def response_encoder(request: Request) -> ResponseEncoder:
+    """The encoder negotiated from Accept among those registered on the app (JSON by default)"""
+    encoders: Optional[ResponseEncoders] = getattr(request.app.state, "response_encoders", None)
+    if encoders is None:
+        return JSON_ENCODER
+    return encoders.negotiate_media(request.headers.get("accept"))
+
+
+def representation_headers(encoder: ResponseEncoder, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    headers = {**(headers or {}), "Vary": "Accept"}
+    # Other media types carry the same data as the JSON body, so their validators are weak
+    etag = headers.get("ETag")
+    if etag and encoder.media_type != JSON_ENCODER.media_type and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+    return headers
+
+
+def dto_response(
+    request: Request,
+    dto: BaseModel,
+    headers: Optional[Dict[str, str]] = None,
+    exclude: Any = None,
+    status_code: int = 200
+) -> Response:
+    """Serialize a response DTO once, in the negotiated media type.
+
+    Returning a Response skips FastAPI's response_model validation and
+    re-serialization; the route's response_model still documents the schema.
+    """
+    encoder = response_encoder(request)
+    return Response(
+        content=encoder.encode_model(dto, exclude=exclude),
+        status_code=status_code,
+        media_type=encoder.media_type,
+        headers=representation_headers(encoder, headers)
+    )
+
+
+def json_body_response(request: Request, body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Response for a body already serialized as JSON (snapshots), re-encoded if needed"""
+    encoder = response_encoder(request)
+    return Response(
+        content=encoder.encode_json(body),
+        media_type=encoder.media_type,
+        headers=representation_headers(encoder, headers)
+    )
+
+
+def not_modified_response(request: Request, etag: str, last_modified: Optional[datetime] = None) -> Response:
+    return Response(
+        status_code=304,
+        headers=representation_headers(response_encoder(request), validator_headers(etag, last_modified))
+    )
 
 # Routes
 
 @router.post("/", response_model=MembershipResponseDTO, status_code=201)
 async def create_membership(
     membership_data: MembershipCreateDTO,
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[
+        User,
+        Security(
+            get_current_active_user,
+            scopes=[Scopes.GymSuperAdmin.value],
+        ),
+    ]
+):
+    service = get_membership_service()
+    context = membership_context(db, current_user)
+    membership = await service.create_membership(context, membership_data)
+    # A returned Response is sent as is, so the pin goes on it directly
+    response = dto_response(
+        request, membership, {"ETag": membership_etag(membership.id, membership.version)}, status_code=201
+    )
+    pin_to_primary(response)
+    return response
+
+# Bulk routes are declared before "/{membership_id}" so "bulk" is not parsed as an ID.
+# Each returns one result per item, in request order; applied items commit together.
+
+@router.post("/bulk", response_model=MembershipBulkResponseDTO)
+async def bulk_create_memberships(
+    bulk_data: MembershipBulkCreateDTO,
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_session)],
     current_user: Annotated[
         User,
@@ -46,42 +275,279 @@ async def create_membership(
         ),
     ]
 ):
-    service = get_membership_service(db, current_user)
-    return await service.create_membership(membership_data)
+    service = get_membership_service()
+    context = membership_context(db, current_user)
+    result = await service.bulk_create_memberships(context, bulk_data)
+    response = dto_response(request, result)
+    pin_to_primary(response)
+    return response
+
+@router.put("/bulk", response_model=MembershipBulkResponseDTO)
+async def bulk_update_memberships(
+    bulk_data: MembershipBulkUpdateDTO,
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[
+        User,
+        Security(
+            get_current_active_user,
+            scopes=[Scopes.GymSuperAdmin.value],
+        ),
+    ]
+):
+    service = get_membership_service()
+    context = membership_context(db, current_user)
+    result = await service.bulk_update_memberships(context, bulk_data)
+    response = dto_response(request, result)
+    pin_to_primary(response)
+    return response
+
+@router.delete("/bulk", response_model=MembershipBulkResponseDTO)
+async def bulk_delete_memberships(
+    bulk_data: MembershipBulkDeleteDTO,
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[
+        User,
+        Security(
+            get_current_active_user,
+            scopes=[Scopes.GymSuperAdmin.value],
+        ),
+    ]
+):
+    service = get_membership_service()
+    context = membership_context(db, current_user)
+    result = await service.bulk_delete_memberships(context, bulk_data)
+    response = dto_response(request, result)
+    pin_to_primary(response)
+    return response
+
+@router.post(
+    "/import",
+    response_model=MembershipImportStatusDTO,
+    status_code=202,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_memberships(
+    request: Request,
+    current_user: Annotated[
+        User,
+        Security(
+            get_current_active_user,
+            scopes=[Scopes.GymSuperAdmin.value],
+        ),
+    ],
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$", description="File format; defaults to the Content-Type")
+):
+    """Start a background import of a CSV/NDJSON file sent as the raw request body"""
+    import_format = format or detect_import_format(request.headers.get("content-type"))
+    if import_format is None:
+        raise InvalidMembershipDataError("format", f"expected one of {', '.join(IMPORT_FORMATS)}")
+
+    async def run(chunks, progress, reject):
+        # The job outlives the request, so it gets its own session
+        async with admitted_session() as db:
+            service = get_membership_service()
+            context = membership_context(db, current_user)
+            return await service.import_memberships(context, chunks, progress, reject)
+
+    job = await membership_import_jobs.start(
+        request.stream(),
+        import_format,
+        uuid.UUID(current_user.id_gym),
+        run
+    )
+    return dto_response(request, job, status_code=202)
+
+@router.get("/import/{job_id}", response_model=MembershipImportStatusDTO)
+async def get_membership_import(
+    job_id: uuid.UUID,
+    request: Request,
+    current_user: Annotated[
+        User,
+        Security(
+            get_current_active_user,
+            scopes=[Scopes.GymSuperAdmin.value],
+        ),
+    ]
+):
+    return dto_response(request, membership_import_jobs.get(job_id, uuid.UUID(current_user.id_gym)))
+
+@router.get("/import/{job_id}/rejected")
+async def get_membership_import_rejected_rows(
+    job_id: uuid.UUID,
+    current_user: Annotated[
+        User,
+        Security(
+            get_current_active_user,
+            scopes=[Scopes.GymSuperAdmin.value],
+        ),
+    ]
+):
+    path = membership_import_jobs.rejected_rows_path(job_id, uuid.UUID(current_user.id_gym))
+    return FileResponse(path, media_type="application/x-ndjson", filename=f"membership-import-{job_id}-rejected.ndjson")
+
+@router.get("/export")
+async def export_memberships(
+    db: Annotated[AsyncSession, Depends(get_read_session)],
+    current_user: Annotated[
+        User,
+        Security(
+            get_current_active_user,
+            scopes=[Scopes.GymSuperAdmin.value, Scopes.GymAdmin.value],
+        ),
+    ],
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Output format (ndjson/csv)"),
+    status: Optional[str] = Query(None, description="Filter by status (active/inactive)")
+):
+    """Stream the whole catalog of the gym; the session stays open until the body is sent"""
+    service = get_membership_service()
+    context = membership_context(db, current_user)
+    batches = await service.export_memberships(context, status)
+    return StreamingResponse(
+        encode_export(batches, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="memberships-{current_user.id_gym}.{format}"'}
+    )
+
+@router.get("/cache/stats")
+async def get_membership_cache_stats(
+    current_user: Annotated[
+        User,
+        Security(
+            get_current_active_user,
+            scopes=[Scopes.GymSuperAdmin.value],
+        ),
+    ]
+):
+    """Hit/miss/eviction counters of this worker's membership cache"""
+    cache = membership_container.membership_cache()
+    return cache.snapshot() if cache is not None else {"backend": None}
+
+@router.get("/rate-limit/stats")
+async def get_rate_limit_stats(
+    current_user: Annotated[
+        User,
+        Security(
+            get_current_active_user,
+            scopes=[Scopes.GymSuperAdmin.value],
+        ),
+    ]
+):
+    """Allowed/limited counters of this worker's rate limiter"""
+    limiter = membership_container.rate_limiter()
+    return limiter.snapshot() if limiter is not None else {"backend": None}
+
+@router.get("/admission/stats")
+async def get_admission_stats(
+    current_user: Annotated[
+        User,
+        Security(
+            get_current_active_user,
+            scopes=[Scopes.GymSuperAdmin.value],
+        ),
+    ]
+):
+    """Limit, in-flight count, queue waits and rejections of this worker's database admission control"""
+    primary = get_admission_controller()
+    replica = get_admission_controller(replica=True)
+    return {
+        "primary": primary.snapshot() if primary is not None else None,
+        "replica": replica.snapshot() if replica is not None and replica is not primary else None,
+    }
 
 @router.get("/daily", response_model=MembershipResponseDTO)
 async def get_membership_daily(
-    db: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    read_session: Annotated[DeferredReadSession, Depends(get_deferred_priority_read_session)],
     current_user: Annotated[
         User,
         Security(
             get_current_active_user,
             scopes=[Scopes.GymSuperAdmin.value, Scopes.GymAdmin.value, Scopes.GymWorker.value],
         ),
-    ]
+    ],
+    fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return, e.g. id,name,price,duration_days")
 ):
-    service = get_membership_service(db, current_user)
-    return await service.get_daily_membership()
+    field_names = split_fields(fields)
+    # Snapshots hold the full representation only, and may predate the
+    # caller's own writes
+    use_snapshot = field_names is None and not is_pinned_to_primary(request)
+    snapshot = await get_catalog_snapshot(current_user, AdmissionLane.PRIORITY) if use_snapshot else None
+    if snapshot is not None:
+        stamp = snapshot.daily_stamp
+        if stamp is None:
+            raise DailyMembershipNotFoundError(tenant_context(current_user.id, current_user.id_gym).gym_id)
+        etag = membership_etag(stamp.id, stamp.version)
+        if is_not_modified(request, etag, stamp.updated_at):
+            return not_modified_response(request, etag, stamp.updated_at)
+        return json_body_response(request, snapshot.daily, validator_headers(etag, stamp.updated_at))
+
+    # Only a snapshot miss takes a database slot
+    db = await read_session.get()
+    service = get_membership_service()
+
+    context = membership_context(db, current_user)
+    if is_conditional(request):
+        stamp = await service.get_daily_membership_stamp(context)
+        if stamp is not None:
+            etag = membership_etag(stamp.id, stamp.version)
+            if is_not_modified(request, etag, stamp.updated_at):
+                return not_modified_response(request, etag, stamp.updated_at)
+
+    membership = await service.get_daily_membership(context, field_names)
+    return dto_response(
+        request,
+        membership,
+        validator_headers(membership_etag(membership.id, membership.version), membership.updated_at),
+        exclude=unselected_fields(field_names)
+    )
 
 @router.get("/{membership_id}", response_model=MembershipResponseDTO)
 async def get_membership(
     membership_id: uuid.UUID,
-    db: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_priority_read_session)],
     current_user: Annotated[
         User,
         Security(
             get_current_active_user,
             scopes=[Scopes.GymSuperAdmin.value, Scopes.GymAdmin.value, Scopes.GymWorker.value],
         ),
-    ]
+    ],
+    fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return, e.g. id,name,price,duration_days")
 ):
 
-    service = get_membership_service(db, current_user)
-    return await service.get_membership(membership_id)
+    field_names = split_fields(fields)
+    service = get_membership_service()
+    context = membership_context(db, current_user)
+    if is_conditional(request):
+        stamp = await service.get_membership_stamp(context, membership_id)
+        if stamp is not None:
+            etag = membership_etag(stamp.id, stamp.version)
+            if is_not_modified(request, etag, stamp.updated_at):
+                return not_modified_response(request, etag, stamp.updated_at)
+
+    membership = await service.get_membership(context, membership_id, field_names)
+    return dto_response(
+        request,
+        membership,
+        validator_headers(membership_etag(membership.id, membership.version), membership.updated_at),
+        exclude=unselected_fields(field_names)
+    )
 
-@router.get("/", response_model=MembershipListResponseDTO)
+@router.get("/", response_model=Union[MembershipListResponseDTO, MembershipCursorPageDTO])
 async def get_memberships(
-    db: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    read_session: Annotated[DeferredReadSession, Depends(get_deferred_read_session)],
     current_user: Annotated[
         User,
         Security(
@@ -92,16 +558,65 @@ async def get_memberships(
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     size: int = Query(10, ge=1, le=100, description="Number of items per page"),
     status: Optional[str] = Query(None, description="Filter by status (active/inactive)"),
-    search: Optional[str] = Query(None, description="Search by name or description")
+    search: Optional[str] = Query(None, description="Search by name or description"),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$", description="Pagination mode (offset/cursor)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from next_cursor/prev_cursor (implies cursor mode)"),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return, e.g. id,name,price,duration_days")
 ):
 
-    service = get_membership_service(db, current_user)
-    return await service.list_memberships(page=page, size=size, status=status, search=search)
+    field_names = split_fields(fields)
+    params = dict(page=page, size=size, status=status, search=search, pagination=pagination, cursor=cursor, fields=fields)
+
+    if pagination == "offset" and cursor is None and not status and not search and field_names is None \
+            and not is_pinned_to_primary(request):
+        snapshot = await get_catalog_snapshot(current_user)
+        if snapshot is not None:
+            etag = catalog_etag(current_user, snapshot.stamp, params)
+            if is_not_modified(request, etag):
+                return not_modified_response(request, etag)
+            return json_body_response(request, snapshot.page(page, size), validator_headers(etag))
+
+    db = await read_session.get()
+    service = get_membership_service()
+
+    context = membership_context(db, current_user)
+    excluded = unselected_fields(field_names)
+    if pagination == "cursor" or cursor is not None:
+        # A keyset page is one indexed seek, so its tag comes from the page
+        # itself rather than from an aggregate over the whole filtered set
+        result = await service.list_memberships(
+            context, size=size, status=status, search=search, cursor=cursor, pagination="cursor", fields=field_names
+        )
+        etag = page_etag(current_user, result, params)
+        if is_not_modified(request, etag):
+            return not_modified_response(request, etag)
+        return dto_response(request, result, validator_headers(etag), exclude={"items": {"__all__": excluded}} if excluded else None)
+
+    # Read before the page, whose total it also provides: a write in between
+    # leaves an older tag, which only costs the client one more full
+    # response. No Last-Modified here, since deletes do not move the newest
+    # updated_at.
+    stamp = await service.get_membership_catalog_stamp(context, status, search)
+    etag = catalog_etag(current_user, stamp, params)
+    if is_not_modified(request, etag):
+        return not_modified_response(request, etag)
+
+    result = await service.list_memberships(
+        context,
+        page=page,
+        size=size,
+        status=status,
+        search=search,
+        fields=field_names,
+        total=stamp.count
+    )
+    return dto_response(request, result, validator_headers(etag), exclude={"items": {"__all__": excluded}} if excluded else None)
 
 @router.put("/{membership_id}", status_code=204)
 async def update_membership(
     membership_id: uuid.UUID,
     membership_data: MembershipUpdateDTO,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_session)],
     current_user: Annotated[
         User,
@@ -109,16 +624,22 @@ async def update_membership(
             get_current_active_user,
             scopes=[Scopes.GymSuperAdmin.value],
         ),
-    ]
+    ],
+    if_match: Optional[str] = Header(None, description="ETag of the version being modified; 412 if stale")
 ):
 
-    service = get_membership_service(db, current_user)
-    await service.update_membership(membership_id, membership_data)
+    service = get_membership_service()
+
+    context = membership_context(db, current_user)
+    membership = await service.update_membership(context, membership_id, membership_data, parse_if_match(if_match))
+    response.headers["ETag"] = membership_etag(membership.id, membership.version)
+    pin_to_primary(response)
     return None
 
 @router.delete("/{membership_id}", status_code=204)
 async def delete_membership(
     membership_id: uuid.UUID,
+    response: Response,
     db:Annotated[AsyncSession, Depends(get_session)],
     current_user: Annotated[
         User,
@@ -128,6 +649,8 @@ async def delete_membership(
         ),
     ]
 ):
-    service = get_membership_service(db, current_user)
-    await service.delete_membership(membership_id)
+    service = get_membership_service()
+    context = membership_context(db, current_user)
+    await service.delete_membership(context, membership_id)
+    pin_to_primary(response)
     return None
\ No newline at end of file
@@ -2,9 +2,21 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import logging
+import os
 
 
+from dev_utils.dev_security import principal_from_token
 from features.membership import membership_router
+from features.membership.presentation.membership_container import membership_container
+from features.membership.presentation.rate_limiting.rate_limit_middleware import RateLimitMiddleware
+from features.membership.presentation.encoding.compression_middleware import CompressionMiddleware
+from features.membership.presentation.encoding.response_encoders import (
+    BrotliCoding,
+    GzipCoding,
+    JsonEncoder,
+    MsgpackEncoder,
+    ResponseEncoders,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -17,6 +29,34 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+# Response media types and content codings, set up once for the whole app.
+# JSON and gzip are always there; msgpack and brotli need their optional packages.
+response_encoders = ResponseEncoders()
+response_encoders.register_media(JsonEncoder())
+try:
+    response_encoders.register_media(MsgpackEncoder())
+except ImportError:
+    logger.info("msgpack is not installed; application/msgpack responses are disabled")
+try:
+    # Registered first so it wins over gzip when the client accepts both equally
+    response_encoders.register_coding(BrotliCoding())
+except ImportError:
+    logger.info("brotli is not installed; br compression is disabled")
+response_encoders.register_coding(GzipCoding())
+app.state.response_encoders = response_encoders
+
+app.add_middleware(
+    CompressionMiddleware,
+    encoders=response_encoders,
+    minimum_size=int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024")),
+)
+
+# Added after compression so it runs first and a rejected request costs no work;
+# CORS still wraps it, so browsers can read the 429
+rate_limiter = membership_container.rate_limiter()
+if rate_limiter is not None:
+    app.add_middleware(RateLimitMiddleware, limiter=rate_limiter, resolve_principal=principal_from_token)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -32,6 +72,19 @@ async def startup_event():
     await seed_all()
     logger.info("Database initialized and seeded successfully")
 
+    from dev_utils.dev_database import admitted_session
+    from features.membership.infrastructure.shared_catalog.shared_catalog_refresher import SharedCatalogRefresher
+    store = membership_container.shared_catalog_store()
+    if store is not None:
+        app.state.shared_catalog_refresher = SharedCatalogRefresher(store, admitted_session)
+        app.state.shared_catalog_refresher.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    refresher = getattr(app.state, "shared_catalog_refresher", None)
+    if refresher is not None:
+        await refresher.stop()
+
 app.include_router(membership_router)
 
 from features.membership.application.errors.membership_errors import MembershipError
@@ -0,0 +1,168 @@
+import uuid
+from typing import List, Optional
+
+import httpx
+import pytest
+from dependency_injector import providers
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from dev_utils import dev_database
+from dev_utils.dev_database import Base
+from dev_utils.dev_gym_model import GymModel
+from dev_utils.dev_security import Scopes, User, get_current_active_user
+from features.membership import membership_router
+from features.membership.application.errors.membership_errors import MembershipError
+from features.membership.application.dtos.membership_dtos import MembershipBulkCreateDTO, MembershipCreateDTO
+from features.membership.application.membership_context import MembershipContext, TenantContext
+from features.membership.application.service import MembershipService
+from features.membership.domain.enums.membership_enums import MembershipType
+from features.membership.infrastructure.entities.membership_model import MembershipModel  # noqa: F401 (registers the table)
+from features.membership.infrastructure.snapshots.membership_snapshots import MembershipSnapshotStore
+from features.membership.presentation.encoding.compression_middleware import CompressionMiddleware
+from features.membership.presentation.encoding.response_encoders import (
+    BrotliCoding,
+    GzipCoding,
+    JsonEncoder,
+    MsgpackEncoder,
+    ResponseEncoders
+)
+from features.membership.presentation.membership_container import MembershipContextFactory, membership_container
+from main import membership_error_handler
+
+GYM_ID = uuid.UUID("a0000000-0000-0000-0000-00000000000a")
+OTHER_GYM_ID = uuid.UUID("b0000000-0000-0000-0000-00000000000b")
+
+
+class StatementLog:
+    """SQL statements sent through an engine, for round-trip assertions"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    def clear(self) -> None:
+        self.statements.clear()
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    # A file database, so concurrent sessions get real separate connections
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=NullPool)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def enforce_foreign_keys(connection, record):
+        connection.execute("PRAGMA foreign_keys=ON")
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add_all([GymModel(id=GYM_ID, name="Gym"), GymModel(id=OTHER_GYM_ID, name="Other gym")])
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def statement_log(engine) -> StatementLog:
+    log = StatementLog()
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(connection, cursor, statement, parameters, context, executemany):
+        log.statements.append(statement)
+
+    return log
+
+
+@pytest.fixture
+def session_factory(engine) -> async_sessionmaker:
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def service() -> MembershipService:
+    return membership_container.membership_service()
+
+
+@pytest.fixture
+def make_context():
+    """Builds the plain repository stack (no cache, shared catalog or snapshots) for a session"""
+    factory = MembershipContextFactory(None, None, None)
+
+    def make(session: AsyncSession, gym_id: uuid.UUID = GYM_ID) -> MembershipContext:
+        return factory.create(session, TenantContext(user_id="11111111-1111-1111-1111-111111111111", gym_id=gym_id))
+
+    return make
+
+
+def membership_data(index: int, **overrides) -> MembershipCreateDTO:
+    values = dict(
+        name=f"Plan {index:03d}",
+        description=f"Monthly plan number {index}",
+        price=10 + index,
+        duration_days=30,
+        type=MembershipType.REGULAR
+    )
+    values.update(overrides)
+    return MembershipCreateDTO(**values)
+
+
+@pytest.fixture
+def seed(session_factory, service, make_context):
+    async def seed(count: int, gym_id: uuid.UUID = GYM_ID, **overrides) -> None:
+        async with session_factory() as session:
+            items = [membership_data(index, **overrides) for index in range(count)]
+            result = await service.bulk_create_memberships(make_context(session, gym_id), MembershipBulkCreateDTO(items=items))
+            assert result.failed == 0
+
+    return seed
+
+
+@pytest.fixture
+def membership_snapshots() -> Optional[MembershipSnapshotStore]:
+    """Snapshot store behind the api fixture; override it in a module to serve reads from snapshots"""
+    return None
+
+
+@pytest.fixture
+async def api(monkeypatch, session_factory, membership_snapshots):
+    """HTTP client for the membership routes, as a super admin of GYM_ID, against the test database"""
+    # The real session dependencies, over the test engine and without admission control
+    monkeypatch.setattr(dev_database, "get_sessionmaker", lambda: session_factory)
+    monkeypatch.setattr(dev_database, "get_replica_sessionmaker", lambda: session_factory)
+    monkeypatch.setattr(dev_database, "get_admission_controller", lambda replica=False: None)
+
+    encoders = ResponseEncoders()
+    encoders.register_media(JsonEncoder())
+    encoders.register_media(MsgpackEncoder())
+    encoders.register_coding(BrotliCoding())
+    encoders.register_coding(GzipCoding())
+    app = FastAPI()
+    app.state.response_encoders = encoders
+    app.add_middleware(CompressionMiddleware, encoders=encoders)
+    app.include_router(membership_router)
+    app.add_exception_handler(MembershipError, membership_error_handler)
+    app.dependency_overrides[get_current_active_user] = lambda: User(
+        username="superadmin",
+        email="superadmin@example.com",
+        full_name="Super Admin User",
+        scopes=[Scopes.GymSuperAdmin.value],
+        id_gym=str(GYM_ID),
+        id="11111111-1111-1111-1111-111111111111"
+    )
+
+    membership_container.membership_snapshots.override(providers.Object(membership_snapshots))
+    membership_container.membership_context_factory.override(
+        providers.Object(MembershipContextFactory(None, None, membership_snapshots))
+    )
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        membership_container.membership_snapshots.reset_override()
+        membership_container.membership_context_factory.reset_override()
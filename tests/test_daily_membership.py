@@ -0,0 +1,26 @@
+import pytest
+
+from features.membership.application.errors.membership_errors import DailyMembershipNotFoundError
+from features.membership.domain.enums.membership_enums import MembershipType
+from tests.conftest import GYM_ID, membership_data
+
+
+@pytest.mark.parametrize("fields", [None, ["id", "name"]])
+async def test_missing_daily_pass_names_the_gym(session_factory, service, make_context, fields):
+    async with session_factory() as session:
+        with pytest.raises(DailyMembershipNotFoundError) as raised:
+            await service.get_daily_membership(make_context(session), fields)
+
+    assert raised.value.status_code == 404
+    assert raised.value.detail == f"No active daily membership found for gym {GYM_ID}"
+
+
+async def test_daily_pass_is_found(session_factory, service, make_context):
+    async with session_factory() as session:
+        created = await service.create_membership(
+            make_context(session), membership_data(1, duration_days=1, type=MembershipType.DAILY)
+        )
+    async with session_factory() as session:
+        daily = await service.get_daily_membership(make_context(session))
+
+    assert daily.id == created.id
@@ -0,0 +1,110 @@
+import os
+
+import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from dev_utils.database_settings import PROFILE_DEFAULTS, DatabaseSettings
+from dev_utils.dev_database import create_engine_from_settings
+
+POOL_KWARGS = ("pool_size", "max_overflow", "pool_timeout", "pool_recycle", "pool_pre_ping")
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in list(os.environ):
+        if name.startswith("DB_") or name == "DATABASE_URL":
+            monkeypatch.delenv(name)
+
+
+@pytest.mark.parametrize("profile", sorted(PROFILE_DEFAULTS))
+def test_engine_kwargs_follow_the_profile(profile):
+    defaults = PROFILE_DEFAULTS[profile]
+    settings = DatabaseSettings.from_env(profile)
+    kwargs = settings.engine_kwargs()
+
+    assert settings.url.startswith("postgresql+asyncpg://")
+    assert kwargs["echo"] is defaults["echo"]
+    if defaults["null_pool"]:
+        assert kwargs["poolclass"] is NullPool
+        assert not set(POOL_KWARGS) & set(kwargs)
+    else:
+        assert "poolclass" not in kwargs
+        assert {name: kwargs[name] for name in POOL_KWARGS} == {name: defaults[name] for name in POOL_KWARGS}
+    assert kwargs["connect_args"] == {
+        "server_settings": {"application_name": f"gym-api-{profile}"},
+        "statement_cache_size": defaults["statement_cache_size"],
+    }
+
+
+def test_environment_overrides_the_profile(monkeypatch):
+    monkeypatch.setenv("DB_PROFILE", "prod")
+    monkeypatch.setenv("DB_POOL_SIZE", "7")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "3")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "off")
+    monkeypatch.setenv("DB_STATEMENT_CACHE_SIZE", "50")
+    settings = DatabaseSettings.from_env()
+    kwargs = settings.engine_kwargs()
+
+    assert settings.profile == "prod"
+    assert (kwargs["pool_size"], kwargs["max_overflow"], kwargs["pool_pre_ping"]) == (7, 3, False)
+    assert kwargs["pool_recycle"] == PROFILE_DEFAULTS["prod"]["pool_recycle"]
+    assert kwargs["connect_args"]["statement_cache_size"] == 50
+    # The admission queues scale with the overridden pool
+    assert (settings.admission_max_queue, settings.admission_priority_max_queue) == (20, 40)
+
+
+def test_unknown_profiles_are_rejected():
+    with pytest.raises(ValueError, match="Unknown database profile 'staging'"):
+        DatabaseSettings.from_env("staging")
+
+
+def test_pgbouncer_disables_every_prepared_statement_cache(monkeypatch):
+    monkeypatch.setenv("DB_PGBOUNCER", "true")
+    connect_args = DatabaseSettings.from_env("prod").engine_kwargs()["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    names = {connect_args["prepared_statement_name_func"]() for _ in range(3)}
+    assert len(names) == 3
+    assert all(name.startswith("__asyncpg_") for name in names)
+
+
+def test_other_drivers_get_no_asyncpg_connect_args(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite:///gym.db")
+    monkeypatch.setenv("DB_PGBOUNCER", "true")
+
+    assert "connect_args" not in DatabaseSettings.from_env("test").engine_kwargs()
+
+
+def test_replica_settings_keep_the_pool(monkeypatch):
+    monkeypatch.setenv("DB_REPLICA_URL", "postgresql+asyncpg://reader@replica/gym")
+    settings = DatabaseSettings.from_env("prod")
+    replica = settings.for_replica()
+    kwargs = replica.engine_kwargs()
+
+    assert (replica.url, replica.replica_url) == ("postgresql+asyncpg://reader@replica/gym", None)
+    assert {name: kwargs[name] for name in POOL_KWARGS} == {
+        name: value for name, value in settings.engine_kwargs().items() if name in POOL_KWARGS
+    }
+    assert kwargs["connect_args"]["server_settings"] == {"application_name": "gym-api-prod-replica"}
+    monkeypatch.delenv("DB_REPLICA_URL")
+    assert DatabaseSettings.from_env("prod").for_replica() is None
+
+
+@pytest.mark.parametrize("profile", sorted(PROFILE_DEFAULTS))
+async def test_engines_are_built_with_the_profile_pool(profile):
+    defaults = PROFILE_DEFAULTS[profile]
+    # Nothing connects until the first statement
+    engine = create_engine_from_settings(DatabaseSettings.from_env(profile))
+    try:
+        pool = engine.pool
+        if defaults["null_pool"]:
+            assert isinstance(pool, NullPool)
+        else:
+            assert isinstance(pool, AsyncAdaptedQueuePool)
+            assert (pool.size(), pool._max_overflow, pool._timeout) == (
+                defaults["pool_size"], defaults["max_overflow"], defaults["pool_timeout"]
+            )
+        assert engine.echo is defaults["echo"]
+    finally:
+        await engine.dispose()
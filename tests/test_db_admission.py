@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from dev_utils.db_admission import AdaptiveConcurrencyLimit, AdmissionController, AdmissionLane, AdmissionRejected
+from dev_utils.dev_database import admitted
+
+
+def _controller(limit: int = 1, max_queue=(4, 4), max_wait_seconds: float = 1.0) -> AdmissionController:
+    return AdmissionController(
+        AdaptiveConcurrencyLimit(initial=limit, min_limit=1, max_limit=limit), max_queue, max_wait_seconds
+    )
+
+
+async def _queued(controller: AdmissionController, lane: AdmissionLane, order: list) -> asyncio.Task:
+    async def wait():
+        await controller.acquire(lane)
+        order.append(lane)
+
+    task = asyncio.create_task(wait())
+    # Let the request reach its queue
+    await asyncio.sleep(0)
+    return task
+
+
+async def test_priority_requests_overtake_the_default_queue():
+    controller = _controller()
+    await controller.acquire(AdmissionLane.DEFAULT)
+    order = []
+    default = await _queued(controller, AdmissionLane.DEFAULT, order)
+    priority = await _queued(controller, AdmissionLane.PRIORITY, order)
+    assert order == []
+
+    controller.release()
+    await priority
+    assert order == [AdmissionLane.PRIORITY]
+
+    controller.release()
+    await default
+    assert order == [AdmissionLane.PRIORITY, AdmissionLane.DEFAULT]
+    assert controller.in_flight == 1
+
+
+async def test_a_full_queue_rejects_at_once():
+    controller = _controller(max_queue=(1, 1))
+    await controller.acquire(AdmissionLane.DEFAULT)
+    queued = await _queued(controller, AdmissionLane.DEFAULT, [])
+
+    with pytest.raises(AdmissionRejected, match="queue is full"):
+        await controller.acquire(AdmissionLane.DEFAULT)
+    assert controller.stats[AdmissionLane.DEFAULT].rejected_queue_full == 1
+
+    controller.release()
+    await queued
+
+
+async def test_waiting_too_long_is_rejected():
+    controller = _controller(max_wait_seconds=0.01)
+    await controller.acquire(AdmissionLane.DEFAULT)
+
+    with pytest.raises(AdmissionRejected, match="timed out"):
+        await controller.acquire(AdmissionLane.DEFAULT)
+    stats = controller.snapshot()["lanes"]["default"]
+    assert (stats["rejected_timeout"], stats["waiting"]) == (1, 0)
+    assert controller.in_flight == 1
+
+
+def test_the_limit_backs_off_on_a_latency_step_and_recovers():
+    limit = AdaptiveConcurrencyLimit(initial=20, min_limit=2, max_limit=20)
+    for _ in range(500):
+        limit.observe(0.001, in_flight=limit.value)
+    assert limit.value == 20
+
+    for _ in range(100):
+        limit.observe(0.01, in_flight=limit.value)
+    backed_off = limit.value
+    assert 2 <= backed_off < 20
+
+    for _ in range(2000):
+        limit.observe(0.001, in_flight=limit.value)
+    assert limit.value == 20
+
+
+async def test_shed_requests_get_a_503_with_retry_after():
+    controller = _controller(max_queue=(0, 0))
+    async with admitted(controller, AdmissionLane.PRIORITY):
+        with pytest.raises(HTTPException) as raised:
+            async with admitted(controller, AdmissionLane.DEFAULT):
+                pass
+        assert controller.in_flight == 1
+
+    assert raised.value.status_code == 503
+    assert raised.value.headers == {"Retry-After": "1"}
+    assert controller.in_flight == 0
@@ -0,0 +1,35 @@
+from contextlib import AsyncExitStack
+
+import pytest
+from starlette.requests import Request
+
+from dev_utils import dev_database
+from dev_utils.db_admission import AdaptiveConcurrencyLimit, AdmissionController, AdmissionLane
+from dev_utils.dev_database import DeferredReadSession, admitted_session
+
+
+@pytest.fixture
+def admission(monkeypatch, session_factory) -> AdmissionController:
+    controller = AdmissionController(AdaptiveConcurrencyLimit(initial=4, min_limit=1, max_limit=4), (8, 8), 1.0)
+    monkeypatch.setattr(dev_database, "get_admission_controller", lambda replica=False: controller)
+    monkeypatch.setattr(dev_database, "get_sessionmaker", lambda: session_factory)
+    monkeypatch.setattr(dev_database, "get_replica_sessionmaker", lambda: session_factory)
+    return controller
+
+
+async def test_deferred_session_takes_no_slot_until_asked_for(admission):
+    async with AsyncExitStack() as stack:
+        deferred = DeferredReadSession(stack, Request({"type": "http", "headers": []}), AdmissionLane.DEFAULT)
+        assert admission.in_flight == 0
+
+        session = await deferred.get()
+        assert await deferred.get() is session
+        assert admission.in_flight == 1
+    assert admission.in_flight == 0
+
+
+async def test_admitted_session_holds_a_slot(admission):
+    async with admitted_session(AdmissionLane.PRIORITY):
+        assert admission.in_flight == 1
+        assert admission.stats[AdmissionLane.PRIORITY].admitted == 1
+    assert admission.in_flight == 0
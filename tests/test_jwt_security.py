@@ -0,0 +1,161 @@
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+from dev_utils.dev_security import User, user_from_claims
+from dev_utils.jwt_security import AuthenticationError, JwksKeySet, JwtAuthenticator
+
+GYM = "a0000000-0000-0000-0000-00000000000a"
+
+
+class FakeIssuer:
+    """A JWKS endpoint backed by locally generated keys, counting fetches"""
+
+    def __init__(self):
+        self.keys = {}
+        self.fetches = 0
+        self.down = False
+
+    def add_rsa_key(self, kid: str):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.keys[kid] = (private_key, jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True))
+        return private_key
+
+    def add_ec_key(self, kid: str):
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        self.keys[kid] = (private_key, jwt.algorithms.ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True))
+        return private_key
+
+    async def fetch(self):
+        self.fetches += 1
+        if self.down:
+            raise OSError("issuer unavailable")
+        return {"keys": [dict(jwk, kid=kid, use="sig") for kid, (_, jwk) in self.keys.items()]}
+
+    def token(self, kid: str, algorithm: str = "RS256", lifetime: float = 300, **claims) -> str:
+        payload = {"sub": "user-1", "id_gym": GYM, "exp": int(time.time() + lifetime), "iss": "https://issuer.test"}
+        payload.update(claims)
+        return jwt.encode(payload, self.keys[kid][0], algorithm=algorithm, headers={"kid": kid})
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def issuer() -> FakeIssuer:
+    issuer = FakeIssuer()
+    issuer.add_rsa_key("rsa-1")
+    return issuer
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def authenticator(issuer, clock) -> JwtAuthenticator[User]:
+    keys = JwksKeySet(issuer.fetch, min_refresh_seconds=30, max_age_seconds=3600, clock=clock)
+    return JwtAuthenticator(keys, user_from_claims, issuer="https://issuer.test", leeway_seconds=0)
+
+
+async def test_verified_token_is_cached(authenticator, issuer):
+    token = issuer.token("rsa-1")
+
+    first = await authenticator.authenticate(token)
+    second = await authenticator.authenticate(token)
+
+    assert (first.id, first.id_gym) == ("user-1", GYM)
+    assert second is first
+    assert issuer.fetches == 1
+    assert len(authenticator.cache) == 1
+
+
+async def test_unknown_kid_refetches_the_keys_once(authenticator, issuer, clock):
+    await authenticator.authenticate(issuer.token("rsa-1"))
+    issuer.add_ec_key("ec-2")
+    clock.now += 31
+
+    user = await authenticator.authenticate(issuer.token("ec-2", algorithm="ES256"))
+
+    assert user.id == "user-1"
+    assert issuer.fetches == 2
+    # Made-up kids cannot make the verifier hammer the issuer
+    for _ in range(5):
+        with pytest.raises(AuthenticationError, match="unknown signing key"):
+            await authenticator.keys.get("made-up")
+    assert issuer.fetches == 2
+
+
+async def test_expired_token_is_rejected(authenticator, issuer):
+    with pytest.raises(AuthenticationError):
+        await authenticator.authenticate(issuer.token("rsa-1", lifetime=-60))
+
+
+async def test_algorithm_outside_the_allow_list_is_rejected(authenticator, issuer):
+    forged = jwt.encode(
+        {"sub": "user-1", "id_gym": GYM, "exp": int(time.time() + 300)},
+        "a-shared-secret-that-is-long-enough-for-hs256",
+        algorithm="HS256",
+        headers={"kid": "rsa-1"}
+    )
+
+    with pytest.raises(AuthenticationError, match="not accepted"):
+        await authenticator.authenticate(forged)
+    assert issuer.fetches == 0
+
+
+async def test_algorithm_not_matching_the_key_is_rejected(authenticator, issuer):
+    # Allowed algorithm, but the kid names an RSA key
+    forged = jwt.encode(
+        {"sub": "user-1", "id_gym": GYM, "exp": int(time.time() + 300), "iss": "https://issuer.test"},
+        ec.generate_private_key(ec.SECP256R1()),
+        algorithm="ES256",
+        headers={"kid": "rsa-1"}
+    )
+
+    with pytest.raises(AuthenticationError, match="does not match"):
+        await authenticator.authenticate(forged)
+
+
+async def test_malformed_keys_in_the_jwks_are_skipped(authenticator, issuer):
+    # Declared RS256 but carrying an EC key: PyJWT cannot load it
+    issuer.add_ec_key("bad-1")
+    private_key, jwk = issuer.keys["bad-1"]
+    issuer.keys["bad-1"] = (private_key, dict(jwk, alg="RS256"))
+
+    with pytest.raises(AuthenticationError, match="unknown signing key"):
+        await authenticator.authenticate(issuer.token("bad-1", algorithm="ES256"))
+    assert (await authenticator.authenticate(issuer.token("rsa-1"))).id == "user-1"
+
+
+async def test_token_without_a_gym_is_rejected(authenticator, issuer):
+    with pytest.raises(AuthenticationError, match="id_gym"):
+        await authenticator.authenticate(issuer.token("rsa-1", id_gym=None))
+
+
+async def test_known_keys_survive_the_issuer_being_down(authenticator, issuer, clock):
+    await authenticator.authenticate(issuer.token("rsa-1"))
+    issuer.down = True
+    clock.now += 3600
+
+    # Stale keys trigger one failed refetch and keep being used
+    assert (await authenticator.authenticate(issuer.token("rsa-1", sub="user-2"))).id == "user-2"
+    assert issuer.fetches == 2
+    # Further requests back off until min_refresh_seconds have passed
+    for sub in ("user-3", "user-4"):
+        await authenticator.authenticate(issuer.token("rsa-1", sub=sub))
+    with pytest.raises(AuthenticationError):
+        await authenticator.keys.get("rotated")
+    assert issuer.fetches == 2
+
+    clock.now += 30
+    await authenticator.authenticate(issuer.token("rsa-1", sub="user-5"))
+    assert issuer.fetches == 3
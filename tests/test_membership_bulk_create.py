@@ -0,0 +1,60 @@
+from sqlalchemy import func, select
+
+from features.membership.application.dtos.membership_dtos import MembershipBulkCreateDTO
+from features.membership.domain.enums.membership_enums import MembershipType
+from features.membership.infrastructure.entities.membership_model import MembershipModel
+from tests.conftest import membership_data
+
+
+def _losing_the_race(context):
+    # The batch's conflict check ran before another writer committed
+    async def no_conflicts(gym_id, names):
+        return set(), False
+
+    context.aggregate.find_creation_conflicts = no_conflicts
+    return context
+
+
+async def _count(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(MembershipModel))
+
+
+async def test_bulk_create_is_one_insert(session_factory, service, make_context, statement_log):
+    items = [membership_data(index) for index in range(10)]
+
+    statement_log.clear()
+    async with session_factory() as session:
+        result = await service.bulk_create_memberships(make_context(session), MembershipBulkCreateDTO(items=items))
+
+    assert (result.succeeded, result.failed) == (10, 0)
+    inserts = [statement for statement in statement_log.statements if statement.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 1
+
+
+async def test_a_name_taken_concurrently_only_fails_its_item(session_factory, service, make_context, seed):
+    await seed(1)
+    items = [membership_data(index) for index in range(3)]
+
+    async with session_factory() as session:
+        context = _losing_the_race(make_context(session))
+        result = await service.bulk_create_memberships(context, MembershipBulkCreateDTO(items=items))
+
+    assert (result.succeeded, result.failed) == (2, 1)
+    assert [(item.index, item.status_code) for item in result.items] == [(0, 409), (1, 201), (2, 201)]
+    assert result.items[0].error_code == "MembershipAlreadyExistsError"
+    assert await _count(session_factory) == 3
+
+
+async def test_a_daily_pass_taken_concurrently_only_fails_its_item(session_factory, service, make_context, seed):
+    await seed(1, duration_days=1, type=MembershipType.DAILY)
+    items = [membership_data(10), membership_data(11, duration_days=1, type=MembershipType.DAILY)]
+
+    async with session_factory() as session:
+        context = _losing_the_race(make_context(session))
+        result = await service.bulk_create_memberships(context, MembershipBulkCreateDTO(items=items))
+
+    assert [(item.index, item.error_code) for item in result.items] == [
+        (0, None), (1, "DailyMembershipExistsError")
+    ]
+    assert await _count(session_factory) == 2
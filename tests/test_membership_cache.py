@@ -0,0 +1,60 @@
+import pytest
+
+from dev_utils.dev_database import PINNED_SESSION, REPLICA_SESSION
+from features.membership.application.membership_context import TenantContext
+from features.membership.infrastructure.cache.membership_cache import MembershipCache
+from features.membership.infrastructure.cache.memory_cache_backend import LruTtlCacheBackend
+from features.membership.presentation.membership_container import MembershipContextFactory
+from tests.conftest import GYM_ID, membership_data
+
+
+@pytest.fixture
+def cache() -> MembershipCache:
+    return MembershipCache(LruTtlCacheBackend(max_entries=100), ttl_seconds=60)
+
+
+@pytest.fixture
+def make_cached_context(cache):
+    factory = MembershipContextFactory(None, cache, None)
+
+    def make(session):
+        return factory.create(session, TenantContext("user", GYM_ID))
+
+    return make
+
+
+@pytest.fixture
+async def membership(session_factory, service, make_context):
+    async with session_factory() as session:
+        return await service.create_membership(make_context(session), membership_data(1))
+
+
+async def _read(session_factory, service, make_cached_context, membership_id, **info):
+    async with session_factory(info=info) as session:
+        return await service.get_membership(make_cached_context(session), membership_id)
+
+
+async def test_replica_reads_never_fill_the_cache(session_factory, service, make_cached_context, cache, membership, statement_log):
+    statement_log.clear()
+    for _ in range(2):
+        await _read(session_factory, service, make_cached_context, membership.id, **{REPLICA_SESSION: True})
+    assert len(statement_log) == 2
+    assert cache.stats.hits == 0
+
+    # A primary read fills it, and replica reads then hit
+    await _read(session_factory, service, make_cached_context, membership.id)
+    statement_log.clear()
+    await _read(session_factory, service, make_cached_context, membership.id, **{REPLICA_SESSION: True})
+    assert len(statement_log) == 0
+    assert cache.stats.hits == 1
+
+
+async def test_pinned_reads_bypass_the_cache(session_factory, service, make_cached_context, cache, membership, statement_log):
+    await _read(session_factory, service, make_cached_context, membership.id)
+
+    statement_log.clear()
+    read = await _read(session_factory, service, make_cached_context, membership.id, **{PINNED_SESSION: True})
+
+    assert read.id == membership.id
+    assert len(statement_log) == 1
+    assert cache.stats.hits == 0
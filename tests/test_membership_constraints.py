@@ -0,0 +1,50 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from features.membership.application.errors.membership_errors import (
+    DailyMembershipExistsError,
+    MembershipAlreadyExistsError
+)
+from features.membership.domain.enums.membership_enums import MembershipType
+from tests.conftest import membership_data
+
+PARALLEL_CREATES = 8
+
+
+async def _create_in_parallel(session_factory, service, make_context, items):
+    async def create(item):
+        async with session_factory() as session:
+            return await service.create_membership(make_context(session), item)
+
+    return await asyncio.gather(*(create(item) for item in items), return_exceptions=True)
+
+
+async def test_parallel_creates_with_the_same_name_have_one_winner(session_factory, service, make_context):
+    results = await _create_in_parallel(
+        session_factory, service, make_context, [membership_data(1) for _ in range(PARALLEL_CREATES)]
+    )
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    assert len(results) - len(failures) == 1
+    assert all(isinstance(failure, MembershipAlreadyExistsError) for failure in failures)
+    assert {failure.status_code for failure in failures} == {409}
+
+
+async def test_parallel_daily_passes_have_one_winner(session_factory, service, make_context):
+    items = [membership_data(index, duration_days=1, type=MembershipType.DAILY) for index in range(PARALLEL_CREATES)]
+    results = await _create_in_parallel(session_factory, service, make_context, items)
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    assert len(results) - len(failures) == 1
+    assert all(isinstance(failure, DailyMembershipExistsError) for failure in failures)
+    assert {failure.status_code for failure in failures} == {409}
+
+
+async def test_other_integrity_errors_are_not_reported_as_conflicts(session_factory, service, make_context):
+    # A gym that does not exist violates the foreign key, not a unique index
+    async with session_factory() as session:
+        with pytest.raises(IntegrityError):
+            await service.create_membership(make_context(session, uuid.uuid4()), membership_data(1, duration_days=1))
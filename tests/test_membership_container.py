@@ -0,0 +1,107 @@
+import pytest
+
+from dev_utils.dev_database import PINNED_SESSION, REPLICA_SESSION
+from features.membership.application.membership_context import TenantContext
+from features.membership.infrastructure.cache.memory_cache_backend import LruTtlCacheBackend
+from features.membership.infrastructure.cache.membership_cache import MembershipCache
+from features.membership.infrastructure.repositories.cached_membership_repository import CachedMembershipRepository
+from features.membership.infrastructure.repositories.membership_repository_postgres import MembershipRepositoryPostgres
+from features.membership.infrastructure.repositories.shared_catalog_membership_repository import SharedCatalogMembershipRepository
+from features.membership.infrastructure.repositories.snapshot_membership_repository import SnapshotMembershipRepository
+from features.membership.infrastructure.shared_catalog.shared_catalog_store import SharedCatalogStore
+from features.membership.infrastructure.snapshots.membership_snapshots import MembershipSnapshotStore
+from features.membership.presentation.membership_container import MembershipContextFactory, membership_container
+from tests.conftest import GYM_ID
+
+TENANT = TenantContext(user_id="11111111-1111-1111-1111-111111111111", gym_id=GYM_ID)
+
+
+def _chain(context) -> list:
+    """Repository layers from the outermost inwards"""
+    layers = [context.aggregate._repository]
+    while hasattr(layers[-1], "repository"):
+        layers.append(layers[-1].repository)
+    return layers
+
+
+@pytest.fixture
+def full_factory(tmp_path) -> MembershipContextFactory:
+    return MembershipContextFactory(
+        SharedCatalogStore(str(tmp_path / "catalog")),
+        MembershipCache(LruTtlCacheBackend()),
+        MembershipSnapshotStore()
+    )
+
+
+async def test_without_stores_the_repository_is_used_directly(session_factory):
+    async with session_factory() as session:
+        context = MembershipContextFactory(None, None, None).create(session, TENANT)
+
+    [repository] = _chain(context)
+    assert isinstance(repository, MembershipRepositoryPostgres)
+    assert repository.session is session
+    assert context.unit_of_work.session is session
+    assert context.tenant is TENANT
+
+
+async def test_decorators_wrap_the_repository_in_order(session_factory, full_factory):
+    async with session_factory() as session:
+        context = full_factory.create(session, TENANT)
+
+    layers = _chain(context)
+    assert [type(layer) for layer in layers] == [
+        SnapshotMembershipRepository,
+        CachedMembershipRepository,
+        SharedCatalogMembershipRepository,
+        MembershipRepositoryPostgres,
+    ]
+    snapshots, cached, shared, _ = layers
+    assert snapshots.snapshots is full_factory.membership_snapshots
+    assert cached.cache is full_factory.membership_cache
+    assert shared.store is full_factory.shared_catalog_store
+    # One unit of work per request, seen by every layer that defers work to the commit
+    assert snapshots.unit_of_work is cached.unit_of_work is shared.unit_of_work is context.unit_of_work
+    # A primary session fills the cache on misses
+    assert cached.fill
+
+
+async def test_replica_sessions_read_the_cache_without_filling_it(session_factory, full_factory):
+    async with session_factory() as session:
+        session.info[REPLICA_SESSION] = True
+        context = full_factory.create(session, TENANT)
+
+    cached = _chain(context)[1]
+    assert isinstance(cached, CachedMembershipRepository)
+    assert not cached.fill
+
+
+async def test_pinned_sessions_skip_the_cache(session_factory, full_factory):
+    async with session_factory() as session:
+        session.info[PINNED_SESSION] = True
+        context = full_factory.create(session, TENANT)
+
+    assert [type(layer) for layer in _chain(context)] == [
+        SnapshotMembershipRepository,
+        SharedCatalogMembershipRepository,
+        MembershipRepositoryPostgres,
+    ]
+
+
+async def test_each_request_gets_its_own_context(session_factory, full_factory):
+    async with session_factory() as first, session_factory() as second:
+        first_context, second_context = full_factory.create(first, TENANT), full_factory.create(second, TENANT)
+
+    assert first_context.unit_of_work is not second_context.unit_of_work
+    assert first_context.aggregate is not second_context.aggregate
+
+
+def test_container_shares_its_singletons():
+    service = membership_container.membership_service()
+
+    assert membership_container.membership_service() is service
+    assert membership_container.membership_context_factory() is membership_container.membership_context_factory()
+    assert service._list_memberships is membership_container.list_memberships()
+    assert service._update_membership is membership_container.update_membership()
+    assert service._bulk_update_memberships is membership_container.bulk_update_memberships()
+    # The bulk update reuses the single-item use case rather than a copy
+    assert membership_container.bulk_update_memberships().update_membership is membership_container.update_membership()
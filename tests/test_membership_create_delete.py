@@ -0,0 +1,50 @@
+import uuid
+
+import pytest
+
+from features.membership.application.errors.membership_errors import (
+    MembershipNotFoundError,
+    UnauthorizedMembershipAccessError
+)
+from tests.conftest import OTHER_GYM_ID, membership_data
+
+
+def _starts_with(statement: str, keyword: str) -> bool:
+    return statement.lstrip().upper().startswith(keyword)
+
+
+async def test_create_is_one_insert_returning(session_factory, service, make_context, statement_log):
+    statement_log.clear()
+    async with session_factory() as session:
+        created = await service.create_membership(make_context(session), membership_data(1))
+
+    assert len(statement_log) == 1
+    assert _starts_with(statement_log.statements[0], "INSERT")
+    assert "RETURNING" in statement_log.statements[0].upper()
+    # Server-side defaults come back without a refresh
+    assert created.version == 1
+    assert created.created_at is not None
+
+
+async def test_delete_is_one_statement(session_factory, service, make_context, statement_log):
+    async with session_factory() as session:
+        created = await service.create_membership(make_context(session), membership_data(1))
+
+    statement_log.clear()
+    async with session_factory() as session:
+        assert await service.delete_membership(make_context(session), created.id) is True
+
+    assert len(statement_log) == 1
+    assert _starts_with(statement_log.statements[0], "DELETE")
+    assert "RETURNING" in statement_log.statements[0].upper()
+
+
+async def test_failed_delete_explains_the_miss(session_factory, service, make_context):
+    async with session_factory() as session:
+        created = await service.create_membership(make_context(session), membership_data(1))
+
+    async with session_factory() as session:
+        with pytest.raises(MembershipNotFoundError):
+            await service.delete_membership(make_context(session), uuid.uuid4())
+        with pytest.raises(UnauthorizedMembershipAccessError):
+            await service.delete_membership(make_context(session, OTHER_GYM_ID), created.id)
@@ -0,0 +1,44 @@
+import pytest
+
+from features.membership.application.dtos.membership_dtos import MembershipCursorPageDTO, MembershipListResponseDTO
+from features.membership.application.errors.membership_errors import InvalidMembershipDataError
+
+
+def test_offset_response_keeps_its_fields_required():
+    required = set(MembershipListResponseDTO.model_json_schema()["required"])
+    assert {"items", "total", "page", "size", "total_pages"} <= required
+    assert "next_cursor" not in MembershipListResponseDTO.model_fields
+
+
+async def test_cursor_pages_walk_the_whole_list(session_factory, service, make_context, seed):
+    await seed(7)
+    async with session_factory() as session:
+        context = make_context(session)
+        expected = [item.id for item in (await service.list_memberships(context, size=100)).items]
+
+        seen, cursor = [], None
+        while True:
+            page = await service.list_memberships(context, size=3, cursor=cursor, pagination="cursor")
+            assert isinstance(page, MembershipCursorPageDTO)
+            seen += [item.id for item in page.items]
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        back = await service.list_memberships(context, size=3, cursor=page.prev_cursor)
+
+    assert seen == expected
+    assert [item.id for item in back.items] == expected[3:6]
+
+
+async def test_cursor_is_bound_to_its_filters(session_factory, service, make_context, seed):
+    await seed(5)
+    async with session_factory() as session:
+        context = make_context(session)
+        first = await service.list_memberships(context, size=2, status="active", pagination="cursor")
+
+        # Same filters (status is case-insensitive): accepted
+        await service.list_memberships(context, size=2, status="ACTIVE", cursor=first.next_cursor)
+        for status, search in ((None, None), ("inactive", None), ("active", "plan")):
+            with pytest.raises(InvalidMembershipDataError):
+                await service.list_memberships(context, size=2, status=status, search=search, cursor=first.next_cursor)
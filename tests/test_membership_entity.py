@@ -0,0 +1,70 @@
+import inspect
+import uuid
+from dataclasses import fields
+from datetime import datetime
+
+import pytest
+
+from features.membership.domain.entities.membership import Membership
+from features.membership.domain.enums.membership_enums import MembershipStatus, MembershipType
+from features.membership.domain.object_values.membership_duration import MembershipDuration
+from features.membership.domain.object_values.membership_id import MembershipId
+from features.membership.domain.object_values.membership_price import MembershipPrice
+from features.membership.infrastructure.entities.membership_model import MembershipModel
+from tests.conftest import GYM_ID
+
+MEMBERSHIP_ID = uuid.UUID("c0000000-0000-0000-0000-00000000000c")
+
+
+def _values(**overrides) -> dict:
+    values = dict(
+        id=MembershipId(MEMBERSHIP_ID),
+        name="Plan mensual",
+        description="Acceso completo",
+        price=MembershipPrice.from_cents(1999),
+        duration=MembershipDuration.from_int(30),
+        type=MembershipType.REGULAR,
+        gym_id=GYM_ID,
+        status=MembershipStatus.INACTIVE,
+        created_at=datetime(2024, 1, 1, 9, 30),
+        updated_at=datetime(2024, 2, 1, 18, 0),
+        version=7
+    )
+    values.update(overrides)
+    return values
+
+
+def test_restore_takes_every_field():
+    # A field added to the entity but not to restore() would be left unset
+    assert list(inspect.signature(Membership.restore).parameters) == [field.name for field in fields(Membership)]
+
+
+def test_restored_equals_constructed():
+    restored = Membership.restore(**_values(id=MembershipId.trusted(MEMBERSHIP_ID)))
+    constructed = Membership(**_values())
+
+    assert restored == constructed
+    assert restored.to_dict() == constructed.to_dict()
+    assert hash(restored.id) == hash(constructed.id)
+
+
+def test_restore_skips_validation():
+    # Rows are trusted as stored; the checks only guard new data
+    with pytest.raises(ValueError):
+        Membership(**_values(description=""))
+    assert Membership.restore(**_values(description="")).description == ""
+
+
+@pytest.mark.parametrize("build", [Membership, Membership.restore])
+def test_slots_reject_stray_attributes(build):
+    membership = build(**_values())
+
+    assert not hasattr(membership, "__dict__")
+    with pytest.raises(AttributeError):
+        membership.nmae = "typo"
+
+
+def test_model_round_trip():
+    membership = Membership(**_values())
+
+    assert MembershipModel.from_domain(membership).to_domain() == membership
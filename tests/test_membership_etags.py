@@ -0,0 +1,106 @@
+import pytest
+
+from features.membership.domain.enums.membership_enums import MembershipType
+from features.membership.infrastructure.snapshots.membership_snapshots import MembershipSnapshotStore
+from tests.conftest import membership_data
+
+DAILY = membership_data(0, name="Pase diario", duration_days=1, type=MembershipType.DAILY)
+
+
+@pytest.fixture(params=["database", "snapshots"])
+def membership_snapshots(request):
+    # Every read path must answer the same validators: straight from the
+    # database, and from the in-process snapshots
+    return MembershipSnapshotStore(ttl_seconds=3600) if request.param == "snapshots" else None
+
+
+async def _create(api, data) -> dict:
+    response = await api.post("/api/memberships/", json=data.model_dump(mode="json"))
+    assert response.status_code == 201
+    return response.json()
+
+
+async def _revalidate(api, url: str, etag: str):
+    return await api.get(url, headers={"If-None-Match": etag})
+
+
+@pytest.mark.parametrize("url", ["/api/memberships/", "/api/memberships/?pagination=cursor", "/api/memberships/daily"])
+async def test_unchanged_resources_answer_304(api, membership_snapshots, url):
+    await _create(api, DAILY)
+    await _create(api, membership_data(1))
+
+    first = await api.get(url)
+    assert first.status_code == 200
+    if membership_snapshots is not None:
+        # Keyset pages always go to the database
+        assert len(membership_snapshots) == (0 if "cursor" in url else 1)
+    etag = first.headers["etag"]
+
+    revalidated = await _revalidate(api, url, etag)
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+    # A list of tags, and the weak form of ours, match as well
+    assert (await _revalidate(api, url, f'"other", W/{etag}')).status_code == 304
+    assert (await _revalidate(api, url, '"other"')).status_code == 200
+
+
+async def test_single_membership_revalidates_by_version(api):
+    created = await _create(api, membership_data(1))
+    url = f"/api/memberships/{created['id']}"
+
+    first = await api.get(url)
+    assert first.headers["etag"] == f'"{created["id"]}.1"'
+    assert (await _revalidate(api, url, first.headers["etag"])).status_code == 304
+    # If-Modified-Since is only looked at without If-None-Match
+    since = {"If-Modified-Since": first.headers["last-modified"]}
+    assert (await api.get(url, headers=since)).status_code == 304
+    assert (await api.get(url, headers={**since, "If-None-Match": '"other"'})).status_code == 200
+
+    updated = await api.put(url, json={"price": 99}, headers={"If-Match": first.headers["etag"]})
+    assert (updated.status_code, updated.headers["etag"]) == (204, f'"{created["id"]}.2"')
+
+    changed = await _revalidate(api, url, first.headers["etag"])
+    assert changed.status_code == 200
+    assert changed.headers["etag"] == updated.headers["etag"]
+    assert changed.json()["price"] == 99
+
+
+@pytest.mark.parametrize("url", ["/api/memberships/", "/api/memberships/?pagination=cursor", "/api/memberships/daily"])
+async def test_updates_change_the_etag(api, url):
+    daily = await _create(api, DAILY)
+    await _create(api, membership_data(1))
+    etag = (await api.get(url)).headers["etag"]
+
+    assert (await api.put(f"/api/memberships/{daily['id']}", json={"price": 7})).status_code == 204
+
+    changed = await _revalidate(api, url, etag)
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert (await _revalidate(api, url, changed.headers["etag"])).status_code == 304
+
+
+@pytest.mark.parametrize("url", ["/api/memberships/", "/api/memberships/?pagination=cursor"])
+async def test_deletes_change_the_list_etag(api, url):
+    await _create(api, membership_data(1))
+    doomed = await _create(api, membership_data(2))
+    etag = (await api.get(url)).headers["etag"]
+
+    assert (await api.delete(f"/api/memberships/{doomed['id']}")).status_code == 204
+
+    changed = await _revalidate(api, url, etag)
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert [item["name"] for item in changed.json()["items"]] == ["Plan 001"]
+
+
+async def test_deleted_resources_are_not_revalidated(api):
+    daily = await _create(api, DAILY)
+    etags = {url: (await api.get(url)).headers["etag"] for url in (
+        f"/api/memberships/{daily['id']}", "/api/memberships/daily"
+    )}
+
+    assert (await api.delete(f"/api/memberships/{daily['id']}")).status_code == 204
+
+    for url, etag in etags.items():
+        assert (await _revalidate(api, url, etag)).status_code == 404
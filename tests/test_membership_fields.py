@@ -0,0 +1,66 @@
+import pytest
+
+from features.membership.domain.enums.membership_enums import MembershipType
+from tests.conftest import membership_data
+
+ALL_FIELDS = {
+    "id", "name", "description", "price", "duration_days", "type", "gym_id", "status", "created_at", "updated_at",
+    "version",
+}
+
+
+async def _create(api, data) -> dict:
+    response = await api.post("/api/memberships/", json=data.model_dump(mode="json"))
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.fixture
+async def created(api) -> dict:
+    await _create(api, membership_data(1))
+    return await _create(api, membership_data(0, name="Pase diario", duration_days=1, type=MembershipType.DAILY))
+
+
+def _items(response) -> list:
+    body = response.json()
+    return body["items"] if "items" in body else [body]
+
+
+@pytest.mark.parametrize("route", ["list", "cursor", "daily", "single"])
+@pytest.mark.parametrize("fields, expected", [
+    ("name,price", {"id", "version", "name", "price"}),
+    ("id,version,duration_days", {"id", "version", "duration_days"}),
+    ("name, ,name", {"id", "version", "name"}),
+    (None, ALL_FIELDS),
+])
+async def test_projection_always_includes_id_and_version(api, created, route, fields, expected):
+    url = {
+        "list": "/api/memberships/",
+        "cursor": "/api/memberships/?pagination=cursor",
+        "daily": "/api/memberships/daily",
+        "single": f"/api/memberships/{created['id']}",
+    }[route]
+    response = await api.get(url, params={"fields": fields} if fields else None)
+
+    assert response.status_code == 200
+    items = _items(response)
+    assert items and all(set(item) == expected for item in items)
+    daily = next(item for item in items if item["id"] == created["id"])
+    assert daily["version"] == created["version"]
+    assert {name: daily[name] for name in expected} == {name: created[name] for name in expected}
+
+
+async def test_projected_items_can_be_updated_with_their_version(api, created):
+    [item] = _items(await api.get("/api/memberships/daily", params={"fields": "price"}))
+
+    response = await api.put(
+        f"/api/memberships/{item['id']}", json={"price": 8}, headers={"If-Match": str(item["version"])}
+    )
+    assert response.status_code == 204
+
+
+async def test_unknown_fields_are_rejected(api, created):
+    response = await api.get("/api/memberships/", params={"fields": "name,secret"})
+
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
@@ -0,0 +1,48 @@
+from features.membership.domain.enums.membership_enums import MembershipStatus
+from tests.conftest import OTHER_GYM_ID
+
+
+def _selects(statement_log):
+    return [statement for statement in statement_log.statements if statement.lstrip().upper().startswith("SELECT")]
+
+
+async def test_offset_page_costs_a_count_and_a_limited_select(session_factory, service, make_context, seed, statement_log):
+    await seed(25)
+    await seed(7, gym_id=OTHER_GYM_ID)
+
+    statement_log.clear()
+    async with session_factory() as session:
+        result = await service.list_memberships(make_context(session), page=2, size=10)
+
+    assert (result.total, result.page, result.total_pages) == (25, 2, 3)
+    assert len(result.items) == 10
+    selects = _selects(statement_log)
+    assert len(statement_log) <= 2
+    # One aggregate for the total, one bounded page; never the whole table
+    assert sum("count(" in statement.lower() for statement in selects) == 1
+    assert sum("LIMIT" in statement.upper() for statement in selects) == 1
+
+
+async def test_count_uses_the_same_filters_as_the_page(session_factory, service, make_context, seed, statement_log):
+    await seed(12)
+    await seed(1, name="Archived plan", status=MembershipStatus.INACTIVE)
+
+    statement_log.clear()
+    async with session_factory() as session:
+        result = await service.list_memberships(make_context(session), page=1, size=5, status="INACTIVE")
+
+    assert result.total == 1
+    assert [item.status for item in result.items] == [MembershipStatus.INACTIVE]
+    assert len(statement_log) <= 2
+
+
+async def test_known_total_skips_the_count(session_factory, service, make_context, seed, statement_log):
+    await seed(12)
+    async with session_factory() as session:
+        context = make_context(session)
+        stamp = await service.get_membership_catalog_stamp(context)
+        statement_log.clear()
+        result = await service.list_memberships(context, page=2, size=5, total=stamp.count)
+
+    assert (result.total, result.total_pages, len(result.items)) == (12, 3, 5)
+    assert len(statement_log) == 1
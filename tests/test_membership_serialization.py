@@ -0,0 +1,63 @@
+import pytest
+
+from features.membership.application.dtos.membership_dtos import MembershipResponseDTO, MembershipUpdateDTO
+from features.membership.domain.enums.membership_enums import MembershipStatus, MembershipType
+from features.membership.presentation.encoding.response_encoders import JsonEncoder, MsgpackEncoder
+from tests.conftest import membership_data
+
+# Prices whose float form depends on how the cents are divided
+PRICES = [0.07, 0.1, 0.3, 19.99, 1234.56, 99999.99]
+
+
+@pytest.fixture
+async def memberships(session_factory, service, make_context) -> list:
+    async with session_factory() as session:
+        created = [
+            await service.create_membership(make_context(session), membership_data(index, price=price))
+            for index, price in enumerate(PRICES)
+        ]
+        created.append(await service.create_membership(
+            make_context(session), membership_data(len(PRICES), duration_days=1, type=MembershipType.DAILY)
+        ))
+        # An inactive, updated row, with a version past 1
+        await service.update_membership(
+            make_context(session), created[0].id, MembershipUpdateDTO(status=MembershipStatus.INACTIVE, name="Renamed")
+        )
+    return created
+
+
+async def _entity_dtos(session_factory, service, make_context, ids) -> dict:
+    """The reference: each membership read as an entity and turned into a validated DTO"""
+    async with session_factory() as session:
+        return {membership_id: await service.get_membership(make_context(session), membership_id) for membership_id in ids}
+
+
+def _assert_same_representation(row_dto: MembershipResponseDTO, entity_dto: MembershipResponseDTO) -> None:
+    assert row_dto.model_dump() == entity_dto.model_dump()
+    # Same Python types too (float prices, enums, UUIDs), not just equal values
+    assert {name: type(value) for name, value in row_dto} == {name: type(value) for name, value in entity_dto}
+    for encoder in (JsonEncoder(), MsgpackEncoder()):
+        assert encoder.encode_model(row_dto) == encoder.encode_model(entity_dto)
+
+
+@pytest.mark.parametrize("pagination", ["offset", "cursor"])
+async def test_row_pages_serialize_like_entities(session_factory, service, make_context, memberships, pagination):
+    async with session_factory() as session:
+        page = await service.list_memberships(make_context(session), size=100, pagination=pagination)
+    expected = await _entity_dtos(session_factory, service, make_context, [item.id for item in page.items])
+
+    assert len(page.items) == len(memberships)
+    for item in page.items:
+        _assert_same_representation(item, expected[item.id])
+    assert expected[memberships[0].id].version == 2
+    # The page wrapper validates as the DTO it claims to be
+    assert type(page).model_validate(page.model_dump()) == page
+
+
+async def test_daily_row_projection_serializes_like_the_entity(session_factory, service, make_context, memberships):
+    fields = list(MembershipResponseDTO.model_fields)
+    async with session_factory() as session:
+        row_dto = await service.get_daily_membership(make_context(session), fields)
+        entity_dto = await service.get_daily_membership(make_context(session))
+
+    _assert_same_representation(row_dto, entity_dto)
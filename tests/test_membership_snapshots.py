@@ -0,0 +1,141 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from features.membership.application.dtos.membership_dtos import MembershipUpdateDTO
+from features.membership.application.membership_context import TenantContext
+from features.membership.infrastructure.shared_catalog import shared_catalog_store
+from features.membership.infrastructure.shared_catalog.shared_catalog_store import SharedCatalogStore
+from features.membership.infrastructure.snapshots import membership_snapshots
+from features.membership.infrastructure.snapshots.membership_snapshots import MembershipSnapshotStore
+from features.membership.presentation.membership_container import MembershipContextFactory
+from tests.conftest import GYM_ID
+
+
+def _loader(calls, result=None):
+    async def load():
+        calls.append(1)
+        return list(result or [])
+    return load
+
+
+async def test_store_keeps_at_most_max_gyms():
+    store = MembershipSnapshotStore(max_gyms=3)
+    calls = []
+    gyms = [uuid.uuid4() for _ in range(5)]
+    for gym_id in gyms:
+        await store.get(gym_id, _loader(calls))
+
+    assert len(store) == 3
+    # The least recently used gyms were dropped and are rebuilt
+    await store.get(gyms[-1], _loader(calls))
+    await store.get(gyms[0], _loader(calls))
+    assert len(calls) == 6
+
+
+async def test_rebuild_overlapping_a_write_is_not_kept():
+    store = MembershipSnapshotStore()
+    calls = []
+    release = asyncio.Event()
+
+    async def slow_load():
+        calls.append(1)
+        await release.wait()
+        return []
+
+    rebuild = asyncio.create_task(store.get(GYM_ID, slow_load))
+    await asyncio.sleep(0)
+    store.invalidate(GYM_ID)
+    release.set()
+    await rebuild
+
+    await store.get(GYM_ID, _loader(calls))
+    assert len(calls) == 2
+
+
+async def test_list_order_breaks_created_at_ties_by_id(session_factory, service, make_context, seed):
+    await seed(12)
+    async with session_factory() as session:
+        # Same created_at for every row
+        await session.execute(text("UPDATE memberships SET created_at = '2024-01-01 00:00:00'"))
+        await session.commit()
+
+    async with session_factory() as session:
+        context = make_context(session)
+        pages = [await service.list_memberships(context, page=page, size=5) for page in (1, 2, 3)]
+        catalog = await service.get_membership_catalog(context)
+
+    listed = [item.id for page in pages for item in page.items]
+    assert listed == [item.id for item in catalog]
+    assert listed == sorted(listed, reverse=True)
+
+
+class Worker:
+    """One worker process's stores, sharing the catalog directory with the others"""
+
+    def __init__(self, directory: str):
+        self.shared_store = SharedCatalogStore(directory)
+        # A TTL long enough that only the shared write generation can expire a snapshot
+        self.snapshots = MembershipSnapshotStore(ttl_seconds=3600, external_generation=self.shared_store.dirty_generation)
+        self.factory = MembershipContextFactory(self.shared_store, None, self.snapshots)
+
+    def context(self, session):
+        return self.factory.create(session, TenantContext(user_id="11111111-1111-1111-1111-111111111111", gym_id=GYM_ID))
+
+
+async def test_a_write_on_one_worker_drops_the_snapshots_of_the_others(tmp_path, session_factory, service, seed):
+    await seed(2)
+    worker_a, worker_b = Worker(str(tmp_path / "catalog")), Worker(str(tmp_path / "catalog"))
+
+    async def snapshot_of_b():
+        async with session_factory() as session:
+            return await worker_b.snapshots.get(GYM_ID, lambda: service.get_membership_catalog(worker_b.context(session)))
+
+    try:
+        before = await snapshot_of_b()
+        assert await snapshot_of_b() is before
+
+        async with session_factory() as session:
+            catalog = await service.get_membership_catalog(worker_a.context(session))
+            await service.update_membership(worker_a.context(session), catalog[0].id, MembershipUpdateDTO(price=99.5))
+
+        after = await snapshot_of_b()
+        assert after is not before
+        assert after.stamp.version_sum == before.stamp.version_sum + 1
+    finally:
+        worker_a.shared_store.close()
+        worker_b.shared_store.close()
+
+
+def _reset_stores() -> None:
+    if shared_catalog_store.get_shared_catalog_store.cache_info().currsize:
+        store = shared_catalog_store.get_shared_catalog_store()
+        if store is not None:
+            store.close()
+    shared_catalog_store.get_shared_catalog_store.cache_clear()
+    membership_snapshots.get_membership_snapshots.cache_clear()
+
+
+@pytest.fixture
+def snapshot_settings(monkeypatch, tmp_path):
+    def configure(snapshots=None, shared_catalog=False):
+        monkeypatch.delenv("MEMBERSHIP_SNAPSHOTS", raising=False)
+        monkeypatch.delenv("MEMBERSHIP_SHARED_CATALOG_DIR", raising=False)
+        if snapshots is not None:
+            monkeypatch.setenv("MEMBERSHIP_SNAPSHOTS", snapshots)
+        if shared_catalog:
+            monkeypatch.setenv("MEMBERSHIP_SHARED_CATALOG_DIR", str(tmp_path / "catalog"))
+        _reset_stores()
+        return membership_snapshots.get_membership_snapshots()
+
+    yield configure
+    _reset_stores()
+
+
+def test_snapshots_default_to_on_only_with_the_shared_catalog(snapshot_settings):
+    assert snapshot_settings() is None
+    assert snapshot_settings(shared_catalog=True) is not None
+    assert snapshot_settings("on") is not None
+    assert snapshot_settings("off", shared_catalog=True) is None
@@ -0,0 +1,54 @@
+import uuid
+
+import pytest
+
+from features.membership.application.dtos.membership_dtos import MembershipUpdateDTO
+from features.membership.application.errors.membership_errors import (
+    MembershipNotFoundError,
+    MembershipVersionConflictError,
+    UnauthorizedMembershipAccessError
+)
+from tests.conftest import OTHER_GYM_ID, membership_data
+
+
+@pytest.fixture
+async def membership(session_factory, service, make_context):
+    async with session_factory() as session:
+        return await service.create_membership(make_context(session), membership_data(1))
+
+
+async def test_update_is_one_statement(session_factory, service, make_context, membership, statement_log):
+    statement_log.clear()
+    async with session_factory() as session:
+        updated = await service.update_membership(
+            make_context(session), membership.id, MembershipUpdateDTO(price=99.5), expected_version=membership.version
+        )
+
+    assert len(statement_log) == 1
+    assert statement_log.statements[0].lstrip().upper().startswith("UPDATE")
+    assert "RETURNING" in statement_log.statements[0].upper()
+    assert (updated.price, updated.version) == (99.5, membership.version + 1)
+
+
+async def test_stale_version_is_a_conflict(session_factory, service, make_context, membership, statement_log):
+    async with session_factory() as session:
+        await service.update_membership(make_context(session), membership.id, MembershipUpdateDTO(price=20))
+
+    statement_log.clear()
+    async with session_factory() as session:
+        with pytest.raises(MembershipVersionConflictError) as raised:
+            await service.update_membership(
+                make_context(session), membership.id, MembershipUpdateDTO(price=30), expected_version=membership.version
+            )
+
+    assert raised.value.status_code == 412
+    # The failed UPDATE plus the lookup that explains it
+    assert len(statement_log) == 2
+
+
+async def test_missed_update_tells_not_found_from_other_tenant(session_factory, service, make_context, membership):
+    async with session_factory() as session:
+        with pytest.raises(MembershipNotFoundError):
+            await service.update_membership(make_context(session), uuid.uuid4(), MembershipUpdateDTO(price=30))
+        with pytest.raises(UnauthorizedMembershipAccessError):
+            await service.update_membership(make_context(session, OTHER_GYM_ID), membership.id, MembershipUpdateDTO(price=30))
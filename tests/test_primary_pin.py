@@ -0,0 +1,27 @@
+import time
+
+import pytest
+from starlette.requests import Request
+
+from dev_utils.dev_database import PRIMARY_PIN_COOKIE, PRIMARY_PIN_HEADER, get_settings, is_pinned_to_primary
+
+
+def _request(headers=None, cookie=None) -> Request:
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    if cookie is not None:
+        raw_headers.append((b"cookie", f"{PRIMARY_PIN_COOKIE}={cookie}".encode()))
+    return Request({"type": "http", "headers": raw_headers})
+
+
+@pytest.mark.parametrize("offset, pinned", [(-1, False), (1, True), (None, True), (3600 * 24 * 365, False)])
+def test_pin_deadline_is_bounded(offset, pinned):
+    window = get_settings().replica_pin_seconds
+    deadline = time.time() + (window if offset is None else offset)
+
+    assert is_pinned_to_primary(_request(headers={PRIMARY_PIN_HEADER: f"{deadline:.3f}"})) is pinned
+    assert is_pinned_to_primary(_request(cookie=f"{deadline:.3f}")) is pinned
+
+
+@pytest.mark.parametrize("value", ["", "soon", "inf", "nan"])
+def test_malformed_pin_is_ignored(value):
+    assert is_pinned_to_primary(_request(headers={PRIMARY_PIN_HEADER: value})) is False
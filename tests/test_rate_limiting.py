@@ -0,0 +1,133 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import httpx
+import pytest
+
+from dev_utils.dev_security import Scopes
+from features.membership.infrastructure.rate_limiting.memory_rate_limit_backend import TokenBucketRateLimitBackend
+from features.membership.infrastructure.rate_limiting.rate_limit_backend import RateLimit, RateLimitBackend
+from features.membership.infrastructure.rate_limiting.rate_limiter import RateLimiter
+from features.membership.infrastructure.rate_limiting.redis_rate_limit_backend import (
+    FakeRedisTokenBuckets,
+    RedisRateLimitBackend
+)
+from features.membership.presentation.rate_limiting.rate_limit_middleware import LIMITED_BODY, RateLimitMiddleware
+
+GYM = "a0000000-0000-0000-0000-00000000000a"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class Principal:
+    id: str
+    id_gym: Optional[str] = GYM
+    scopes: List[str] = field(default_factory=list)
+
+
+class FailingBackend(RateLimitBackend):
+    async def acquire(self, key, limit, cost=1.0):
+        raise ConnectionError("redis unavailable")
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request, clock) -> RateLimitBackend:
+    # The Lua script's Python twin must behave exactly like the in-process buckets
+    if request.param == "memory":
+        return TokenBucketRateLimitBackend(clock=clock)
+    return RedisRateLimitBackend(FakeRedisTokenBuckets(clock=clock))
+
+
+def limiter_for(backend: RateLimitBackend, gym_limit: Optional[RateLimit] = None) -> RateLimiter:
+    return RateLimiter(
+        backend,
+        {Scopes.GymAdmin.value: RateLimit(2, 4), Scopes.GymWorker.value: RateLimit(1, 2)},
+        RateLimit(1, 1),
+        gym_limit=gym_limit
+    )
+
+
+async def test_bucket_refills_at_its_rate(backend, clock):
+    limit = RateLimit(rate_per_second=2, burst=2)
+
+    assert [await backend.acquire("user", limit) for _ in range(3)] == [0, 0, 0.5]
+    clock.now += 0.25
+    assert await backend.acquire("user", limit) == 0.25
+    clock.now += 0.25
+    assert await backend.acquire("user", limit) == 0
+    # Never more than burst, however long the bucket sat idle
+    clock.now += 60
+    assert [await backend.acquire("user", limit) for _ in range(3)] == [0, 0, 0.5]
+    # Other keys have their own bucket
+    assert await backend.acquire("other", limit) == 0
+
+
+async def test_user_limit_follows_the_most_generous_scope(backend):
+    limiter = limiter_for(backend)
+
+    worker = [await limiter.acquire(GYM, "worker", [Scopes.GymWorker.value]) for _ in range(3)]
+    admin = [await limiter.acquire(GYM, "admin", [Scopes.GymWorker.value, Scopes.GymAdmin.value]) for _ in range(5)]
+    anonymous = [await limiter.acquire(GYM, "nobody", []) for _ in range(2)]
+
+    assert worker == [0, 0, 1.0]
+    assert admin == [0, 0, 0, 0, 0.5]
+    assert anonymous == [0, 1.0]
+    assert (limiter.stats.allowed, limiter.stats.limited) == (7, 3)
+
+
+async def test_users_of_a_gym_share_its_bucket(backend):
+    limiter = limiter_for(backend, gym_limit=RateLimit(1, 3))
+
+    waits = [await limiter.acquire(GYM, f"user-{index}", [Scopes.GymAdmin.value]) for index in range(4)]
+
+    assert waits == [0, 0, 0, 1.0]
+    assert await limiter.acquire("another-gym", "user-0", [Scopes.GymAdmin.value]) == 0
+
+
+async def test_backend_failures_let_requests_through():
+    limiter = limiter_for(FailingBackend())
+
+    assert await limiter.acquire(GYM, "user", []) == 0
+    assert (limiter.stats.allowed, limiter.stats.backend_errors) == (0, 1)
+
+
+async def _ok(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def test_middleware_answers_429_with_retry_after(clock):
+    principals = {"worker-token": Principal("worker", scopes=[Scopes.GymWorker.value]), "no-gym": Principal("x", None)}
+
+    async def resolve(token):
+        return principals.get(token)
+
+    limiter = limiter_for(TokenBucketRateLimitBackend(clock=clock))
+    app = RateLimitMiddleware(_ok, limiter, resolve)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        async def get(token=None):
+            headers = {"Authorization": f"Bearer {token}"} if token else {}
+            return await client.get("/api/memberships/", headers=headers)
+
+        assert [(await get("worker-token")).status_code for _ in range(2)] == [200, 200]
+        limited = await get("worker-token")
+        assert limited.status_code == 429
+        assert limited.headers["retry-after"] == "1"
+        assert limited.content == LIMITED_BODY
+
+        # No token, a rejected token or a token without a gym: left to the route's auth
+        for token in (None, "rejected", "no-gym"):
+            assert (await get(token)).status_code == 200
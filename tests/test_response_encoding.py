@@ -0,0 +1,175 @@
+import asyncio
+import json
+import zlib
+
+import brotli
+import msgpack
+import pytest
+
+from features.membership.presentation.encoding.compression_middleware import CompressionMiddleware
+from features.membership.presentation.encoding.response_encoders import (
+    BrotliCoding,
+    GzipCoding,
+    JsonEncoder,
+    MsgpackEncoder,
+    ResponseEncoders
+)
+from tests.conftest import membership_data
+
+MSGPACK = {"Accept": "application/msgpack"}
+
+
+@pytest.fixture
+def encoders() -> ResponseEncoders:
+    encoders = ResponseEncoders()
+    encoders.register_media(JsonEncoder())
+    encoders.register_media(MsgpackEncoder())
+    encoders.register_coding(BrotliCoding())
+    encoders.register_coding(GzipCoding())
+    return encoders
+
+
+@pytest.mark.parametrize("accept, media_type", [
+    (None, "application/json"),
+    ("text/html", "application/json"),
+    ("application/msgpack", "application/msgpack"),
+    ("application/json;q=0.5, application/msgpack", "application/msgpack"),
+    ("application/*;q=0.9, application/json;q=0.1", "application/msgpack"),
+    ("application/msgpack;q=0, */*", "application/json"),
+])
+def test_media_type_negotiation(encoders, accept, media_type):
+    assert encoders.negotiate_media(accept).media_type == media_type
+
+
+@pytest.mark.parametrize("accept_encoding, coding", [
+    (None, None),
+    ("identity", None),
+    ("gzip, br", "br"),
+    ("gzip, br;q=0.5", "gzip"),
+    ("*", "br"),
+    ("br;q=0, *;q=0.1", "gzip"),
+])
+def test_content_coding_negotiation(encoders, accept_encoding, coding):
+    negotiated = encoders.negotiate_coding(accept_encoding)
+    assert (negotiated.name if negotiated else None) == coding
+
+
+async def test_write_routes_follow_the_negotiated_media_type(api):
+    created = await api.post("/api/memberships/", json=membership_data(1).model_dump(mode="json"), headers=MSGPACK)
+    assert (created.status_code, created.headers["content-type"]) == (201, "application/msgpack")
+    body = msgpack.unpackb(created.content)
+    assert body["name"] == "Plan 001"
+    # Same data as the JSON representation, so the tag is weak
+    assert created.headers["etag"] == f'W/"{body["id"]}.1"'
+
+    items = [membership_data(index).model_dump(mode="json") for index in (2, 3)]
+    bulk = await api.post("/api/memberships/bulk", json={"items": items}, headers=MSGPACK)
+    assert (bulk.status_code, msgpack.unpackb(bulk.content)["succeeded"]) == (200, 2)
+
+    started = await api.post(
+        "/api/memberships/import",
+        content=json.dumps(membership_data(4).model_dump(mode="json")).encode() + b"\n",
+        headers={**MSGPACK, "Content-Type": "application/x-ndjson"}
+    )
+    assert (started.status_code, started.headers["content-type"]) == (202, "application/msgpack")
+    job_id = msgpack.unpackb(started.content)["job_id"]
+    for _ in range(100):
+        status = msgpack.unpackb((await api.get(f"/api/memberships/import/{job_id}", headers=MSGPACK)).content)
+        if status["status"] != "running":
+            break
+        await asyncio.sleep(0.01)
+    assert (status["job_id"], status["status"], status["imported"]) == (job_id, "completed", 1)
+
+    # JSON by default, with the strong tag
+    created = await api.post("/api/memberships/", json=membership_data(5).model_dump(mode="json"))
+    assert created.headers["content-type"] == "application/json"
+    assert created.headers["etag"] == f'"{created.json()["id"]}.1"'
+
+
+class Recorder:
+    """ASGI send() collecting the messages the middleware passes on"""
+
+    def __init__(self):
+        self.messages = []
+
+    async def __call__(self, message):
+        self.messages.append(message)
+
+    @property
+    def start(self):
+        return self.messages[0]
+
+    @property
+    def headers(self):
+        return {name.decode(): value.decode() for name, value in self.start["headers"]}
+
+    @property
+    def bodies(self):
+        return [message["body"] for message in self.messages[1:]]
+
+
+async def _call(middleware, accept_encoding="br, gzip"):
+    send = Recorder()
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    await middleware(scope, None, send)
+    return send
+
+
+def _app(status=200, chunks=(b"",), headers=()):
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/x-ndjson"), *headers],
+        })
+        for index, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": index < len(chunks) - 1})
+    return app
+
+
+def _decompressor(coding):
+    if coding == "gzip":
+        decompressor = zlib.decompressobj(31)
+        return decompressor.decompress
+    return brotli.Decompressor().process
+
+
+@pytest.mark.parametrize("coding", ["gzip", "br"])
+async def test_streamed_chunks_are_flushed_as_they_come(encoders, coding):
+    chunks = [b'{"row": %d}\n' % index for index in range(3)] + [b""]
+    send = await _call(CompressionMiddleware(_app(chunks=chunks), encoders), accept_encoding=coding)
+
+    assert send.headers["content-encoding"] == coding
+    assert "content-length" not in send.headers
+    decompress = _decompressor(coding)
+    # Each chunk decompresses on its own, right when it is sent
+    assert [decompress(body) for body in send.bodies] == chunks
+
+
+@pytest.mark.parametrize("status", [204, 304])
+async def test_bodyless_responses_pass_through(encoders, status):
+    app = _app(status=status, headers=[(b"etag", b'"abc"')])
+    send = await _call(CompressionMiddleware(app, encoders))
+
+    assert "content-encoding" not in send.headers
+    assert send.headers["etag"] == '"abc"'
+    assert send.bodies == [b""]
+
+
+async def test_compressed_bodies_get_a_weak_etag(encoders):
+    body = b'{"name": "Plan"}' * 100
+    app = _app(chunks=[body], headers=[(b"etag", b'"abc"'), (b"content-length", str(len(body)).encode())])
+    send = await _call(CompressionMiddleware(app, encoders), accept_encoding="gzip")
+
+    assert send.headers["etag"] == 'W/"abc"'
+    assert int(send.headers["content-length"]) == len(send.bodies[0])
+    assert zlib.decompress(send.bodies[0], 31) == body
+
+
+async def test_small_bodies_are_sent_as_they_are(encoders):
+    app = _app(chunks=[b"{}"], headers=[(b"etag", b'"abc"')])
+    send = await _call(CompressionMiddleware(app, encoders, minimum_size=1024))
+
+    assert "content-encoding" not in send.headers
+    assert send.headers["etag"] == '"abc"'
+    assert send.bodies == [b"{}"]
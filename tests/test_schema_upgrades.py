@@ -0,0 +1,166 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from dev_utils.dev_database import init_db
+from features.membership.application.dtos.membership_dtos import MembershipUpdateDTO
+from features.membership.infrastructure.entities.membership_model import MembershipModel
+from features.membership.infrastructure.entities import membership_schema_upgrades
+from features.membership.infrastructure.entities.membership_schema_upgrades import KEYSET_INDEX, SEARCH_INDEXES
+from tests.conftest import GYM_ID, membership_data
+
+# What create_all produced before this series (SQLite dialect)
+BASELINE_SCHEMA = [
+    """CREATE TABLE gyms (
+        id UUID NOT NULL,
+        name VARCHAR(200) NOT NULL,
+        address VARCHAR(500),
+        is_active BOOLEAN NOT NULL,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        PRIMARY KEY (id)
+    )""",
+    "CREATE INDEX ix_gyms_id ON gyms (id)",
+    """CREATE TABLE memberships (
+        id UUID NOT NULL,
+        name VARCHAR(100) NOT NULL,
+        description VARCHAR(500),
+        price FLOAT NOT NULL,
+        duration_days INTEGER NOT NULL,
+        type VARCHAR(9) NOT NULL,
+        status VARCHAR(8) NOT NULL,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        gym_id UUID NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY(gym_id) REFERENCES gyms (id)
+    )""",
+    "CREATE INDEX ix_memberships_name ON memberships (name)",
+    "CREATE INDEX ix_memberships_id ON memberships (id)",
+    "CREATE INDEX ix_memberships_gym_id ON memberships (gym_id)",
+]
+
+BASELINE_ROWS = [
+    ("Membresía Básica", "Acceso a máquinas", 19.99, 30, "REGULAR", "ACTIVE"),
+    ("Pase Diario", None, 5.0, 1, "DAILY", "ACTIVE"),
+]
+
+
+def _baseline_membership(name, description, price, duration_days, membership_type, status) -> dict:
+    return dict(
+        id=uuid.uuid4().hex, name=name, description=description, price=price, duration_days=duration_days,
+        type=membership_type, status=status, gym_id=GYM_ID.hex
+    )
+
+
+async def _create_baseline(engine, rows) -> None:
+    async with engine.begin() as connection:
+        for statement in BASELINE_SCHEMA:
+            await connection.execute(text(statement))
+        await connection.execute(
+            text("INSERT INTO gyms VALUES (:id, 'Gym', NULL, 1, '2024-01-01 00:00:00', '2024-01-01 00:00:00')"),
+            {"id": GYM_ID.hex}
+        )
+        await connection.execute(text(
+            "INSERT INTO memberships VALUES (:id, :name, :description, :price, :duration_days, :type, :status, "
+            "'2024-01-01 00:00:00', '2024-01-01 00:00:00', :gym_id)"
+        ), [_baseline_membership(*row) for row in rows])
+
+
+@pytest.fixture
+async def baseline_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'baseline.db'}", poolclass=NullPool)
+    yield engine
+    await engine.dispose()
+
+
+async def _membership_columns(engine) -> set:
+    async with engine.connect() as connection:
+        columns = await connection.run_sync(lambda sync: inspect(sync).get_columns("memberships"))
+    return {column["name"] for column in columns}
+
+
+async def _membership_indexes(engine) -> set:
+    async with engine.connect() as connection:
+        indexes = await connection.run_sync(lambda sync: inspect(sync).get_indexes("memberships"))
+    return {index["name"] for index in indexes}
+
+
+async def test_init_db_upgrades_a_baseline_database(baseline_engine, service, make_context):
+    await _create_baseline(baseline_engine, BASELINE_ROWS)
+
+    await init_db(baseline_engine)
+
+    assert {"price_cents", "version", "name_folded", "description_folded"} <= await _membership_columns(baseline_engine)
+    assert "price" not in await _membership_columns(baseline_engine)
+    indexes = await _membership_indexes(baseline_engine)
+    assert {MembershipModel.NAME_UNIQUE_INDEX, MembershipModel.DAILY_UNIQUE_INDEX, KEYSET_INDEX} <= indexes
+    # The search indexes need PostgreSQL
+    assert not indexes & set(SEARCH_INDEXES)
+
+    session_factory = async_sessionmaker(baseline_engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        page = await service.list_memberships(make_context(session), page=1, size=10, search="basica")
+        assert [(item.name, item.price, item.version) for item in page.items] == [("Membresía Básica", 19.99, 1)]
+
+        existing = page.items[0]
+        updated = await service.update_membership(
+            make_context(session), existing.id, MembershipUpdateDTO(price=21), expected_version=existing.version
+        )
+        assert (updated.price, updated.version) == (21, 2)
+
+        created = await service.create_membership(make_context(session), membership_data(1))
+        assert created.version == 1
+
+
+async def test_upgrades_are_idempotent(baseline_engine):
+    await _create_baseline(baseline_engine, BASELINE_ROWS)
+
+    await init_db(baseline_engine)
+    await init_db(baseline_engine)
+
+    async with baseline_engine.connect() as connection:
+        folded = (await connection.execute(
+            text("SELECT name_folded, description_folded FROM memberships ORDER BY name")
+        )).all()
+    assert [tuple(row) for row in folded] == [("membresia basica", "acceso a maquinas"), ("pase diario", "")]
+
+
+async def test_rows_breaking_the_unique_rules_are_reported(baseline_engine):
+    await _create_baseline(baseline_engine, BASELINE_ROWS + [
+        ("Membresía Básica", "Duplicada", 25.0, 30, "REGULAR", "INACTIVE"),
+        ("Otro Pase Diario", None, 6.0, 1, "DAILY", "ACTIVE"),
+    ])
+
+    with pytest.raises(RuntimeError) as raised:
+        await init_db(baseline_engine)
+
+    message = str(raised.value)
+    assert f"gym {GYM_ID.hex}: 2 memberships named 'Membresía Básica'" in message
+    assert f"gym {GYM_ID.hex}: 2 active daily passes" in message
+    # Nothing of the upgrade was kept
+    assert "price" in await _membership_columns(baseline_engine)
+
+
+def test_postgresql_also_gets_the_search_indexes(monkeypatch):
+    dialect = postgresql.dialect()
+    statements = []
+    connection = SimpleNamespace(
+        dialect=dialect, execute=lambda ddl: statements.append(str(ddl.compile(dialect=dialect)))
+    )
+    monkeypatch.setattr(membership_schema_upgrades, "_membership_indexes", lambda connection: {KEYSET_INDEX})
+
+    membership_schema_upgrades.add_query_indexes(connection)
+
+    assert statements == [
+        "CREATE INDEX IF NOT EXISTS ix_memberships_name_trgm ON memberships USING gin (name_folded gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_memberships_description_trgm ON memberships "
+        "USING gin (description_folded gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_memberships_search_fts ON memberships "
+        "USING gin (to_tsvector('simple', name_folded || ' ' || description_folded))",
+    ]
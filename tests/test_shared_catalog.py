@@ -0,0 +1,91 @@
+import uuid
+
+import pytest
+
+from features.membership.application.dtos.membership_dtos import MembershipUpdateDTO
+from features.membership.application.membership_context import TenantContext
+from features.membership.domain.enums.membership_enums import MembershipType
+from features.membership.infrastructure.shared_catalog.shared_catalog_refresher import SharedCatalogRefresher
+from features.membership.infrastructure.shared_catalog.shared_catalog_store import SharedCatalogStore
+from features.membership.presentation.membership_container import MembershipContextFactory
+from tests.conftest import GYM_ID, OTHER_GYM_ID
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SharedCatalogStore(str(tmp_path / "catalog"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def refresher(store, session_factory) -> SharedCatalogRefresher:
+    return SharedCatalogRefresher(store, session_factory)
+
+
+@pytest.fixture
+def shared_context(store):
+    """Stack whose writes mark their gyms dirty in the shared catalog"""
+    factory = MembershipContextFactory(store, None, None)
+
+    def make(session, gym_id: uuid.UUID = GYM_ID):
+        return factory.create(session, TenantContext(user_id="11111111-1111-1111-1111-111111111111", gym_id=gym_id))
+
+    return make
+
+
+@pytest.fixture
+async def catalog(seed, refresher):
+    await seed(3)
+    await seed(1, gym_id=OTHER_GYM_ID, duration_days=1, type=MembershipType.DAILY)
+    assert await refresher.refresh() == 4
+
+
+async def test_rebuild_reloads_only_the_gyms_written(
+        catalog, store, refresher, session_factory, service, shared_context, statement_log):
+    async with session_factory() as session:
+        page = await service.list_memberships(shared_context(session), page=1, size=10)
+        target = page.items[0]
+        await service.update_membership(
+            shared_context(session), target.id, MembershipUpdateDTO(price=99.5), expected_version=target.version
+        )
+
+    plan = store.refresh_plan()
+    assert plan.base is not None and plan.changed_gym_ids == {GYM_ID}
+
+    statement_log.clear()
+    assert await refresher.refresh() == 3
+    assert len(statement_log) == 1 and " IN " in statement_log.statements[0].upper()
+
+    segment = store.fresh_segment()
+    assert segment.record_count == 4
+    assert segment.membership(target.id)["price"] == 99.5
+    # Copied from the previous segment as they were
+    assert segment.daily_membership(OTHER_GYM_ID) is not None
+    assert store.refresh_plan().changed_gym_ids == frozenset()
+
+
+async def test_deleted_memberships_leave_the_segment(catalog, store, refresher, session_factory, service, shared_context):
+    async with session_factory() as session:
+        page = await service.list_memberships(shared_context(session, OTHER_GYM_ID), page=1, size=10)
+        for membership in page.items:
+            assert await service.delete_membership(shared_context(session, OTHER_GYM_ID), membership.id)
+
+    assert await refresher.refresh() == 0
+    segment = store.fresh_segment()
+    assert (segment.record_count, segment.daily_count) == (3, 0)
+
+
+async def test_too_many_dirty_gyms_rebuild_everything(tmp_path, session_factory, seed):
+    await seed(3)
+    store = SharedCatalogStore(str(tmp_path / "catalog"), max_dirty_gyms=1)
+    try:
+        refresher = SharedCatalogRefresher(store, session_factory)
+        await refresher.refresh()
+        store.mark_dirty([GYM_ID, OTHER_GYM_ID])
+
+        assert store.refresh_plan().base is None
+        assert await refresher.refresh() == 3
+        assert store.refresh_plan().changed_gym_ids == frozenset()
+    finally:
+        store.close()
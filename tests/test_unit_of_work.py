@@ -0,0 +1,107 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from dev_utils.dev_gym_model import GymModel
+from features.membership.application.errors.membership_errors import MembershipAlreadyExistsError
+from features.membership.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from tests.conftest import membership_data
+
+
+async def _gym_names(session_factory) -> set:
+    async with session_factory() as session:
+        return set((await session.execute(select(GymModel.name))).scalars())
+
+
+def _recorder(calls: list, name: str):
+    async def callback():
+        calls.append(name)
+    return callback
+
+
+async def test_commit_persists_then_runs_the_callbacks(session_factory):
+    calls = []
+    async with session_factory() as session:
+        async with SqlAlchemyUnitOfWork(session) as unit_of_work:
+            session.add(GymModel(id=uuid.uuid4(), name="New gym"))
+            unit_of_work.after_commit(_recorder(calls, "first"))
+            unit_of_work.after_commit(_recorder(calls, "second"))
+            await session.flush()
+            assert calls == []
+
+            await unit_of_work.commit()
+            assert calls == ["first", "second"]
+
+            # Callbacks belong to the committed transaction only
+            await unit_of_work.commit()
+            assert calls == ["first", "second"]
+
+    assert "New gym" in await _gym_names(session_factory)
+
+
+async def test_an_escaping_error_rolls_back_and_drops_the_callbacks(session_factory):
+    calls = []
+    async with session_factory() as session:
+        unit_of_work = SqlAlchemyUnitOfWork(session)
+        with pytest.raises(RuntimeError):
+            async with unit_of_work:
+                session.add(GymModel(id=uuid.uuid4(), name="Lost gym"))
+                unit_of_work.after_commit(_recorder(calls, "lost"))
+                await session.flush()
+                raise RuntimeError("use case failed")
+
+        # The session is usable again, and the next commit does not run stale callbacks
+        async with unit_of_work:
+            session.add(GymModel(id=uuid.uuid4(), name="Next gym"))
+            await unit_of_work.commit()
+
+    assert calls == []
+    names = await _gym_names(session_factory)
+    assert "Lost gym" not in names and "Next gym" in names
+
+
+async def test_rollback_discards_pending_callbacks(session_factory):
+    calls = []
+    async with session_factory() as session:
+        unit_of_work = SqlAlchemyUnitOfWork(session)
+        session.add(GymModel(id=uuid.uuid4(), name="Rolled back gym"))
+        unit_of_work.after_commit(_recorder(calls, "dropped"))
+        await unit_of_work.rollback()
+        await unit_of_work.commit()
+
+    assert calls == []
+    assert "Rolled back gym" not in await _gym_names(session_factory)
+
+
+async def test_a_failed_savepoint_only_undoes_its_own_writes(session_factory):
+    async with session_factory() as session:
+        async with SqlAlchemyUnitOfWork(session) as unit_of_work:
+            session.add(GymModel(id=uuid.uuid4(), name="Kept gym"))
+            with pytest.raises(RuntimeError):
+                async with unit_of_work.savepoint():
+                    session.add(GymModel(id=uuid.uuid4(), name="Savepoint gym"))
+                    await session.flush()
+                    raise RuntimeError("item failed")
+            await unit_of_work.commit()
+
+    names = await _gym_names(session_factory)
+    assert "Kept gym" in names and "Savepoint gym" not in names
+
+
+async def test_service_writes_are_one_transaction_per_call(session_factory, service, make_context):
+    async with session_factory() as session:
+        context = make_context(session)
+        await service.create_membership(context, membership_data(1))
+
+        # The repository only flushes; the duplicate is rolled back by the unit of work
+        with pytest.raises(MembershipAlreadyExistsError):
+            await service.create_membership(context, membership_data(1, description="Duplicate"))
+
+        await service.create_membership(context, membership_data(2))
+
+    async with session_factory() as session:
+        page = await service.list_memberships(make_context(session), size=10)
+    assert {(item.name, item.description) for item in page.items} == {
+        ("Plan 001", "Monthly plan number 1"), ("Plan 002", "Monthly plan number 2")
+    }